@@ -0,0 +1,36 @@
+"""Add composite trade indexes for paginated filters and period P&L
+
+Revision ID: 20261015_0002
+Revises: 20250112_0001
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261015_0002'
+down_revision: Union[str, None] = '20250112_0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Add indexes matching TradeRepository access patterns:
+    - (status, entry_date) / (strategy_name, entry_date): get_all filter + sort
+      (ticker + entry_date is already covered by ix_trades_ticker_date)
+    - (exit_date, status): get_pnl_by_period
+    """
+    op.create_index('ix_trades_status_entry_date', 'trades', ['status', 'entry_date'])
+    op.create_index('ix_trades_strategy_entry_date', 'trades', ['strategy_name', 'entry_date'])
+    op.create_index('ix_trades_exit_date_status', 'trades', ['exit_date', 'status'])
+
+
+def downgrade() -> None:
+    """Drop the composite trade indexes."""
+    op.drop_index('ix_trades_exit_date_status', table_name='trades')
+    op.drop_index('ix_trades_strategy_entry_date', table_name='trades')
+    op.drop_index('ix_trades_status_entry_date', table_name='trades')
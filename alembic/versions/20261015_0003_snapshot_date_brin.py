@@ -0,0 +1,41 @@
+"""Add BRIN index on portfolio_snapshots.snapshot_date
+
+Revision ID: 20261015_0003
+Revises: 20261015_0002
+Create Date: 2026-10-15
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261015_0003'
+down_revision: Union[str, None] = '20261015_0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """
+    Snapshots are appended in snapshot_date order, so a BRIN index covers
+    period range scans at a fraction of the B-tree's size.
+    PostgreSQL only - SQLite keeps using ix_snapshot_date.
+    """
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.create_index(
+            'ix_snapshot_date_brin',
+            'portfolio_snapshots',
+            ['snapshot_date'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+        )
+
+
+def downgrade() -> None:
+    """Drop the BRIN snapshot index."""
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.drop_index('ix_snapshot_date_brin', table_name='portfolio_snapshots')
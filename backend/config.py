@@ -65,10 +65,16 @@ class Settings(BaseSettings):
     # yFinance Settings (ASX, VIX, BTC)
     YFINANCE_CACHE_HOURS: int = 24
     
+    # Universe lists served by /api/data (refreshed at most this often)
+    UNIVERSE_CACHE_TTL_SECONDS: int = 21600  # 6 hours
+    
     # Pagination
     DEFAULT_PAGE_SIZE: int = 50
     MAX_PAGE_SIZE: int = 200
     
+    # Trade inserts commit without waiting for the WAL flush (see TradeRepository)
+    ASYNC_COMMIT_ENABLED: bool = True
+    
     # Rate Limiting
     RATE_LIMIT_DEFAULT: str = "60/minute"
     RATE_LIMIT_SCAN: str = "10/minute"
@@ -87,13 +87,23 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Session.info key marking a session whose transaction is owned by the request
+REQUEST_TRANSACTION_KEY = "request_transaction"
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Async dependency injection for database sessions.
 
+    One session and one transaction span the whole request: repositories
+    flush instead of committing (see REQUEST_TRANSACTION_KEY), and the
+    transaction commits once when the request finishes, or rolls back if
+    it raised. Declare it with scope="function" so the commit happens
+    before the response is sent.
+
     Usage in FastAPI:
         @router.get("/trades")
-        async def get_trades(db: AsyncSession = Depends(get_async_db)):
+        async def get_trades(db: AsyncSession = Depends(get_async_db, scope="function")):
             result = await db.execute(select(Trade))
             return result.scalars().all()
 
@@ -101,14 +111,9 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
         Async database session that auto-closes after use.
     """
     async with AsyncSessionLocal() as session:
-        try:
+        session.info[REQUEST_TRANSACTION_KEY] = True
+        async with session.begin():
             yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
 
 async def init_async_db() -> None:
@@ -92,10 +92,15 @@ class Trade(Base):
     event_timestamp = Column(DateTime, nullable=True)  # Same as entry_date for trades
     
     # Composite indexes for common queries
+    # (filter column, entry_date) pairs serve get_all's WHERE + ORDER BY entry_date
     __table_args__ = (
         Index('ix_trades_ticker_date', 'ticker', 'entry_date'),
+        Index('ix_trades_status_entry_date', 'status', 'entry_date'),
+        Index('ix_trades_strategy_entry_date', 'strategy_name', 'entry_date'),
         Index('ix_trades_strategy_status', 'strategy_name', 'status'),
         Index('ix_trades_date_range', 'entry_date', 'exit_date'),
+        # Closed-trade P&L by exit period (get_pnl_by_period)
+        Index('ix_trades_exit_date_status', 'exit_date', 'status'),
         # Index for Point-in-Time queries
         Index('ix_trades_bitemporal', 'knowledge_timestamp', 'event_timestamp'),
     )
@@ -153,6 +158,12 @@ class PortfolioSnapshot(Base):
     
     __table_args__ = (
         Index('ix_snapshot_date', 'snapshot_date'),
+        # Block-range index for period scans over append-only snapshots (PostgreSQL only)
+        Index(
+            'ix_snapshot_date_brin', 'snapshot_date',
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32}
+        ).ddl_if(dialect='postgresql'),
         # Index for Point-in-Time queries
         Index('ix_snapshot_bitemporal', 'knowledge_timestamp', 'event_timestamp'),
     )
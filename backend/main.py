@@ -101,6 +101,9 @@ async def lifespan(app: FastAPI):
     yield
     
     # Shutdown
+    scanner_module.SCAN_POOL.shutdown(wait=False, cancel_futures=True)
+    strategies_module.shutdown_pipeline_pool()
+    validation_module.shutdown_validation_pool()
     print("\nbye Shutting down API...")
 
 
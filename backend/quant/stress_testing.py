@@ -310,10 +310,13 @@ def _calc_sharpe(returns: pd.Series, rf: float = 0.0) -> float:
 
 def _calc_max_drawdown(returns: pd.Series) -> float:
     """Calculate maximum drawdown."""
-    cumulative = (1 + returns).cumprod()
-    rolling_max = cumulative.cummax()
-    drawdown = (cumulative - rolling_max) / rolling_max
-    return float(drawdown.min())
+    if len(returns) == 0:
+        return 0.0
+    # Drawdown in log space on the raw array: log1p sums compound without
+    # cumprod's accumulated rounding, and only the worst point is converted back
+    with np.errstate(divide="ignore"):
+        log_cumulative = np.cumsum(np.log1p(np.asarray(returns, dtype=np.float64)))
+    return float(np.expm1((log_cumulative - np.maximum.accumulate(log_cumulative)).min()))
 
 
 def print_stress_test_results(results: Dict[str, dict]):
@@ -7,14 +7,28 @@ Refactored to support full async operations (2025 standard).
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func, and_, delete as sa_delete
-from typing import List, Optional, Tuple
+from sqlalchemy import select, insert, update, case, text, desc, func, and_, delete as sa_delete
+from sqlalchemy.engine import Row
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.orm import load_only
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..database.models import Trade, TradeStatus, TradeDirection
-from ..database.schemas import TradeCreate, TradeUpdate
+from ..database.schemas import TradeCreate, TradeUpdate, TradeResponse
+from ..database.connection import REQUEST_TRANSACTION_KEY
 from ..config import settings
 
+# Upper bound on rows per multi-VALUES INSERT for dialects without RETURNING
+MAX_ROWS_PER_INSERT = 1000
+
+# Dialects where get_all fetches the total via COUNT(*) OVER () on the page query
+WINDOW_COUNT_DIALECTS = ('postgresql', 'mysql')
+
+# Columns serialized by TradeResponse; list reads skip everything else
+RESPONSE_FIELDS = tuple(TradeResponse.model_fields)
+RESPONSE_COLUMNS = load_only(*(getattr(Trade, name) for name in RESPONSE_FIELDS))
+
 
 class TradeRepository:
     """
@@ -30,6 +44,42 @@ class TradeRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
+    async def _commit(self) -> None:
+        """
+        Commit, unless the request owns the transaction.
+        
+        Request-scoped sessions (get_async_db) commit once at the end of the
+        request, so here we only flush to get generated keys and defaults.
+        """
+        if self.db.info.get(REQUEST_TRANSACTION_KEY):
+            await self.db.flush()
+        else:
+            await self.db.commit()
+    
+    async def _relax_commit_durability(self) -> None:
+        """
+        Let the current transaction commit without waiting for a durable flush.
+        
+        Used only for trade inserts, which can be re-derived from the source
+        signals. PostgreSQL (synchronous_commit = OFF): a crash may lose the
+        last few hundred milliseconds of acknowledged commits, but cannot
+        corrupt data or leave a partial transaction. SQLite
+        (synchronous = NORMAL): the pragma is per connection, so it is only
+        applied before the connection has opened a write transaction.
+        Updates and closes keep the default, fully synchronous commit.
+        """
+        if not settings.ASYNC_COMMIT_ENABLED:
+            return
+        
+        dialect_name = self.db.get_bind().dialect.name
+        if dialect_name == 'postgresql':
+            await self.db.execute(text("SET LOCAL synchronous_commit = OFF"))
+        elif dialect_name == 'sqlite':
+            conn = await self.db.connection()
+            raw = await conn.get_raw_connection()
+            if not raw.driver_connection.in_transaction:
+                await conn.exec_driver_sql("PRAGMA synchronous = NORMAL")
+    
     # ============== CREATE ==============
     
     async def create(self, trade_data: TradeCreate) -> Trade:
@@ -42,6 +92,8 @@ class TradeRepository:
         Returns:
             Created Trade object
         """
+        await self._relax_commit_durability()
+        
         trade = Trade(
             trade_id=trade_data.trade_id,
             ticker=trade_data.ticker,
@@ -60,41 +112,49 @@ class TradeRepository:
         )
         
         self.db.add(trade)
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(trade)
         
         return trade
     
     async def bulk_create(self, trades_data: List[TradeCreate]) -> List[Trade]:
-        """Bulk create trades for efficiency."""
-        trades = [
-            Trade(
-                trade_id=td.trade_id,
-                ticker=td.ticker,
-                asset_name=td.asset_name,
-                asset_class=td.asset_class,
-                direction=td.direction,
-                quantity=td.quantity,
-                entry_price=td.entry_price,
-                entry_date=td.entry_date,
-                commission=td.commission,
-                currency=td.currency,
-                strategy_name=td.strategy_name,
-                signal_score=td.signal_score,
-                notes=td.notes,
-                status=TradeStatus.OPEN
-            )
+        """
+        Bulk create trades for efficiency.
+
+        Uses a single INSERT ... RETURNING so the batch costs one round-trip
+        instead of one refresh per row. Dialects without executemany
+        RETURNING insert in chunks of MAX_ROWS_PER_INSERT and re-read the
+        rows by trade_id.
+        """
+        if not trades_data:
+            return []
+
+        payload = [
+            td.model_dump() | {'status': TradeStatus.OPEN}
             for td in trades_data
         ]
-        
-        self.db.add_all(trades)
-        await self.db.commit()
-        
-        # Refresh all in parallel isn't directly supported easily in async
-        # so we refresh them sequentially or rely on the returned list
-        for trade in trades:
-            await self.db.refresh(trade)
-        
+
+        await self._relax_commit_durability()
+
+        if self.db.get_bind().dialect.insert_executemany_returning:
+            result = await self.db.scalars(
+                insert(Trade).returning(Trade, sort_by_parameter_order=True), payload
+            )
+            trades = list(result.all())
+            await self._commit()
+            return trades
+
+        trades = []
+        for start in range(0, len(payload), MAX_ROWS_PER_INSERT):
+            chunk = payload[start:start + MAX_ROWS_PER_INSERT]
+            await self.db.execute(insert(Trade), chunk)
+            result = await self.db.execute(
+                select(Trade).filter(Trade.trade_id.in_([row['trade_id'] for row in chunk]))
+            )
+            by_trade_id = {t.trade_id: t for t in result.scalars().all()}
+            trades.extend(by_trade_id[row['trade_id']] for row in chunk)
+        await self._commit()
+
         return trades
     
     # ============== READ ==============
@@ -104,6 +164,13 @@ class TradeRepository:
         result = await self.db.execute(select(Trade).filter(Trade.id == trade_id))
         return result.scalars().first()
     
+    async def get_by_ids(self, ids: List[int]) -> Dict[int, Trade]:
+        """Get several trades by internal ID in one query, keyed by ID."""
+        if not ids:
+            return {}
+        result = await self.db.execute(select(Trade).filter(Trade.id.in_(ids)))
+        return {t.id: t for t in result.scalars().all()}
+    
     async def get_by_trade_id(self, trade_id: str) -> Optional[Trade]:
         """Get trade by external trade_id."""
         result = await self.db.execute(select(Trade).filter(Trade.trade_id == trade_id))
@@ -124,30 +191,75 @@ class TradeRepository:
         """
         Get paginated trades with filtering.
         """
+        rows, total = await self._get_page(
+            select(Trade).options(RESPONSE_COLUMNS),
+            page, page_size, ticker, status, strategy, start_date, end_date, sort_by, sort_desc
+        )
+        return [row[0] for row in rows], total
+    
+    async def get_all_rows(
+        self,
+        page: int = 1,
+        page_size: int = None,
+        ticker: Optional[str] = None,
+        status: Optional[TradeStatus] = None,
+        strategy: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        sort_by: str = "entry_date",
+        sort_desc: bool = True
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Same page as get_all, as plain dicts of the TradeResponse columns.
+        
+        Selects columns rather than entities, so no ORM objects are built.
+        """
+        rows, total = await self._get_page(
+            select(*(getattr(Trade, name) for name in RESPONSE_FIELDS)),
+            page, page_size, ticker, status, strategy, start_date, end_date, sort_by, sort_desc
+        )
+        # zip stops at the response fields, dropping any trailing window count
+        return [dict(zip(RESPONSE_FIELDS, row)) for row in rows], total
+    
+    async def _get_page(
+        self,
+        base: Select,
+        page: int,
+        page_size: Optional[int],
+        ticker: Optional[str],
+        status: Optional[TradeStatus],
+        strategy: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        sort_by: str,
+        sort_desc: bool
+    ) -> Tuple[List[Row], int]:
+        """Filter, sort and paginate a trade select; returns (rows, total)."""
         page_size = page_size or settings.DEFAULT_PAGE_SIZE
         page_size = min(page_size, settings.MAX_PAGE_SIZE)
         
-        # Build query with filters
-        query = select(Trade)
+        # Build filters once; the listing and the count share them
+        predicates: List[ColumnElement[bool]] = []
         
         if ticker:
-            query = query.filter(Trade.ticker == ticker.upper())
+            predicates.append(Trade.ticker == ticker.upper())
         
         if status:
-            query = query.filter(Trade.status == status)
+            predicates.append(Trade.status == status)
         
         if strategy:
-            query = query.filter(Trade.strategy_name == strategy)
+            predicates.append(Trade.strategy_name == strategy)
         
         if start_date:
-            query = query.filter(Trade.entry_date >= start_date)
+            predicates.append(Trade.entry_date >= start_date)
         
         if end_date:
-            query = query.filter(Trade.entry_date <= end_date)
-            
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
+            predicates.append(Trade.entry_date <= end_date)
+        
+        query = base.where(*predicates)
+        
+        # Count straight off the table (no subquery) so an index can cover it
+        count_query = select(func.count(Trade.id)).where(*predicates)
         
         # Apply sorting
         sort_column = getattr(Trade, sort_by, Trade.entry_date)
@@ -160,14 +272,31 @@ class TradeRepository:
         offset = (page - 1) * page_size
         query = query.offset(offset).limit(page_size)
         
+        if self.db.get_bind().dialect.name in WINDOW_COUNT_DIALECTS:
+            # Single round-trip: total count rides along on every row
+            windowed = query.add_columns(func.count().over().label('_total'))
+            rows = (await self.db.execute(windowed)).all()
+            if rows:
+                return list(rows), rows[0]._total
+            if offset == 0:
+                return [], 0
+            # Page past the end: no rows to carry the count
+            total = await self.db.scalar(count_query)
+            return [], total or 0
+        
+        total = await self.db.scalar(count_query)
         result = await self.db.execute(query)
-        trades = result.scalars().all()
         
-        return list(trades), total or 0
+        return list(result.all()), total or 0
     
     async def get_recent(self, limit: int = 10) -> List[Trade]:
         """Get most recent trades."""
-        query = select(Trade).order_by(desc(Trade.entry_date)).limit(limit)
+        query = (
+            select(Trade)
+            .options(RESPONSE_COLUMNS)
+            .order_by(desc(Trade.entry_date))
+            .limit(limit)
+        )
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
@@ -177,9 +306,44 @@ class TradeRepository:
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def stream_open_positions(self) -> AsyncIterator[Trade]:
+        """
+        Stream open positions from a server-side cursor.
+        
+        Rows are yielded as the driver fetches them, so memory stays flat
+        for large books. Prefer get_open_positions for small result sets.
+        """
+        query = (
+            select(Trade)
+            .options(RESPONSE_COLUMNS)
+            .filter(Trade.status == TradeStatus.OPEN)
+            .order_by(desc(Trade.entry_date))
+        )
+        result = await self.db.stream_scalars(query)
+        async for trade in result:
+            yield trade
+    
+    async def get_open_position_rows(self) -> List[Row]:
+        """Get (ticker, quantity, entry_price) rows for open positions, without ORM hydration."""
+        query = select(Trade.ticker, Trade.quantity, Trade.entry_price).filter(
+            Trade.status == TradeStatus.OPEN
+        )
+        result = await self.db.execute(query)
+        return list(result.all())
+    
+    async def count_open_positions(self) -> int:
+        """Count open positions."""
+        query = select(func.count(Trade.id)).filter(Trade.status == TradeStatus.OPEN)
+        return await self.db.scalar(query) or 0
+    
     async def get_by_ticker(self, ticker: str) -> List[Trade]:
         """Get all trades for a specific ticker."""
-        query = select(Trade).filter(Trade.ticker == ticker.upper()).order_by(desc(Trade.entry_date))
+        query = (
+            select(Trade)
+            .options(RESPONSE_COLUMNS)
+            .filter(Trade.ticker == ticker.upper())
+            .order_by(desc(Trade.entry_date))
+        )
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
@@ -202,7 +366,7 @@ class TradeRepository:
         if trade_data.status == TradeStatus.CLOSED and trade_data.exit_price:
             trade.calculate_pnl()
         
-        await self.db.commit()
+        await self._commit()
         await self.db.refresh(trade)
         
         return trade
@@ -213,19 +377,47 @@ class TradeRepository:
         exit_price: float, 
         exit_date: datetime = None
     ) -> Optional[Trade]:
-        """Close a trade with exit price."""
-        trade = await self.get_by_id(trade_id)
+        """
+        Close a trade with exit price.
         
-        if not trade or trade.status != TradeStatus.OPEN:
-            return None
+        Issued as one UPDATE ... WHERE status = OPEN RETURNING, with P&L
+        computed in SQL (mirrors Trade.calculate_pnl). The status check and
+        the write are atomic, so concurrent closes cannot both succeed.
+        """
+        is_buy = Trade.direction == TradeDirection.BUY
+        price_move = case(
+            (is_buy, exit_price - Trade.entry_price),
+            else_=Trade.entry_price - exit_price
+        )
         
-        trade.exit_price = exit_price
-        trade.exit_date = exit_date or datetime.utcnow()
-        trade.status = TradeStatus.CLOSED
-        trade.calculate_pnl()
+        stmt = (
+            update(Trade)
+            .where(and_(Trade.id == trade_id, Trade.status == TradeStatus.OPEN))
+            .values(
+                exit_price=exit_price,
+                exit_date=exit_date or datetime.utcnow(),
+                status=TradeStatus.CLOSED,
+                pnl=price_move * Trade.quantity - Trade.commission,
+                pnl_percent=price_move / Trade.entry_price * 100
+            )
+            .execution_options(synchronize_session=False)
+        )
         
-        await self.db.commit()
-        await self.db.refresh(trade)
+        if not self.db.get_bind().dialect.update_returning:
+            result = await self.db.execute(stmt)
+            await self._commit()
+            if result.rowcount == 0:
+                return None
+            refreshed = await self.db.execute(
+                select(Trade).filter(Trade.id == trade_id).execution_options(populate_existing=True)
+            )
+            return refreshed.scalars().first()
+        
+        result = await self.db.execute(
+            stmt.returning(Trade).execution_options(populate_existing=True)
+        )
+        trade = result.scalar_one_or_none()
+        await self._commit()
         
         return trade
     
@@ -233,56 +425,54 @@ class TradeRepository:
     
     async def delete(self, trade_id: int) -> bool:
         """Delete a trade by ID."""
-        trade = await self.get_by_id(trade_id)
-        
-        if not trade:
-            return False
-        
-        await self.db.delete(trade)
-        await self.db.commit()
+        result = await self.db.execute(
+            sa_delete(Trade)
+            .where(Trade.id == trade_id)
+            .execution_options(synchronize_session=False)
+        )
+        await self._commit()
         
-        return True
+        return result.rowcount > 0
     
     # ============== AGGREGATIONS ==============
     
     async def get_statistics(self) -> dict:
-        """Get aggregate trade statistics."""
-        # Total trades
-        total_trades = await self.db.scalar(select(func.count(Trade.id)))
-        
-        # Closed trades with P&L
-        result = await self.db.execute(select(Trade).filter(Trade.status == TradeStatus.CLOSED))
-        closed_trades = result.scalars().all()
-        
-        if not closed_trades:
-            return {
-                'total_trades': total_trades or 0,
-                'closed_trades': 0,
-                'open_trades': total_trades or 0,
-                'winning_trades': 0,
-                'losing_trades': 0,
-                'win_rate': 0,
-                'total_pnl': 0,
-                'avg_pnl': 0,
-                'best_trade': 0,
-                'worst_trade': 0
-            }
+        """
+        Get aggregate trade statistics.
+        
+        Computed in a single aggregate query so closed trades are never
+        loaded into Python.
+        """
+        is_closed = Trade.status == TradeStatus.CLOSED
+        query = select(
+            func.count(Trade.id).label('total_trades'),
+            func.count(Trade.id).filter(is_closed).label('closed_trades'),
+            func.count(Trade.pnl).filter(is_closed).label('pnl_count'),
+            func.sum(case((Trade.pnl > 0, 1), else_=0)).filter(is_closed).label('winning_trades'),
+            func.sum(case((Trade.pnl <= 0, 1), else_=0)).filter(is_closed).label('losing_trades'),
+            func.sum(Trade.pnl).filter(is_closed).label('total_pnl'),
+            func.avg(Trade.pnl).filter(is_closed).label('avg_pnl'),
+            func.max(Trade.pnl).filter(is_closed).label('best_trade'),
+            func.min(Trade.pnl).filter(is_closed).label('worst_trade')
+        )
         
-        pnls = [t.pnl for t in closed_trades if t.pnl is not None]
-        winning = sum(1 for p in pnls if p > 0)
-        losing = sum(1 for p in pnls if p <= 0)
+        row = (await self.db.execute(query)).one()
+        total_trades = row.total_trades or 0
+        closed_trades = row.closed_trades or 0
+        pnl_count = row.pnl_count or 0
+        winning = row.winning_trades or 0
         
         return {
-            'total_trades': total_trades or 0,
-            'closed_trades': len(closed_trades),
-            'open_trades': (total_trades or 0) - len(closed_trades),
+            'total_trades': total_trades,
+            'closed_trades': closed_trades,
+            'open_trades': total_trades - closed_trades,
             'winning_trades': winning,
-            'losing_trades': losing,
-            'win_rate': (winning / len(pnls) * 100) if pnls else 0,
-            'total_pnl': sum(pnls) if pnls else 0,
-            'avg_pnl': sum(pnls) / len(pnls) if pnls else 0,
-            'best_trade': max(pnls) if pnls else 0,
-            'worst_trade': min(pnls) if pnls else 0
+            'losing_trades': row.losing_trades or 0,
+            'win_rate': (winning / pnl_count * 100) if pnl_count else 0,
+            'total_pnl': row.total_pnl or 0,
+            'avg_pnl': row.avg_pnl or 0,
+            'best_trade': row.best_trade or 0,
+            'worst_trade': row.worst_trade or 0
         }
     
     async def get_pnl_by_period(
@@ -23,13 +23,15 @@ router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 async def load_json_file_async(filepath: str) -> Optional[Dict]:
     """Safely load a JSON file asynchronously."""
     path = Path(filepath)
-    if path.exists():
-        try:
-            async with aiofiles.open(path, mode='r') as f:
-                content = await f.read()
-                return json.loads(content)
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading {filepath}: {e}")
+    # Just open it: a separate exists() check costs an extra stat per call
+    try:
+        async with aiofiles.open(path, mode='r') as f:
+            content = await f.read()
+            return json.loads(content)
+    except FileNotFoundError:
+        pass
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"Error loading {filepath}: {e}")
     return None
 
 
@@ -38,28 +40,28 @@ async def get_strategy_results_async() -> Dict[str, Any]:
     results = {}
     reports_dir = Path("reports")
     
-    if reports_dir.exists():
-        # reports_dir.glob is synchronous, but we can process files asynchronously
-        files = list(reports_dir.glob("*_results.json"))
-        
-        async def load_file(results_file):
-            try:
-                async with aiofiles.open(results_file, mode='r') as f:
-                    content = await f.read()
-                    data = json.loads(content)
-                    strategy_name = results_file.stem.replace("_results", "")
-                    return strategy_name, data
-            except:
-                return None, None
+    # A missing directory simply globs to nothing, so no exists() check.
+    # reports_dir.glob is synchronous, but we can process files asynchronously
+    files = list(reports_dir.glob("*_results.json"))
+    
+    async def load_file(results_file):
+        try:
+            async with aiofiles.open(results_file, mode='r') as f:
+                content = await f.read()
+                data = json.loads(content)
+                strategy_name = results_file.stem.replace("_results", "")
+                return strategy_name, data
+        except:
+            return None, None
 
-        # Load all files in parallel
-        tasks = [load_file(f) for f in files]
-        loaded_data = await asyncio.gather(*tasks)
-        
-        for name, data in loaded_data:
-            if name:
-                results[name] = data
+    # Load all files in parallel
+    tasks = [load_file(f) for f in files]
+    loaded_data = await asyncio.gather(*tasks)
     
+    for name, data in loaded_data:
+        if name:
+            results[name] = data
+
     # Also try pipeline_results.json
     pipeline_results = await load_json_file_async("reports/pipeline_results.json")
     if pipeline_results and "strategies" in pipeline_results:
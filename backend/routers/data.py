@@ -9,13 +9,15 @@ Data Source Routing:
 - yFinance: ASX Stocks, ASX ETFs, VIX, BTC-USD
 """
 
+import asyncio
 import os
 import sys
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 import logging
 
@@ -24,6 +26,9 @@ logger = logging.getLogger(__name__)
 # Add parent path for strategy imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from ..utils.http_cache import not_modified, weak_etag
+from ..utils.universe_cache import cached_universe, clear_universe_cache
+
 router = APIRouter(prefix="/api/data", tags=["data"])
 
 
@@ -55,67 +60,173 @@ class DataStatus(BaseModel):
     newest_cache: Optional[str]
 
 
+# Special indices and crypto served by yFinance
+_YFIN_SPECIAL = frozenset({'^VIX', '^GSPC', '^DJI', '^IXIC', 'BTC-USD', 'BTC-AUD', 'ETH-USD'})
+
+
 def get_data_source(ticker: str) -> str:
     """
     Determine which data source to use for a ticker.
     """
-    # ASX tickers
-    if ticker.endswith('.AX'):
-        return 'yfinance'
-    
-    # Special indices and crypto
-    if ticker in ['^VIX', '^GSPC', '^DJI', '^IXIC', 'BTC-USD', 'BTC-AUD', 'ETH-USD']:
+    # ASX tickers, special indices and crypto
+    if ticker.endswith('.AX') or ticker in _YFIN_SPECIAL:
         return 'yfinance'
     
     # Everything else → Tiingo (US stocks, ETFs, Gold)
     return 'tiingo'
 
 
-def _get_cache_stats_sync() -> Dict[str, Any]:
-    """Synchronous implementation of cache stats."""
-    cache_dir = Path(__file__).parent.parent.parent / "cache"
+def split_by_data_source(tickers: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Split tickers into (tiingo, yfinance) lists in a single pass.
+    """
+    tiingo_tickers = []
+    yfinance_tickers = []
+    for t in tickers:
+        if t.endswith('.AX') or t in _YFIN_SPECIAL:
+            yfinance_tickers.append(t)
+        else:
+            tiingo_tickers.append(t)
+    return tiingo_tickers, yfinance_tickers
+
+
+async def get_screener_split() -> Tuple[List[str], List[str]]:
+    """Screener universe split into (tiingo, yfinance) tickers, cached."""
+    from strategy.stock_universe import get_screener_universe
+    
+    universe = await cached_universe("screener_universe", get_screener_universe)
+    return await cached_universe(
+        "screener_split", lambda: split_by_data_source(universe)
+    )
+
+
+# Tickers listed per source in the /universe response
+UNIVERSE_PREVIEW_SIZE = 50
+
+
+async def get_screener_summary() -> Dict[str, Any]:
+    """
+    Per-source counts and ticker previews for /universe, built once per
+    cache fill so requests do no list slicing or traversal.
+    """
+    tiingo_tickers, yfinance_tickers = await get_screener_split()
+    
+    def build() -> Dict[str, Any]:
+        return {
+            "total_tickers": len(tiingo_tickers) + len(yfinance_tickers),
+            "by_source": {
+                "tiingo": {
+                    "count": len(tiingo_tickers),
+                    "tickers": tuple(tiingo_tickers[:UNIVERSE_PREVIEW_SIZE]),
+                    "coverage": "US Stocks, US ETFs, Mutual Funds, Gold"
+                },
+                "yfinance": {
+                    "count": len(yfinance_tickers),
+                    "tickers": tuple(yfinance_tickers[:UNIVERSE_PREVIEW_SIZE]),
+                    "coverage": "ASX Stocks, ASX ETFs, VIX, BTC"
+                }
+            },
+            "fingerprint": weak_etag(",".join(tiingo_tickers), ",".join(yfinance_tickers))
+        }
     
-    stats = {
-        "cache_dir": str(cache_dir),
+    return await cached_universe("screener_summary", build)
+
+
+CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
+
+# Panels FastDataLoader rewrites in place, which leaves the directory mtime alone
+IN_PLACE_CACHE_FILES = ("us_prices_close.parquet", "us_prices_open.parquet")
+
+
+def _empty_cache_stats(cache_dir: str) -> Dict[str, Any]:
+    """Cache stats for a directory with no parquet files."""
+    return {
+        "cache_dir": cache_dir,
         "total_files": 0,
         "total_size_mb": 0.0,
         "oldest_cache": None,
         "newest_cache": None,
-        "files": []
+        "files": [],
+        "us_count": 0,
+        "asx_count": 0
     }
+
+
+def _is_asx_cache_file(name: str) -> bool:
+    """Rough classification of a cache file as ASX (vs US) data by name."""
+    n = name.lower()
+    if "tiingo" in n or "us" in n:
+        return False
+    return "ax" in n or "asx" in n
+
+
+@lru_cache(maxsize=4)
+def _scan_cache_dir(cache_dir: str, version: Tuple[Any, ...]) -> Dict[str, Any]:
+    """
+    Scan the cache directory once and summarise its parquet files.
+    
+    Memoized on version: the directory mtime, which changes whenever a
+    cache file is added, removed or renamed, plus the (mtime_ns, size) of
+    each IN_PLACE_CACHE_FILES entry, which are overwritten without touching
+    the directory. DirEntry.stat() reuses the data returned by scandir, so
+    each file costs at most one stat call.
+    """
+    stats = _empty_cache_stats(cache_dir)
     
-    if not cache_dir.exists():
-        return stats
+    with os.scandir(cache_dir) as it:
+        entries = [
+            (e.name, e.stat()) for e in it
+            if e.name.endswith(".parquet") and e.is_file()
+        ]
     
-    cache_files = list(cache_dir.glob("*.parquet"))
-    stats["total_files"] = len(cache_files)
+    stats["total_files"] = len(entries)
+    stats["asx_count"] = sum(1 for name, _ in entries if _is_asx_cache_file(name))
+    stats["us_count"] = len(entries) - stats["asx_count"]
     
-    if cache_files:
-        total_bytes = sum(f.stat().st_size for f in cache_files)
+    if entries:
+        total_bytes = sum(st.st_size for _, st in entries)
         stats["total_size_mb"] = round(total_bytes / 1024 / 1024, 2)
         
-        mtimes = [f.stat().st_mtime for f in cache_files]
+        mtimes = [st.st_mtime for _, st in entries]
         stats["oldest_cache"] = datetime.fromtimestamp(min(mtimes)).isoformat()
         stats["newest_cache"] = datetime.fromtimestamp(max(mtimes)).isoformat()
         
         # Get file details
-        for f in cache_files[:10]:  # Limit to first 10
+        for name, st in entries[:10]:  # Limit to first 10
             stats["files"].append({
-                "name": f.name,
-                "size_mb": round(f.stat().st_size / 1024 / 1024, 2),
-                "modified": datetime.fromtimestamp(f.stat().st_mtime).isoformat()
+                "name": name,
+                "size_mb": round(st.st_size / 1024 / 1024, 2),
+                "modified": datetime.fromtimestamp(st.st_mtime).isoformat()
             })
     
     return stats
 
 
+def _get_cache_stats_sync() -> Dict[str, Any]:
+    """Synchronous implementation of cache stats."""
+    try:
+        dir_mtime_ns = os.stat(CACHE_DIR).st_mtime_ns
+    except FileNotFoundError:
+        return _empty_cache_stats(str(CACHE_DIR))
+    
+    version = [dir_mtime_ns]
+    for name in IN_PLACE_CACHE_FILES:
+        try:
+            st = os.stat(CACHE_DIR / name)
+            version.append((st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            version.append(None)
+    
+    return _scan_cache_dir(str(CACHE_DIR), tuple(version))
+
+
 async def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics asynchronously."""
     return await run_in_threadpool(_get_cache_stats_sync)
 
 
 @router.get("/status", response_model=DataStatus)
-async def get_data_status():
+async def get_data_status(request: Request, response: Response):
     """
     Get status of data sources and cache.
     """
@@ -126,25 +237,15 @@ async def get_data_status():
     # Check Tiingo API key
     tiingo_status = "configured" if settings.TIINGO_API_KEY else "not_configured"
     
-    # Count cached tickers (rough estimate)
-    us_cached = 0
-    asx_cached = 0
-    
-    # Use threadpool for directory walking
-    def _count_cached_tickers():
-        u, a = 0, 0
-        cache_dir = Path(__file__).parent.parent.parent / "cache"
-        if cache_dir.exists():
-            for f in cache_dir.glob("*.parquet"):
-                if "tiingo" in f.name.lower() or "us" in f.name.lower():
-                    u += 1
-                elif "ax" in f.name.lower() or "asx" in f.name.lower():
-                    a += 1
-                else:
-                    u += 1  # Default to US
-        return u, a
-
-    us_cached, asx_cached = await run_in_threadpool(_count_cached_tickers)
+    etag = weak_etag(
+        tiingo_status,
+        cache_stats["total_files"],
+        cache_stats["total_size_mb"],
+        cache_stats["newest_cache"]
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
     
     return DataStatus(
         tiingo_status=tiingo_status,
@@ -152,8 +253,8 @@ async def get_data_status():
         cache_size_mb=cache_stats["total_size_mb"],
         cache_files=cache_stats["total_files"],
         last_refresh=cache_stats["newest_cache"],
-        us_tickers_cached=us_cached,
-        asx_tickers_cached=asx_cached,
+        us_tickers_cached=cache_stats["us_count"],
+        asx_tickers_cached=cache_stats["asx_count"],
         oldest_cache=cache_stats["oldest_cache"],
         newest_cache=cache_stats["newest_cache"]
     )
@@ -179,29 +280,46 @@ async def refresh_data(
             tiingo_is_premium=settings.TIINGO_IS_PREMIUM
         )
         
+        # The universe lookup and source split are cached and run in the
+        # threadpool; resolving them here gives an exact ticker count, and the
+        # background task reuses the result
         if request.tickers:
-            tickers = request.tickers
+            tiingo_tickers, yfinance_tickers = split_by_data_source(request.tickers)
         else:
-            # Get full universe
-            from strategy.stock_universe import get_screener_universe
-            tickers = get_screener_universe()
-        
-        # Split by data source
-        tiingo_tickers = [t for t in tickers if get_data_source(t) == 'tiingo']
-        yfinance_tickers = [t for t in tickers if get_data_source(t) == 'yfinance']
+            tiingo_tickers, yfinance_tickers = await get_screener_split()
         
         # Background refresh
-        def do_refresh():
+        async def do_refresh():
             try:
-                if tiingo_tickers:
-                    logger.info(f"Refreshing {len(tiingo_tickers)} tickers from Tiingo...")
-                    loader.fetch_prices_fast(tiingo_tickers, use_cache=not request.force)
+                # Sources have independent rate limits: fetch both at once
+                batches = [
+                    (source, batch)
+                    for source, batch in (("Tiingo", tiingo_tickers), ("yFinance", yfinance_tickers))
+                    if batch
+                ]
+                for source, batch in batches:
+                    logger.info(f"Refreshing {len(batch)} tickers from {source}...")
                 
-                if yfinance_tickers:
-                    logger.info(f"Refreshing {len(yfinance_tickers)} tickers from yFinance...")
-                    loader.fetch_prices_fast(yfinance_tickers, use_cache=not request.force)
-                    
-                logger.info("Data refresh complete!")
+                results = await asyncio.gather(
+                    *(
+                        run_in_threadpool(loader.fetch_prices_fast, batch, use_cache=not request.force)
+                        for _, batch in batches
+                    ),
+                    return_exceptions=True
+                )
+                refreshed = []
+                for (source, batch), result in zip(batches, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"{source} refresh failed: {result}")
+                    else:
+                        refreshed.append(f"{len(batch)} tickers ({source})")
+                
+                if refreshed:
+                    logger.info(f"Data refresh complete! {', '.join(refreshed)}")
+                elif batches:
+                    logger.error("Data refresh failed: no source refreshed")
+                else:
+                    logger.info("Data refresh complete! No tickers to refresh")
             except Exception as e:
                 logger.error(f"Data refresh failed: {e}")
         
@@ -209,10 +327,15 @@ async def refresh_data(
         
         cache_stats = await get_cache_stats()
         
+        if request.tickers:
+            message = f"Refreshing {len(request.tickers)} tickers from Tiingo/yFinance"
+        else:
+            message = "Refreshing full screener universe from Tiingo/yFinance"
+        
         return RefreshResponse(
             status="started",
-            message=f"Refreshing {len(tiingo_tickers)} US tickers (Tiingo) and {len(yfinance_tickers)} ASX tickers (yFinance)",
-            tickers_refreshed=len(tickers),
+            message=message,
+            tickers_refreshed=len(tiingo_tickers) + len(yfinance_tickers),
             timestamp=datetime.now().isoformat(),
             cache_status=cache_stats
         )
@@ -232,6 +355,8 @@ async def refresh_data(
 
 @router.get("/universe")
 async def get_universe(
+    request: Request,
+    response: Response,
     include_sp500: bool = True,
     include_nasdaq100: bool = True,
     include_asx200: bool = True,
@@ -242,43 +367,39 @@ async def get_universe(
     """
     try:
         from strategy.stock_universe import (
-            get_screener_universe,
             get_sp500_tickers,
             get_nasdaq100_tickers,
             get_asx200_tickers,
             get_core_etfs
         )
         
-        # Use threadpool for potentially slow operations
-        universe = await run_in_threadpool(get_screener_universe)
+        async def _lookup(key: str, getter, enabled: bool = True) -> List[str]:
+            return await cached_universe(key, getter) if enabled else []
         
-        # Group by data source
-        tiingo_tickers = [t for t in universe if get_data_source(t) == 'tiingo']
-        yfinance_tickers = [t for t in universe if get_data_source(t) == 'yfinance']
+        # Independent (potentially slow) lookups run concurrently; cached hits skip the threadpool
+        summary, sp500, nasdaq100, asx200, etfs = await asyncio.gather(
+            get_screener_summary(),
+            _lookup("sp500", get_sp500_tickers, include_sp500),
+            _lookup("nasdaq100", get_nasdaq100_tickers, include_nasdaq100),
+            _lookup("asx200", get_asx200_tickers, include_asx200),
+            _lookup("core_etfs", get_core_etfs)
+        )
         
-        sp500_count = len(await run_in_threadpool(get_sp500_tickers)) if include_sp500 else 0
-        nasdaq_count = len(await run_in_threadpool(get_nasdaq100_tickers)) if include_nasdaq100 else 0
-        asx_count = len(await run_in_threadpool(get_asx200_tickers)) if include_asx200 else 0
+        etag = weak_etag(
+            summary["fingerprint"], ",".join(etfs), len(sp500), len(nasdaq100), len(asx200)
+        )
+        cached = not_modified(request, response, etag)
+        if cached is not None:
+            return cached
         
         return {
-            "total_tickers": len(universe),
-            "by_source": {
-                "tiingo": {
-                    "count": len(tiingo_tickers),
-                    "tickers": tiingo_tickers[:50],
-                    "coverage": "US Stocks, US ETFs, Mutual Funds, Gold"
-                },
-                "yfinance": {
-                    "count": len(yfinance_tickers),
-                    "tickers": yfinance_tickers[:50],
-                    "coverage": "ASX Stocks, ASX ETFs, VIX, BTC"
-                }
-            },
-            "etfs": await run_in_threadpool(get_core_etfs),
+            "total_tickers": summary["total_tickers"],
+            "by_source": summary["by_source"],
+            "etfs": etfs,
             "indices": {
-                "sp500": sp500_count,
-                "nasdaq100": nasdaq_count,
-                "asx200": asx_count
+                "sp500": len(sp500),
+                "nasdaq100": len(nasdaq100),
+                "asx200": len(asx200)
             }
         }
         
@@ -289,6 +410,32 @@ async def get_universe(
         )
 
 
+@router.post("/universe/invalidate")
+async def invalidate_universe_cache() -> Dict[str, Any]:
+    """
+    Drop cached universe lists so the next request reloads them.
+    """
+    from strategy import stock_universe
+    
+    # Shared with the quant2 and universes routers
+    cleared = clear_universe_cache()
+    
+    # Index constituents are also memoized inside stock_universe
+    for getter in (
+        stock_universe.get_sp500_tickers,
+        stock_universe.get_nasdaq100_tickers,
+        stock_universe.get_russell2000_tickers,
+        stock_universe.get_asx200_tickers
+    ):
+        getter.cache_clear()
+    
+    return {
+        "status": "invalidated",
+        "entries_cleared": cleared,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
 @router.get("/source/{ticker}")
 async def get_ticker_source(ticker: str) -> Dict[str, str]:
     """
@@ -10,14 +10,19 @@ Provides live strategy calculations with stock universe selection:
 - /api/quant2/stat-arb - Statistical arbitrage signals
 """
 
+import asyncio
 import sys
-from fastapi import APIRouter, HTTPException, Query
+import time
+import zlib
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import date, datetime, timedelta
 from pathlib import Path
 import numpy as np
+import orjson
+import pandas as pd
 import logging
 
 logger = logging.getLogger(__name__)
@@ -25,11 +30,23 @@ logger = logging.getLogger(__name__)
 # Add parent path for strategy imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from strategy.stock_universe import (
-    UNIVERSE_REGISTRY,
-    get_universe_tickers,
-    get_universe_info
-)
+from strategy.stock_universe import UNIVERSE_REGISTRY
+
+# Live calculation dependencies; without them rankings fall back to mock data
+try:
+    from strategy.quant2.momentum.residual_momentum import ResidualMomentum
+    from strategy.infrastructure.data_loader import DataLoader
+except ImportError as e:
+    logger.warning(f"Live residual momentum unavailable: {e}")
+    ResidualMomentum = None
+    DataLoader = None
+
+try:
+    from backend.utils.http_cache import EncodedBody, encoded_response, not_modified, precompress, weak_etag
+    from backend.utils.universe_cache import get_cached_universe_info, get_cached_universe_tickers
+except ImportError:
+    from utils.http_cache import EncodedBody, encoded_response, not_modified, precompress, weak_etag
+    from utils.universe_cache import get_cached_universe_info, get_cached_universe_tickers
 
 router = APIRouter(prefix="/api/quant2", tags=["quant2"])
 
@@ -73,49 +90,104 @@ class UniverseValidationResponse(BaseModel):
 
 # ============== Helper Functions ==============
 
+RANKING_FIELDS = tuple(StockRanking.model_fields)
+
+
+def _ranking_columns(
+    tickers: List[str],
+    score: np.ndarray,
+    r_squared: np.ndarray,
+    beta_mkt: np.ndarray,
+    beta_smb: np.ndarray,
+    beta_hml: np.ndarray,
+    residual_vol: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """
+    Columnar rankings: one rounded array per StockRanking field.
+    
+    Inputs must already be ordered best score first.
+    """
+    return {
+        "rank": np.arange(1, len(tickers) + 1),
+        "ticker": np.asarray(tickers, dtype=object),
+        "score": np.round(score, 2),
+        "r_squared": np.round(r_squared, 2),
+        "beta_mkt": np.round(beta_mkt, 2),
+        "beta_smb": np.round(beta_smb, 2),
+        "beta_hml": np.round(beta_hml, 2),
+        "residual_vol": np.round(residual_vol * 100, 1),
+    }
+
+
+def _ranking_rows(columns: Dict[str, np.ndarray], index: Any) -> List[Dict[str, Any]]:
+    """Materialize ranking dicts for the selected rows only."""
+    selected = [columns[field][index].tolist() for field in RANKING_FIELDS]
+    return [dict(zip(RANKING_FIELDS, row)) for row in zip(*selected)]
+
+
 def generate_mock_residual_momentum(tickers: List[str], universe: str) -> Dict[str, Any]:
     """
     Generate realistic mock residual momentum data (Synchronous).
     """
-    np.random.seed(hash(universe) % 2**32)
+    # Per-call generator seeded from a stable hash: reproducible across
+    # processes and no shared global RNG state between concurrent calls
+    rng = np.random.default_rng(zlib.crc32(universe.encode()))
     n_stocks = len(tickers)
-    scores = np.random.randn(n_stocks) * 0.8
-    r_squared = np.random.uniform(0.25, 0.75, n_stocks)
-    beta_mkt = np.random.uniform(0.7, 1.5, n_stocks)
-    beta_smb = np.random.uniform(-0.5, 0.5, n_stocks)
-    beta_hml = np.random.uniform(-0.6, 0.4, n_stocks)
-    resid_vol = np.random.uniform(0.10, 0.35, n_stocks)
-    
-    rankings = []
-    sorted_indices = np.argsort(scores)[::-1]
+    scores = rng.standard_normal(n_stocks) * 0.8
+    r_squared = rng.uniform(0.25, 0.75, n_stocks)
+    beta_mkt = rng.uniform(0.7, 1.5, n_stocks)
+    beta_smb = rng.uniform(-0.5, 0.5, n_stocks)
+    beta_hml = rng.uniform(-0.6, 0.4, n_stocks)
+    resid_vol = rng.uniform(0.10, 0.35, n_stocks)
     
-    for rank, idx in enumerate(sorted_indices, 1):
-        ticker = tickers[idx] if idx < len(tickers) else f"TICKER{idx}"
-        rankings.append({
-            "rank": rank,
-            "ticker": ticker,
-            "score": round(float(scores[idx]), 2),
-            "r_squared": round(float(r_squared[idx]), 2),
-            "beta_mkt": round(float(beta_mkt[idx]), 2),
-            "beta_smb": round(float(beta_smb[idx]), 2),
-            "beta_hml": round(float(beta_hml[idx]), 2),
-            "residual_vol": round(float(resid_vol[idx]) * 100, 1),
-        })
+    order = np.argsort(scores)[::-1]
+    columns = _ranking_columns(
+        [tickers[i] for i in order],
+        scores[order],
+        r_squared[order],
+        beta_mkt[order],
+        beta_smb[order],
+        beta_hml[order],
+        resid_vol[order]
+    )
     
     return {
-        "rankings": rankings,
-        "top_score": round(float(max(scores)), 2),
+        "columns": columns,
+        "top_score": round(float(scores.max()), 2),
         "avg_r_squared": round(float(np.mean(r_squared)), 2),
         "stocks_ranked": n_stocks,
     }
 
 
+def _month_end_returns(prices: pd.DataFrame) -> pd.DataFrame:
+    """
+    Monthly returns from daily prices using each month's last row.
+    
+    Picks month-end rows by index instead of resampling, and divides the
+    raw arrays directly. Prices are forward-filled first so a ticker's
+    month-end value is its last available close, as with resample().last().
+    Rows are labelled with the calendar month end to line up with the
+    Fama-French factor index.
+    """
+    periods = prices.index.to_period('M')
+    is_month_end = np.append(periods[1:] != periods[:-1], True)
+    
+    monthly = prices.ffill().to_numpy()[is_month_end]
+    month_ends = periods[is_month_end].to_timestamp(how='end').normalize()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = monthly[1:] / monthly[:-1] - 1.0
+    
+    returns = pd.DataFrame(values, index=month_ends[1:], columns=prices.columns)
+    return returns.dropna()
+
+
 def _calculate_live_sync(tickers: List[str]) -> Optional[Dict[str, Any]]:
     """Synchronous implementation of live calculation."""
+    if ResidualMomentum is None or DataLoader is None:
+        return None
+    
     try:
-        from strategy.quant2.momentum.residual_momentum import ResidualMomentum
-        from strategy.infrastructure.data_loader import DataLoader
-        
         rm = ResidualMomentum(lookback_months=36, scoring_months=12)
         loader = DataLoader()
         
@@ -131,30 +203,30 @@ def _calculate_live_sync(tickers: List[str]) -> Optional[Dict[str, Any]]:
         if prices is None or len(prices) == 0:
             return None
         
-        monthly_prices = prices.resample('M').last()
-        returns = monthly_prices.pct_change().dropna()
+        returns = _month_end_returns(prices)
         result = rm.calculate_scores(returns)
         scores = result.scores.iloc[0].dropna().sort_values(ascending=False)
         
-        rankings = []
-        for rank, (ticker, score) in enumerate(scores.items(), 1):
-            exposures = result.factor_exposures.get(ticker, {})
-            rankings.append({
-                "rank": rank,
-                "ticker": ticker,
-                "score": round(float(score), 2),
-                "r_squared": round(float(exposures.get('r_squared', 0)), 2),
-                "beta_mkt": round(float(exposures.get('beta_mkt', 1)), 2),
-                "beta_smb": round(float(exposures.get('beta_smb', 0)), 2),
-                "beta_hml": round(float(exposures.get('beta_hml', 0)), 2),
-                "residual_vol": round(float(exposures.get('residual_std', 0.15)) * 100, 1),
-            })
+        # Exposures as one frame aligned to score order; gaps take the defaults
+        defaults = {'r_squared': 0.0, 'beta_mkt': 1.0, 'beta_smb': 0.0, 'beta_hml': 0.0, 'residual_std': 0.15}
+        exposures = (
+            pd.DataFrame.from_dict(result.factor_exposures, orient='index')
+            .reindex(index=scores.index, columns=list(defaults))
+            .fillna(defaults)
+            .to_numpy(dtype=float)
+        )
+        
+        columns = _ranking_columns(
+            scores.index.tolist(),
+            scores.to_numpy(dtype=float),
+            *exposures.T
+        )
         
         return {
-            "rankings": rankings,
+            "columns": columns,
             "top_score": round(float(scores.iloc[0]) if len(scores) > 0 else 0, 2),
             "avg_r_squared": round(float(result.metadata.get('avg_r_squared', 0.42)), 2),
-            "stocks_ranked": len(rankings),
+            "stocks_ranked": len(scores),
             "source": "live"
         }
     except Exception as e:
@@ -162,15 +234,55 @@ def _calculate_live_sync(tickers: List[str]) -> Optional[Dict[str, Any]]:
         return None
 
 
-async def calculate_residual_momentum_live(tickers: List[str]) -> Optional[Dict[str, Any]]:
-    """Calculate live residual momentum scores asynchronously."""
-    return await run_in_threadpool(_calculate_live_sync, tickers)
+# Live rankings change at most daily: keep them per (universe, day) and
+# share one in-flight computation between concurrent requests.
+_live_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_live_inflight: Dict[Tuple[str, str], "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+
+
+def _finish_live_calculation(key: Tuple[str, str], task: asyncio.Future) -> None:
+    """Record a finished live calculation; only successful results are cached."""
+    _live_inflight.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    result = task.result()
+    if result is not None:
+        # Drop rankings from previous days
+        for stale in [k for k in _live_cache if k[1] != key[1]]:
+            del _live_cache[stale]
+        _live_cache[key] = result
+
+
+async def calculate_residual_momentum_live(tickers: List[str], universe: str) -> Optional[Dict[str, Any]]:
+    """Calculate live residual momentum scores asynchronously (cached per universe and day)."""
+    key = (universe, date.today().isoformat())
+    cached = _live_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    task = _live_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(run_in_threadpool(_calculate_live_sync, tickers))
+        task.add_done_callback(lambda t: _finish_live_calculation(key, t))
+        _live_inflight[key] = task
+    
+    # Shield so one cancelled request doesn't abort the computation others wait on
+    return await asyncio.shield(task)
 
 
 # ============== Endpoints ==============
 
+# Rankings recompute daily and universes are static: let browsers and proxies keep them
+STABLE_CACHE_CONTROL = "public, max-age=3600"
+
+# Serialized /residual-momentum bodies: (universe, top_n, include_bottom) -> (expires_at, body, etag)
+RESPONSE_CACHE_TTL_SECONDS = 300
+_response_cache: Dict[Tuple[str, int, bool], Tuple[float, EncodedBody, str]] = {}
+
+
 @router.get("/residual-momentum", response_model=ResidualMomentumResponse)
 async def get_residual_momentum(
+    request: Request,
     universe: str = Query(default="SPX500"),
     top_n: int = Query(default=20, ge=5, le=100),
     include_bottom: bool = Query(default=False)
@@ -179,22 +291,42 @@ async def get_residual_momentum(
     if universe not in UNIVERSE_REGISTRY:
         raise HTTPException(status_code=400, detail="Invalid universe")
     
-    tickers = await run_in_threadpool(get_universe_tickers, universe)
+    key = (universe, top_n, include_bottom)
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        body = await _build_residual_momentum_body(universe, top_n, include_bottom)
+        # Compressed once per build, not per response
+        encoded = await run_in_threadpool(precompress, body)
+        entry = (time.monotonic() + RESPONSE_CACHE_TTL_SECONDS, encoded, weak_etag(body))
+        _response_cache[key] = entry
+    
+    # Cached body was validated when built; send the bytes as-is
+    _, body, etag = entry
+    response = encoded_response(request, body)
+    cached = not_modified(request, response, etag, cache_control=STABLE_CACHE_CONTROL)
+    return cached if cached is not None else response
+
+
+async def _build_residual_momentum_body(universe: str, top_n: int, include_bottom: bool) -> bytes:
+    """Compute and serialize a /residual-momentum response."""
+    tickers = await get_cached_universe_tickers(universe)
     if not tickers:
         raise HTTPException(status_code=500, detail="No tickers found")
     
-    result = await calculate_residual_momentum_live(tickers)
+    result = await calculate_residual_momentum_live(tickers, universe)
     
     if result is None:
         result = await run_in_threadpool(generate_mock_residual_momentum, tickers, universe)
         result["source"] = "mock"
     
-    top_rankings = [StockRanking(**r) for r in result["rankings"][:top_n]]
-    bottom_rankings = [StockRanking(**r) for r in result["rankings"][-top_n:]] if include_bottom else None
+    # Rankings are built by this module; skip per-field validation
+    columns = result["columns"]
+    top_rankings = [StockRanking.model_construct(**r) for r in _ranking_rows(columns, slice(None, top_n))]
+    bottom_rankings = [StockRanking.model_construct(**r) for r in _ranking_rows(columns, slice(-top_n, None))] if include_bottom else None
     
-    info = await run_in_threadpool(get_universe_info, universe)
+    info = await get_cached_universe_info(universe)
     
-    return ResidualMomentumResponse(
+    payload = ResidualMomentumResponse(
         universe=universe,
         universe_name=info["name"],
         generated_at=datetime.now().isoformat(),
@@ -206,6 +338,7 @@ async def get_residual_momentum(
         rankings=top_rankings,
         bottom_rankings=bottom_rankings
     )
+    return orjson.dumps(payload.model_dump())
 
 
 @router.get("/validate-universe")
@@ -215,7 +348,7 @@ async def validate_universe(universe: str = Query(...)) -> UniverseValidationRes
         return UniverseValidationResponse(universe=universe, valid=False, ticker_count=0, sample_tickers=[], api_status="Unknown")
     
     try:
-        tickers = await run_in_threadpool(get_universe_tickers, universe)
+        tickers = await get_cached_universe_tickers(universe)
         return UniverseValidationResponse(universe=universe, valid=True, ticker_count=len(tickers), sample_tickers=tickers[:10], api_status="OK")
     except Exception as e:
         return UniverseValidationResponse(universe=universe, valid=False, ticker_count=0, sample_tickers=[], api_status=f"Error: {str(e)}")
@@ -246,23 +379,36 @@ async def get_all_residual_momentum(
     if universe not in UNIVERSE_REGISTRY:
         raise HTTPException(status_code=400, detail="Invalid universe")
     
-    tickers = await run_in_threadpool(get_universe_tickers, universe)
-    result = await calculate_residual_momentum_live(tickers)
+    tickers = await get_cached_universe_tickers(universe)
+    result = await calculate_residual_momentum_live(tickers, universe)
     if result is None:
         result = await run_in_threadpool(generate_mock_residual_momentum, tickers, universe)
     
-    all_rankings = result["rankings"]
+    # Filter and sort on the score arrays; only the selected rows become dicts
+    columns = result["columns"]
+    scores = columns["score"]
+    mask = np.ones(len(scores), dtype=bool)
     if min_score is not None:
-        all_rankings = [r for r in all_rankings if r["score"] >= min_score]
+        mask &= scores >= min_score
     if max_score is not None:
-        all_rankings = [r for r in all_rankings if r["score"] <= max_score]
+        mask &= scores <= max_score
+    selected = np.flatnonzero(mask)
     
-    reverse = sort_order.lower() == "desc"
-    all_rankings.sort(key=lambda x: x.get(sort_by, x["score"]), reverse=reverse)
+    key = columns.get(sort_by, scores)[selected]
+    if sort_order.lower() != "desc":
+        order = np.argsort(key, kind="stable")
+    elif key.dtype.kind in "iuf":
+        order = np.argsort(-key, kind="stable")
+    else:
+        # Tickers are unique, so reversing an ascending sort is safe
+        order = np.argsort(key, kind="stable")[::-1]
+    all_rankings = _ranking_rows(columns, selected[order])
     
-    info = await run_in_threadpool(get_universe_info, universe)
+    info = await get_cached_universe_info(universe)
     
-    return AllStocksResponse(
+    # Rows come from our own ranking code: build the models without
+    # validation and serialize here, bypassing response_model re-validation
+    payload = AllStocksResponse.model_construct(
         universe=universe,
         universe_name=info["name"],
         generated_at=datetime.now().isoformat(),
@@ -272,27 +418,38 @@ async def get_all_residual_momentum(
         sort_order=sort_order,
         min_score=min_score,
         max_score=max_score,
-        stocks=[StockRanking(**r) for r in all_rankings]
+        stocks=[StockRanking.model_construct(**r) for r in all_rankings]
     )
+    return Response(orjson.dumps(payload.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY), media_type="application/json")
 
 
 @router.get("/universes-summary")
-async def get_universes_summary() -> Dict[str, Any]:
+async def get_universes_summary(request: Request, response: Response) -> Dict[str, Any]:
     """Get summary of all available universes."""
+    keys = list(UNIVERSE_REGISTRY.keys())
+    
+    # Resolve every universe concurrently; one failing lookup doesn't sink the rest
+    lookups = await asyncio.gather(
+        *(
+            asyncio.gather(get_cached_universe_tickers(key), get_cached_universe_info(key))
+            for key in keys
+        ),
+        return_exceptions=True
+    )
+    
     summaries = []
+    for key, lookup in zip(keys, lookups):
+        if isinstance(lookup, Exception):
+            summaries.append({"key": key, "name": key, "region": "Unknown", "ticker_count": 0, "sample": [], "status": "error"})
+            continue
+        tickers, info = lookup
+        summaries.append({"key": key, "name": info["name"], "region": info["region"], "ticker_count": len(tickers), "sample": tickers[:5], "status": "available"})
     
-    def _get_all_summaries():
-        res = []
-        for key in UNIVERSE_REGISTRY.keys():
-            try:
-                tickers = get_universe_tickers(key)
-                info = get_universe_info(key)
-                res.append({"key": key, "name": info["name"], "region": info["region"], "ticker_count": len(tickers), "sample": tickers[:5], "status": "available"})
-            except:
-                res.append({"key": key, "name": key, "region": "Unknown", "ticker_count": 0, "sample": [], "status": "error"})
-        return res
-
-    summaries = await run_in_threadpool(_get_all_summaries)
+    # Tag the universe data itself; generated_at changes on every call
+    etag = weak_etag(orjson.dumps(summaries))
+    cached = not_modified(request, response, etag, cache_control=STABLE_CACHE_CONTROL)
+    if cached is not None:
+        return cached
     
     return {
         "generated_at": datetime.now().isoformat(),
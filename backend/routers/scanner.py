@@ -10,31 +10,81 @@ Scanners:
 - Mean Reversion
 """
 
+import asyncio
+import os
 import sys
-from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends, Request, Response
 from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-import json
 import aiofiles
-import random
+import numpy as np
+import orjson
 
 # Add parent path for strategy imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from strategy.stock_universe import (
+    get_sp500_tickers,
+    get_nasdaq100_tickers,
+    get_asx200_tickers,
+    get_screener_universe
+)
+
 # Import authentication
 try:
     from backend.auth import get_current_user
+    from backend.utils.http_cache import not_modified, weak_etag
 except ImportError:
     from auth import get_current_user
+    from utils.http_cache import not_modified, weak_etag
 
 router = APIRouter(prefix="/api/scanner", tags=["scanner"])
 
+# Scans are long, I/O-bound jobs: run them on their own pool so they can't
+# starve Starlette's shared threadpool, and cap how many run at once.
+SCAN_POOL = ThreadPoolExecutor(
+    max_workers=min(64, (os.cpu_count() or 4) * 8),
+    thread_name_prefix="scan"
+)
+MAX_CONCURRENT_SCANS = 16
+_scan_slots = asyncio.Semaphore(MAX_CONCURRENT_SCANS)
+
+class ScanState:
+    """
+    Latest scan results, their ETag and the scan status.
+    
+    The background scan task and request handlers only touch these through
+    the lock, so readers always see results, ETag and status from the same scan.
+    """
+    
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.results: Dict[str, Any] = {}
+        self.etag: Optional[str] = None  # Fingerprint of the serialized results
+        self.status: str = "idle"
+    
+    async def snapshot(self) -> Tuple[Dict[str, Any], Optional[str], str]:
+        """Return (results, etag, status) as one consistent view."""
+        async with self.lock:
+            return self.results, self.etag, self.status
+    
+    async def set_status(self, status: str) -> None:
+        """Record a status change (running / failed)."""
+        async with self.lock:
+            self.status = status
+    
+    async def publish(self, results: Dict[str, Any], etag: str) -> None:
+        """Swap in a completed scan's results."""
+        async with self.lock:
+            self.results, self.etag, self.status = results, etag, "completed"
+
+
 # In-memory storage for scan results
-_scan_results: Dict[str, Any] = {}
-_scan_status: str = "idle"
+scan_state = ScanState()
 
 
 class ScanRequest(BaseModel):
@@ -53,22 +103,43 @@ class ScanRequest(BaseModel):
     custom_tickers: Optional[List[str]] = Field(default=None)
 
 
+# Parsed scan file: (path, st_mtime_ns, st_size, results)
+_file_cache: Optional[Tuple[str, int, int, Dict[str, Any]]] = None
+
+
 async def load_scan_results_async() -> Optional[Dict]:
-    """Load scan results from JSON file asynchronously."""
+    """
+    Load scan results from JSON file asynchronously.
+    
+    The parsed contents are cached and reused until the file's mtime or
+    size changes, so repeat reads cost a single stat call.
+    """
+    global _file_cache
     scan_file = Path("dashboard/scan_results.json")
-    if scan_file.exists():
-        try:
-            async with aiofiles.open(scan_file, mode='r') as f:
-                content = await f.read()
-                return json.loads(content)
-        except:
-            pass
-    return None
+    try:
+        st = await run_in_threadpool(scan_file.stat)
+    except OSError:
+        return None
+    
+    key = (os.path.abspath(scan_file), st.st_mtime_ns, st.st_size)
+    if _file_cache is not None and _file_cache[:3] == key:
+        return _file_cache[3]
+    
+    try:
+        async with aiofiles.open(scan_file, mode='rb') as f:
+            content = await f.read()
+        results = orjson.loads(content)
+    except:
+        return None
+    
+    _file_cache = (*key, results)
+    return results
 
 
 @router.get("/")
 async def get_scanner_info() -> Dict[str, Any]:
     """Get information about available scanners."""
+    results, _, status = await scan_state.snapshot()
     return {
         "scanners": [
             {
@@ -83,23 +154,31 @@ async def get_scanner_info() -> Dict[str, Any]:
             }
         ],
         "universes": ["sp500", "nasdaq100", "asx200", "all"],
-        "last_scan": _scan_results.get("generated_at"),
-        "status": _scan_status
+        "last_scan": results.get("generated_at"),
+        "status": status
     }
 
 
 @router.get("/results")
 async def get_scan_results(
+    request: Request,
+    response: Response,
     scanner_type: Optional[str] = None,
     signal: Optional[str] = None,
     min_score: Optional[float] = None,
     limit: int = 50
 ) -> Dict[str, Any]:
     """Get latest scan results."""
-    global _scan_results
+    results, results_etag, _ = await scan_state.snapshot()
+    
+    # In-memory results carry an ETag; revalidate before filtering anything
+    if results and results_etag:
+        etag = weak_etag(results_etag, scanner_type, signal, min_score, limit)
+        cached = not_modified(request, response, etag)
+        if cached is not None:
+            return cached
     
     # Try to load from memory first, then file
-    results = _scan_results
     if not results:
         results = await load_scan_results_async()
     
@@ -113,17 +192,20 @@ async def get_scan_results(
     # Get stocks from results
     stocks = results.get("stocks", results.get("results", []))
     
-    # Apply filters
-    filtered = []
-    for stock in stocks:
-        if signal and stock.get("signal", "").upper() != signal.upper():
-            continue
-        if min_score and stock.get("score", 0) < min_score:
-            continue
-        filtered.append(stock)
+    # Filter and sort on score keys extracted once, not per comparison
+    scores = np.fromiter((stock.get("score", 0) for stock in stocks), dtype=np.float64, count=len(stocks))
+    mask = np.ones(len(stocks), dtype=bool)
+    if signal:
+        wanted = signal.upper()
+        mask &= np.fromiter(
+            (stock.get("signal", "").upper() == wanted for stock in stocks), dtype=bool, count=len(stocks)
+        )
+    if min_score:
+        mask &= scores >= min_score
     
-    filtered.sort(key=lambda x: x.get("score", 0), reverse=True)
-    filtered = filtered[:limit]
+    selected = np.flatnonzero(mask)
+    order = selected[np.argsort(-scores[selected], kind="stable")]
+    filtered = [stocks[i] for i in order[:limit]]
     
     return {
         "results": filtered,
@@ -140,11 +222,9 @@ async def run_scan(
     user: dict = Depends(get_current_user)
 ) -> Dict[str, Any]:
     """Run a stock scan in the background."""
-    global _scan_status
-    _scan_status = "running"
+    await scan_state.set_status("running")
     
     async def execute_scan_task():
-        global _scan_results, _scan_status
         try:
             # CPU intensive/synchronous part
             def _scan_logic():
@@ -152,33 +232,51 @@ async def run_scan(
                 if request.custom_tickers:
                     tickers = request.custom_tickers
                 else:
-                    from strategy.stock_universe import get_sp500_tickers, get_nasdaq100_tickers, get_asx200_tickers, get_screener_universe
                     universe_map = {"sp500": get_sp500_tickers, "nasdaq100": get_nasdaq100_tickers, "asx200": get_asx200_tickers, "all": get_screener_universe}
                     get_tickers = universe_map.get(request.universe, get_sp500_tickers)
                     tickers = get_tickers()
                 
-                # Mock scanning logic
-                results = []
-                sample_tickers = random.sample(tickers, min(20, len(tickers)))
-                for ticker in sample_tickers:
-                    score = random.uniform(0, 100)
-                    signal = "BUY" if score > 70 else "WATCH" if score > 40 else "HOLD"
-                    results.append({
+                # Mock scanning logic: draw each column for the whole sample at once
+                rng = np.random.default_rng()
+                n = min(20, len(tickers))
+                sample = rng.choice(len(tickers), size=n, replace=False)
+                scores = rng.uniform(0, 100, n)
+                prices = np.round(rng.uniform(request.min_price, request.max_price, n), 2)
+                changes = np.round(rng.uniform(-5, 10, n), 2)
+                volumes = rng.integers(request.min_volume, request.min_volume * 10, n, endpoint=True)
+                
+                # Order rows by score once, on the array, before building dicts
+                rounded = np.round(scores, 1)
+                order = np.argsort(-rounded, kind="stable")
+                scores = scores[order]
+                columns = zip(
+                    [tickers[i] for i in sample[order]],
+                    prices[order].tolist(),
+                    changes[order].tolist(),
+                    volumes[order].tolist(),
+                    np.where(scores > 70, "BUY", np.where(scores > 40, "WATCH", "HOLD")).tolist(),
+                    rounded[order].tolist(),
+                    np.where(scores > 60, "High Tight Flag", "Consolidation").tolist(),
+                )
+                results = [
+                    {
                         "ticker": ticker,
                         "name": ticker,
-                        "price": round(random.uniform(request.min_price, request.max_price), 2),
-                        "change_pct": round(random.uniform(-5, 10), 2),
-                        "volume": random.randint(request.min_volume, request.min_volume * 10),
+                        "price": price,
+                        "change_pct": change_pct,
+                        "volume": volume,
                         "signal": signal,
-                        "score": round(score, 1),
-                        "details": {"pattern": "High Tight Flag" if score > 60 else "Consolidation"}
-                    })
-                results.sort(key=lambda x: x["score"], reverse=True)
+                        "score": score,
+                        "details": {"pattern": pattern}
+                    }
+                    for ticker, price, change_pct, volume, signal, score, pattern in columns
+                ]
                 return tickers, results
 
-            tickers, results = await run_in_threadpool(_scan_logic)
+            async with _scan_slots:
+                tickers, results = await asyncio.get_running_loop().run_in_executor(SCAN_POOL, _scan_logic)
             
-            _scan_results = {
+            scan_results = {
                 "generated_at": datetime.now().isoformat(),
                 "scanner_type": request.scanner_type,
                 "universe": request.universe,
@@ -187,15 +285,19 @@ async def run_scan(
                 "stocks": results
             }
             
+            # Serialize off the event loop
+            payload = await run_in_threadpool(orjson.dumps, scan_results, option=orjson.OPT_INDENT_2)
+            
             # Save to file asynchronously
+
             scan_file = Path("dashboard/scan_results.json")
             scan_file.parent.mkdir(exist_ok=True)
-            async with aiofiles.open(scan_file, mode='w') as f:
-                await f.write(json.dumps(_scan_results, indent=2))
+            async with aiofiles.open(scan_file, mode='wb') as f:
+                await f.write(payload)
             
-            _scan_status = "completed"
+            await scan_state.publish(scan_results, weak_etag(payload))
         except Exception as e:
-            _scan_status = f"failed: {str(e)}"
+            await scan_state.set_status(f"failed: {str(e)}")
 
     background_tasks.add_task(execute_scan_task)
     
@@ -210,10 +312,11 @@ async def run_scan(
 @router.get("/status")
 async def get_scan_status() -> Dict[str, Any]:
     """Get the status of the current/last scan."""
+    results, _, status = await scan_state.snapshot()
     return {
-        "status": _scan_status,
-        "has_results": bool(_scan_results),
-        "last_scan": _scan_results.get("generated_at") if _scan_results else None
+        "status": status,
+        "has_results": bool(results),
+        "last_scan": results.get("generated_at") if results else None
     }
 
 
@@ -222,10 +325,11 @@ async def get_quallamaggie_results() -> Dict[str, Any]:
     """Get Quallamaggie scanner results specifically."""
     results = await load_scan_results_async()
     if results:
-        results["retrieved_at"] = datetime.now().isoformat()
-        return results
+        # Copy: the loaded results are shared through the file cache
+        return {**results, "retrieved_at": datetime.now().isoformat()}
     
-    if _scan_results and _scan_results.get("scanner_type") == "quallamaggie":
-        return _scan_results
+    results, _, _ = await scan_state.snapshot()
+    if results and results.get("scanner_type") == "quallamaggie":
+        return results
     
     return {"results": [], "message": "No Quallamaggie results found."}
@@ -10,28 +10,120 @@ Strategies:
 - OLMAR: Online Learning Mean Reversion
 """
 
+import asyncio
+import functools
+import os
 import sys
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from email.utils import formatdate
+from types import MappingProxyType
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Request, Response
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel, Field
-from typing import Dict, List, Optional, Any
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 import json
-import aiofiles
-import asyncio
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Add parent path for strategy imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+try:
+    from backend.utils.http_cache import EncodedBody, encoded_head_response, encoded_response, not_modified, precompress, weak_etag
+except ImportError:
+    from utils.http_cache import EncodedBody, encoded_head_response, encoded_response, not_modified, precompress, weak_etag
+
+# Imported once at load rather than per backtest; forked pipeline workers inherit it
+try:
+    from strategy.pipeline.pipeline import TradingPipeline, PipelineConfig
+except ImportError as e:
+    logger.warning(f"Backtest pipeline unavailable: {e}")
+    TradingPipeline = None
+    PipelineConfig = None
+
 router = APIRouter(prefix="/api/strategies", tags=["strategies"])
 
-# In-memory storage for backtest results
-_backtest_results: Dict[str, Any] = {}
-_backtest_status: Dict[str, str] = {}
+@dataclass(frozen=True)
+class BacktestEntry:
+    """Latest status and in-memory results for one strategy."""
+    status: str = "not_started"
+    results: Optional[Dict[str, Any]] = None
+    updated_at: float = 0.0  # time.monotonic() of the last change
+
+
+class BacktestRegistry:
+    """
+    Backtest status and results for every strategy.
+    
+    Updates replace a whole entry and republish a read-only snapshot
+    (copy-on-write), so request handlers read status and results from the
+    same update and iterate a mapping that never changes underneath them.
+    """
+    
+    _EMPTY = BacktestEntry()
+    
+    def __init__(self):
+        self.snapshot: Mapping[str, BacktestEntry] = MappingProxyType({})
+    
+    def get(self, strategy_name: str) -> BacktestEntry:
+        """Entry for a strategy (a not-started entry if unknown)."""
+        return self.snapshot.get(strategy_name, self._EMPTY)
+    
+    def set_status(self, strategy_name: str, status: str) -> None:
+        """Record a status change (running / failed), keeping previous results."""
+        entry = replace(self.get(strategy_name), status=status, updated_at=time.monotonic())
+        self._publish(strategy_name, entry)
+    
+    def complete(self, strategy_name: str, results: Dict[str, Any]) -> None:
+        """Swap in a completed run's results."""
+        self._publish(strategy_name, BacktestEntry("completed", results, time.monotonic()))
+    
+    def _publish(self, strategy_name: str, entry: BacktestEntry) -> None:
+        entries = dict(self.snapshot)
+        entries[strategy_name] = entry
+        self.snapshot = MappingProxyType(entries)
+
+
+# In-memory storage for backtest status and results
+backtest_registry = BacktestRegistry()
+
+# Backtests currently executing: strategy -> (backtest_id, monotonic start).
+# Entries older than the TTL are treated as lost so a strategy can't stay blocked.
+BACKTEST_INFLIGHT_TTL_SECONDS = 3600
+_inflight_backtests: Dict[str, Tuple[str, float]] = {}
+
+# Pipelines are CPU-bound pandas/NumPy work that holds the GIL for long
+# stretches; run them in worker processes so concurrent backtests don't
+# contend with each other or the event loop.
+_pipeline_pool: Optional[ProcessPoolExecutor] = None
+
+# Runs beyond the worker count wait here as coroutines rather than piling
+# up as pickled jobs in the pool queue
+MAX_CONCURRENT_BACKTESTS = os.cpu_count() or 4
+_pipeline_slots = asyncio.Semaphore(MAX_CONCURRENT_BACKTESTS)
+
+
+def get_pipeline_pool() -> ProcessPoolExecutor:
+    """Process pool for backtest pipelines, created on first use."""
+    global _pipeline_pool
+    if _pipeline_pool is None:
+        _pipeline_pool = ProcessPoolExecutor(max_workers=MAX_CONCURRENT_BACKTESTS)
+    return _pipeline_pool
+
+
+def shutdown_pipeline_pool() -> None:
+    """Stop the pipeline workers, dropping queued backtests."""
+    global _pipeline_pool
+    if _pipeline_pool is not None:
+        _pipeline_pool.shutdown(wait=False, cancel_futures=True)
+        _pipeline_pool = None
 
 
 class BacktestRequest(BaseModel):
@@ -111,39 +203,165 @@ STRATEGY_CATALOG = {
 }
 
 
+# Response timestamps only need second precision: format at most once a second
+_now_iso_cache: Dict[str, Any] = {"ts": "", "t": float("-inf")}
+
+
+def _now_iso() -> str:
+    """Current time as ISO text for responses, refreshed at most once per second."""
+    t = time.monotonic()
+    if t - _now_iso_cache["t"] >= 1.0:
+        _now_iso_cache.update(ts=datetime.now().isoformat(), t=t)
+    return _now_iso_cache["ts"]
+
+
+def _results_path(strategy_name: str) -> Path:
+    """Location of a strategy's saved backtest results."""
+    return Path(f"reports/{strategy_name}_results.json")
+
+
+def _read_json_sync(path: Path) -> Optional[Dict[str, Any]]:
+    """Read a small JSON file in one go; None if missing or unreadable."""
+    try:
+        content = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        # Files saved by older versions may hold NaN literals, which orjson rejects
+        return json.loads(content)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=64)
+def _load_results_cached(path_str: str, mtime_ns: int, size: int) -> Tuple[Optional[Dict[str, Any]], str]:
+    """Parsed results file and its ETag; the stat fields in the key invalidate stale entries."""
+    return _read_json_sync(Path(path_str)), weak_etag(path_str, mtime_ns, size)
+
+
+def _load_results_with_etag_sync(strategy_name: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Load a strategy's saved results, parsing the file only when it changes.
+    
+    Results are only rewritten when a backtest completes, so repeat reads
+    cost a stat call. The returned dict is shared; callers must not mutate it.
+    """
+    path = _results_path(strategy_name)
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None
+    return _load_results_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _load_results_sync(strategy_name: str) -> Optional[Dict[str, Any]]:
+    """Saved results for a strategy, or None."""
+    return _load_results_with_etag_sync(strategy_name)[0]
+
+
+def _bulk_load_results(strategy_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Load several strategies' saved results in one synchronous pass."""
+    return {name: _load_results_sync(name) for name in strategy_names}
+
+
+# Pre-compressed results bodies: strategy -> (etag, body), rebuilt when the ETag changes
+_results_bodies: Dict[str, Tuple[str, EncodedBody]] = {}
+
+
+def _encode_results_sync(results: Dict[str, Any]) -> EncodedBody:
+    """Serialize and pre-compress a results response."""
+    return precompress(orjson.dumps(
+        results,
+        default=str,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
+
+
+def _write_json_sync(path: Path, data: Dict[str, Any]) -> None:
+    """Write a JSON file in one go; numpy values and datetimes encode natively."""
+    path.parent.mkdir(exist_ok=True)
+    path.write_bytes(orjson.dumps(
+        data,
+        default=str,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    ))
+
+
+# The catalog is static: validate and serialize the listing once at import
+_STRATEGY_LIST_ADAPTER = TypeAdapter(List[StrategyInfo])
+_STRATEGIES_JSON = _STRATEGY_LIST_ADAPTER.dump_json(
+    _STRATEGY_LIST_ADAPTER.validate_python([{"name": name, **info} for name, info in STRATEGY_CATALOG.items()])
+)
+_STRATEGIES_ETAG = weak_etag(_STRATEGIES_JSON)
+_STRATEGIES_BODY = precompress(_STRATEGIES_JSON)
+
+# Static part of each strategy's details; only the results are spliced in per request
+_STATIC_DETAILS = {name: {"name": name, **info} for name, info in STRATEGY_CATALOG.items()}
+
+# Catalog only changes on deploy; results only when a backtest completes
+STRATEGY_CACHE_CONTROL = "max-age=30"
+
+
+def _run_pipeline_job(
+    tickers: Optional[List[str]],
+    start_date: str,
+    end_date: Optional[str],
+    initial_capital: float,
+    strategy_name: str,
+    optimization_method: str
+) -> Dict[str, Any]:
+    """
+    Run a backtest pipeline and reduce its result to plain data.
+    
+    Executes in a pipeline worker process, so it lives at module level
+    (picklable) and returns only the fields the saved results need.
+    """
+    config = PipelineConfig(
+        tickers=tickers,
+        start_date=start_date,
+        end_date=end_date,
+        initial_capital=initial_capital
+    )
+    result = TradingPipeline(config).run(
+        strategy_name=strategy_name,
+        optimization_method=optimization_method
+    )
+    # PipelineResult always carries PerformanceMetrics and a weights Series,
+    # the same shape TradingPipeline.export_results relies on
+    return {
+        "metrics": result.report.metrics.to_dict(),
+        "final_value": float(result.final_value),
+        "weights": result.allocation.weights.to_dict(),
+        "execution_time": result.execution_time_seconds
+    }
+
+
 @router.get("/", response_model=List[StrategyInfo])
-async def list_strategies():
+async def list_strategies(request: Request):
     """List all available strategies."""
-    return [
-        StrategyInfo(name=name, **info) 
-        for name, info in STRATEGY_CATALOG.items()
-    ]
+    response = encoded_response(request, _STRATEGIES_BODY)
+    return not_modified(request, response, _STRATEGIES_ETAG, cache_control=STRATEGY_CACHE_CONTROL) or response
 
 
 @router.get("/{strategy_name}")
 async def get_strategy_details(strategy_name: str) -> Dict[str, Any]:
     """Get detailed information about a specific strategy."""
-    if strategy_name not in STRATEGY_CATALOG:
+    base = _STATIC_DETAILS.get(strategy_name)
+    if base is None:
         raise HTTPException(status_code=404, detail="Strategy not found")
     
-    info = STRATEGY_CATALOG[strategy_name]
-    
     # Check for cached results
-    results = _backtest_results.get(strategy_name)
+    results = backtest_registry.get(strategy_name).results
     if not results:
-        # Try to load from file asynchronously
-        results_path = Path(f"reports/{strategy_name}_results.json")
-        if results_path.exists():
-            try:
-                async with aiofiles.open(results_path, mode='r') as f:
-                    content = await f.read()
-                    results = json.loads(content)
-            except:
-                pass
+        # Small file: one blocking read off the event loop beats chunked async I/O
+        results = await run_in_threadpool(_load_results_sync, strategy_name)
     
     return {
-        "name": strategy_name,
-        **info,
+        **base,
         "last_results": results,
         "has_results": results is not None
     }
@@ -157,30 +375,39 @@ async def run_backtest(
     """Execute a backtest for a strategy in the background."""
     if request.strategy_name not in STRATEGY_CATALOG:
         raise HTTPException(status_code=404, detail="Strategy not found")
+    if TradingPipeline is None:
+        raise HTTPException(status_code=503, detail="Backtest pipeline unavailable")
+    
+    # A run for this strategy is already going: hand back its id instead of
+    # starting a second copy of the pipeline
+    inflight = _inflight_backtests.get(request.strategy_name)
+    if inflight is not None and time.monotonic() - inflight[1] < BACKTEST_INFLIGHT_TTL_SECONDS:
+        return BacktestResponse(
+            backtest_id=inflight[0],
+            status="running",
+            strategy_name=request.strategy_name,
+            message="Backtest already running.",
+            timestamp=_now_iso()
+        )
     
     backtest_id = f"{request.strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-    _backtest_status[request.strategy_name] = "running"
+    backtest_registry.set_status(request.strategy_name, "running")
+    _inflight_backtests[request.strategy_name] = (backtest_id, time.monotonic())
     
     async def execute_backtest_task():
-        """Helper to run the heavy pipeline in a threadpool and save results."""
+        """Helper to run the heavy pipeline in a worker process and save results."""
         try:
-            from strategy.pipeline.pipeline import TradingPipeline, PipelineConfig
-            
-            # This is synchronous/CPU-heavy, so run in threadpool
-            def _run_pipeline():
-                config = PipelineConfig(
-                    tickers=request.tickers,
-                    start_date=request.start_date,
-                    end_date=request.end_date,
-                    initial_capital=request.initial_capital
+            async with _pipeline_slots:
+                pipeline_output = await asyncio.get_running_loop().run_in_executor(
+                    get_pipeline_pool(),
+                    _run_pipeline_job,
+                    request.tickers,
+                    request.start_date,
+                    request.end_date,
+                    request.initial_capital,
+                    request.strategy_name,
+                    request.optimization_method
                 )
-                pipeline = TradingPipeline(config)
-                return pipeline.run(
-                    strategy_name=request.strategy_name,
-                    optimization_method=request.optimization_method
-                )
-            
-            result = await run_in_threadpool(_run_pipeline)
             
             results_data = {
                 "backtest_id": backtest_id,
@@ -192,26 +419,22 @@ async def run_backtest(
                     "initial_capital": request.initial_capital,
                     "optimization_method": request.optimization_method
                 },
-                "metrics": result.report.metrics.to_dict() if hasattr(result.report.metrics, 'to_dict') else {},
-                "final_value": result.final_value,
-                "weights": result.allocation.weights.to_dict() if hasattr(result.allocation.weights, 'to_dict') else {},
-                "execution_time": result.execution_time_seconds
+                **pipeline_output
             }
             
-            _backtest_results[request.strategy_name] = results_data
-            _backtest_status[request.strategy_name] = "completed"
+            backtest_registry.complete(request.strategy_name, results_data)
             
-            # Save to file asynchronously
-            results_path = Path(f"reports/{request.strategy_name}_results.json")
-            results_path.parent.mkdir(exist_ok=True)
-            async with aiofiles.open(results_path, mode='w') as f:
-                await f.write(json.dumps(results_data, indent=2, default=str))
+            # Save to file off the event loop
+            await run_in_threadpool(_write_json_sync, _results_path(request.strategy_name), results_data)
             
             logger.info(f"✅ Backtest completed: {request.strategy_name}")
             
         except Exception as e:
-            _backtest_status[request.strategy_name] = f"failed: {str(e)}"
+            backtest_registry.set_status(request.strategy_name, f"failed: {str(e)}")
             logger.exception(f"Backtest {request.strategy_name} failed")
+        finally:
+            if _inflight_backtests.get(request.strategy_name, (None,))[0] == backtest_id:
+                del _inflight_backtests[request.strategy_name]
 
     background_tasks.add_task(execute_backtest_task)
     
@@ -220,75 +443,114 @@ async def run_backtest(
         status="started",
         strategy_name=request.strategy_name,
         message=f"Backtest started.",
-        timestamp=datetime.now().isoformat()
+        timestamp=_now_iso()
     )
 
 
 @router.get("/{strategy_name}/status")
 async def get_backtest_status(strategy_name: str) -> Dict[str, Any]:
     """Get the status of a running backtest."""
+    entry = backtest_registry.get(strategy_name)
     return {
         "strategy_name": strategy_name,
-        "status": _backtest_status.get(strategy_name, "not_started"),
-        "has_results": strategy_name in _backtest_results,
-        "timestamp": datetime.now().isoformat()
+        "status": entry.status,
+        "has_results": entry.results is not None,
+        "timestamp": _now_iso()
     }
 
 
 @router.get("/{strategy_name}/results")
-async def get_backtest_results(strategy_name: str) -> Dict[str, Any]:
+async def get_backtest_results(strategy_name: str, request: Request) -> Response:
     """Get the results of a completed backtest."""
-    results = _backtest_results.get(strategy_name)
-    if not results:
-        results_path = Path(f"reports/{strategy_name}_results.json")
-        if results_path.exists():
-            try:
-                async with aiofiles.open(results_path, mode='r') as f:
-                    content = await f.read()
-                    return json.loads(content)
-            except:
-                pass
-        
-        raise HTTPException(status_code=404, detail="No results found")
+    results = backtest_registry.get(strategy_name).results
+    if results:
+        # Each completed run has its own id and completion time
+        etag = weak_etag(strategy_name, results.get("backtest_id"), results.get("completed_at"))
+    else:
+        results, etag = await run_in_threadpool(_load_results_with_etag_sync, strategy_name)
+        if results is None:
+            raise HTTPException(status_code=404, detail="No results found")
+    
+    # Serialize and compress once per set of results, not per poll
+    encoded = _results_bodies.get(strategy_name)
+    if encoded is None or encoded[0] != etag:
+        encoded = (etag, await run_in_threadpool(_encode_results_sync, results))
+        _results_bodies[strategy_name] = encoded
     
-    return results
+    response = encoded_response(request, encoded[1])
+    return not_modified(request, response, etag, cache_control=STRATEGY_CACHE_CONTROL) or response
 
 
-@router.get("/compare/all")
-async def compare_all_strategies() -> Dict[str, Any]:
-    """Compare performance of all strategies."""
-    comparison = []
+@router.head("/{strategy_name}/results")
+async def head_backtest_results(strategy_name: str, request: Request) -> Response:
+    """
+    Check for results without transferring or parsing them.
     
-    async def _load_strategy_result(name):
-        res = _backtest_results.get(name)
-        if not res:
-            p = Path(f"reports/{name}_results.json")
-            if p.exists():
-                try:
-                    async with aiofiles.open(p, mode='r') as f:
-                        content = await f.read()
-                        res = json.loads(content)
-                except:
-                    return None
-        return name, res
-
-    tasks = [_load_strategy_result(name) for name in STRATEGY_CATALOG.keys()]
-    loaded = await asyncio.gather(*tasks)
+    Carries the same ETag, Vary and Cache-Control as GET, so pollers can HEAD
+    until it changes. Content-Length and Content-Encoding are those of the
+    body GET would serve, when it is already encoded; saved results also
+    report the file's Last-Modified.
+    """
+    results = backtest_registry.get(strategy_name).results
+    last_modified = None
+    if results:
+        etag = weak_etag(strategy_name, results.get("backtest_id"), results.get("completed_at"))
+    else:
+        path = _results_path(strategy_name)
+        try:
+            st = await run_in_threadpool(path.stat)
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail="No results found")
+        etag = weak_etag(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        last_modified = formatdate(st.st_mtime, usegmt=True)
     
-    for name, results in loaded:
-        if results and "metrics" in results:
-            metrics = results["metrics"]
-            comparison.append({
-                "strategy": name,
-                "category": STRATEGY_CATALOG[name]["category"],
-                "final_value": results.get("final_value", 0),
-                "total_return": metrics.get("total_return", "N/A"),
-                "cagr": metrics.get("cagr", "N/A"),
-                "sharpe_ratio": metrics.get("sharpe_ratio", "N/A")
-            })
+    # GET re-encodes the results, so the file size is not its length
+    encoded = _results_bodies.get(strategy_name)
+    response = encoded_head_response(request, encoded[1] if encoded is not None and encoded[0] == etag else None)
+    if last_modified:
+        response.headers["Last-Modified"] = last_modified
     
+    return not_modified(request, response, etag, cache_control=STRATEGY_CACHE_CONTROL) or response
+
+
+def _comparison_entry(name: str, results: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Headline figures for one strategy, or None if it has no metrics yet."""
+    if not results or "metrics" not in results:
+        return None
+    metrics = results["metrics"]
     return {
-        "comparison": comparison,
-        "generated_at": datetime.now().isoformat(),
-        "strategies_compared": len(comparison)
+        "strategy": name,
+        "category": STRATEGY_CATALOG[name]["category"],
+        "final_value": results.get("final_value", 0),
+        "total_return": metrics.get("total_return", "N/A"),
+        "cagr": metrics.get("cagr", "N/A"),
+        "sharpe_ratio": metrics.get("sharpe_ratio", "N/A")
     }
+
+
+@router.get("/compare/all")
+async def compare_all_strategies() -> StreamingResponse:
+    """Compare performance of all strategies."""
+    # Whatever isn't in memory is loaded in one threadpool hop, not one per file
+    # One snapshot for the whole response: a run completing mid-stream can't mix in
+    entries = backtest_registry.snapshot
+    in_memory = {name: entry.results for name, entry in entries.items() if entry.results}
+    missing = [name for name in STRATEGY_CATALOG if name not in in_memory]
+    loaded_files = await run_in_threadpool(_bulk_load_results, missing) if missing else {}
+    
+    async def _stream():
+        # Encode one strategy at a time instead of materializing the whole body
+        yield b'{"comparison":['
+        compared = 0
+        for name in STRATEGY_CATALOG:
+            entry = _comparison_entry(name, in_memory.get(name) or loaded_files.get(name))
+            if entry is None:
+                continue
+            if compared:
+                yield b','
+            yield orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY)
+            compared += 1
+        yield b'],"generated_at":' + orjson.dumps(_now_iso())
+        yield b',"strategies_compared":' + str(compared).encode() + b'}'
+    
+    return StreamingResponse(_stream(), media_type="application/json")
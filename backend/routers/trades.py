@@ -5,16 +5,19 @@ RESTful API endpoints for trade operations.
 Refactored to support full async operations.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional
+from typing import AsyncIterator, Optional
 from datetime import datetime
+import orjson
 
-from ..database.connection import get_async_db
+from ..database.connection import get_async_db, AsyncSessionLocal
 from ..database.schemas import (
     TradeCreate, TradeUpdate, TradeResponse, TradeListResponse,
     PortfolioMetrics, DashboardSummary, TradeStatsResponse
 )
+from ..repositories.trade_repository import TradeRepository
 from ..services.trade_service import TradeService
 
 router = APIRouter(prefix="/api/trades", tags=["trades"])
@@ -22,8 +25,14 @@ router = APIRouter(prefix="/api/trades", tags=["trades"])
 
 # ============== Dependencies ==============
 
-async def get_trade_service(db: AsyncSession = Depends(get_async_db)) -> TradeService:
-    """Dependency injection for TradeService (Async)."""
+async def get_trade_service(db: AsyncSession = Depends(get_async_db, scope="function")) -> TradeService:
+    """
+    Dependency injection for TradeService (Async).
+    
+    The session is function-scoped so the request transaction commits before
+    the response is sent; a failed commit becomes an error response instead
+    of following a success status.
+    """
     return TradeService(db)
 
 
@@ -60,7 +69,8 @@ async def get_trades(
     """
     Get paginated list of trades with optional filters.
     """
-    return await service.get_trades(
+    # Rows are plain column dicts; returning a Response skips response_model re-validation
+    raw = await service.get_trades_raw(
         page=page,
         page_size=page_size,
         ticker=ticker,
@@ -71,6 +81,26 @@ async def get_trades(
         sort_by=sort_by,
         sort_desc=sort_desc
     )
+    return Response(orjson.dumps(raw), media_type="application/json")
+
+
+async def _ndjson_open_positions() -> AsyncIterator[str]:
+    """Yield open positions as NDJSON lines from a server-side cursor."""
+    # Own session: the stream outlives the request-scoped dependency
+    async with AsyncSessionLocal() as db:
+        async for trade in TradeRepository(db).stream_open_positions():
+            yield TradeResponse.model_validate(trade).model_dump_json() + "\n"
+
+
+@router.get("/positions/stream")
+async def stream_open_positions():
+    """
+    Stream all open positions as newline-delimited JSON.
+    
+    Intended for large books; GET /api/trades/?status=OPEN remains the
+    paginated option.
+    """
+    return StreamingResponse(_ndjson_open_positions(), media_type="application/x-ndjson")
 
 
 @router.get("/{trade_id}", response_model=TradeResponse)
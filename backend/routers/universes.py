@@ -6,23 +6,59 @@ Refactored to support full async operations.
 """
 
 import sys
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.concurrency import run_in_threadpool
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
 # Add parent path for strategy imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from strategy.stock_universe import (
-    get_universe_tickers,
-    get_universe_info,
-    list_universes
-)
+from strategy.stock_universe import list_universes
+
+try:
+    from backend.utils.http_cache import EncodedBody, encoded_response, not_modified, precompress, weak_etag
+    from backend.utils.universe_cache import get_cached_universe_info, get_cached_universe_tickers, prime_universe_info, universe_cache_generation
+except ImportError:
+    from utils.http_cache import EncodedBody, encoded_response, not_modified, precompress, weak_etag
+    from utils.universe_cache import get_cached_universe_info, get_cached_universe_tickers, prime_universe_info, universe_cache_generation
 
 router = APIRouter(prefix="/api/universes", tags=["universes"])
 
+# The universe listing, indexed by region and pre-encoded, is kept until the
+# shared universe cache is invalidated (per-universe lookups live there).
+_universe_list_cache: Optional[List[Dict[str, Any]]] = None
+_universe_list_generation: Optional[int] = None
+_universes_by_region: Dict[str, List[Dict[str, Any]]] = {}
+_universe_list_body: Optional[EncodedBody] = None
+_universe_list_etag: Optional[str] = None
+
+# Universe metadata only changes on deploy
+UNIVERSE_CACHE_CONTROL = "max-age=30"
+
+
+async def get_cached_universe_list() -> List[Dict[str, Any]]:
+    """Metadata for every universe, loaded in the threadpool on first use."""
+    global _universe_list_cache, _universe_list_generation, _universe_list_body, _universe_list_etag
+    generation = universe_cache_generation()
+    if _universe_list_cache is None or _universe_list_generation != generation:
+        universes = await run_in_threadpool(list_universes)
+        # The listing response is fixed until invalidated: validate and encode it once
+        body = _UNIVERSE_LIST_ADAPTER.dump_json(
+            _UNIVERSE_LIST_ADAPTER.validate_python({"universes": universes, "count": len(universes)})
+        )
+        _universe_list_body = precompress(body)
+        _universe_list_etag = weak_etag(body)
+        prime_universe_info(universes)
+        # Region filter becomes a dict lookup
+        _universes_by_region.clear()
+        for u in universes:
+            _universes_by_region.setdefault(u["region"], []).append(u)
+        _universe_list_cache = universes
+        _universe_list_generation = generation
+    return _universe_list_cache
+
 
 class UniverseInfo(BaseModel):
     """Information about a stock universe."""
@@ -52,22 +88,24 @@ class TickerListResponse(BaseModel):
     count: int
 
 
+_UNIVERSE_LIST_ADAPTER = TypeAdapter(UniverseListResponse)
+
+
 @router.get("/", response_model=UniverseListResponse)
-async def get_universes():
+async def get_universes(request: Request):
     """List all available stock universes."""
-    universes = await run_in_threadpool(list_universes)
-    return UniverseListResponse(
-        universes=[UniverseInfo(**u) for u in universes],
-        count=len(universes)
-    )
+    await get_cached_universe_list()
+    
+    response = encoded_response(request, _universe_list_body)
+    return not_modified(request, response, _universe_list_etag, cache_control=UNIVERSE_CACHE_CONTROL) or response
 
 
 @router.get("/{universe_key}", response_model=UniverseDetail)
 async def get_universe(universe_key: str):
     """Get detailed information about a specific universe."""
     try:
-        info = await run_in_threadpool(get_universe_info, universe_key)
-        tickers = await run_in_threadpool(get_universe_tickers, universe_key)
+        info = await get_cached_universe_info(universe_key)
+        tickers = await get_cached_universe_tickers(universe_key)
         return UniverseDetail(
             **info,
             tickers=tickers
@@ -80,7 +118,7 @@ async def get_universe(universe_key: str):
 async def get_universe_ticker_list(universe_key: str):
     """Get just the ticker list for a universe."""
     try:
-        tickers = await run_in_threadpool(get_universe_tickers, universe_key)
+        tickers = await get_cached_universe_tickers(universe_key)
         return TickerListResponse(
             universe=universe_key,
             tickers=tickers,
@@ -94,8 +132,8 @@ async def get_universe_ticker_list(universe_key: str):
 async def get_universes_by_region(region: str) -> Dict[str, Any]:
     """Get universes filtered by region."""
     region_upper = region.upper()
-    all_universes = await run_in_threadpool(list_universes)
-    universes = [u for u in all_universes if u["region"] == region_upper]
+    await get_cached_universe_list()
+    universes = _universes_by_region.get(region_upper)
     
     if not universes:
         raise HTTPException(status_code=404, detail=f"No universes found for region '{region}'")
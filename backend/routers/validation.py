@@ -7,16 +7,24 @@ Calculates real PSR/DSR from backtest results and price data.
 
 from fastapi import APIRouter, HTTPException
 from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Iterable, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
+import functools
 import json
+import os
 import asyncio
-import aiofiles
+import hashlib
 import logging
+import orjson
+import threading
 
 # Import validation functions
 import sys
@@ -36,6 +44,46 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 REPORTS_DIR = PROJECT_ROOT / "reports"
 CACHE_DIR = PROJECT_ROOT / "cache"
+PRICE_PATH = CACHE_DIR / "us_prices_close.parquet"
+
+# Validated strategies: (name, results hash, price file stat, n_trials) -> result.
+# A changed results file or price cache gives a new key, so entries never go stale.
+VALIDATION_CACHE_SIZE = 512
+_VALIDATION_CACHE: Dict[Tuple[str, str, Optional[Tuple[int, int]], int], Optional[Dict[str, Any]]] = {}
+
+# Sorted validations for the whole reports directory, keyed by every results
+# file's (name, mtime_ns, size) and the price file stat; None if there were no
+# results. Steady-state requests cost a directory scan, not a parse per file.
+_RESPONSE_CACHE: Optional[Tuple[Tuple[Any, ...], Optional[List[Dict[str, Any]]]]] = None
+
+# Parsed price panel, keyed by the (mtime_ns, size) it was read at and the tickers
+# requested (None for all); prices update at most daily.
+# Validations run in the threadpool, so concurrent requests share one read via the lock.
+_PRICE_CACHE: Optional[Tuple[Tuple[Tuple[int, int], Optional[FrozenSet[str]]], pd.DataFrame]] = None
+_PRICE_CACHE_LOCK = threading.Lock()
+# Returns panel derived from the cached prices, keyed by the DataFrame it was built from
+_PANEL_CACHE: Optional[Tuple[pd.DataFrame, "PricePanel"]] = None
+
+# Validating a strategy is CPU-bound NumPy/pandas work that holds the GIL;
+# spread strategies across worker processes instead of one thread
+MAX_VALIDATION_WORKERS = os.cpu_count() or 4
+_validation_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_validation_pool() -> ProcessPoolExecutor:
+    """Process pool for strategy validations, created on first use."""
+    global _validation_pool
+    if _validation_pool is None:
+        _validation_pool = ProcessPoolExecutor(max_workers=MAX_VALIDATION_WORKERS)
+    return _validation_pool
+
+
+def shutdown_validation_pool() -> None:
+    """Stop the validation workers, dropping queued validations."""
+    global _validation_pool
+    if _validation_pool is not None:
+        _validation_pool.shutdown(wait=False, cancel_futures=True)
+        _validation_pool = None
 
 
 # === Response Models ===
@@ -69,19 +117,60 @@ class ValidationResponse(BaseModel):
 
 # === Helper Functions ===
 
-async def _load_json_async(filepath: Path) -> Optional[Dict]:
-    """Load a JSON file asynchronously."""
-    if not filepath.exists():
+def _load_json_sync(filepath: Path) -> Optional[Dict]:
+    """Read and parse a JSON file in one go. Must run in thread pool."""
+    # Open directly; an exists() pre-check is a second stat for the same answer
+    try:
+        content = filepath.read_bytes()
+    except FileNotFoundError:
+        return None
+    except IOError as e:
+        logger.warning("Error loading %s: %s", filepath, e)
         return None
     try:
-        async with aiofiles.open(filepath, mode="r") as f:
-            content = await f.read()
-            return json.loads(content)
-    except (json.JSONDecodeError, IOError) as e:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        pass
+    try:
+        # Reports written by json.dump may hold NaN literals, which orjson rejects
+        return json.loads(content)
+    except json.JSONDecodeError as e:
         logger.warning("Error loading %s: %s", filepath, e)
         return None
 
 
+async def _load_json_async(filepath: Path) -> Optional[Dict]:
+    """Load a JSON file asynchronously, with a single threadpool hop for open, read and parse."""
+    return await run_in_threadpool(_load_json_sync, filepath)
+
+
+def _list_result_files() -> List[Path]:
+    """*_results.json files in the reports directory, from a single directory scan."""
+    # scandir reuses the dirent type, instead of glob's pattern matching and per-entry Paths
+    try:
+        with os.scandir(REPORTS_DIR) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if entry.name.endswith("_results.json") and entry.is_file(follow_symlinks=False)
+            ]
+    except FileNotFoundError:
+        return []
+
+
+def _reports_signature() -> Tuple[Tuple[str, int, int], ...]:
+    """(name, mtime_ns, size) of every results file, sorted; changes whenever any is written."""
+    signature = []
+    try:
+        with os.scandir(REPORTS_DIR) as entries:
+            for entry in entries:
+                if entry.name.endswith("_results.json") and entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    signature.append((entry.name, st.st_mtime_ns, st.st_size))
+    except FileNotFoundError:
+        pass
+    return tuple(sorted(signature))
+
+
 async def _load_all_strategy_results() -> Dict[str, Any]:
     """
     Load all strategy results from reports directory.
@@ -90,11 +179,8 @@ async def _load_all_strategy_results() -> Dict[str, Any]:
     """
     results = {}
 
-    if not REPORTS_DIR.exists():
-        return results
-
-    # Load individual *_results.json files in parallel
-    result_files = list(REPORTS_DIR.glob("*_results.json"))
+    # Load individual *_results.json files in parallel (none if the directory is missing)
+    result_files = _list_result_files()
 
     async def _load_one(fpath: Path):
         data = await _load_json_async(fpath)
@@ -118,21 +204,113 @@ async def _load_all_strategy_results() -> Dict[str, Any]:
     return results
 
 
-def _load_price_data() -> Optional[pd.DataFrame]:
-    """Load close price data from parquet cache. Must run in thread pool."""
-    price_path = CACHE_DIR / "us_prices_close.parquet"
-    if not price_path.exists():
+def _load_price_data(columns: Optional[Iterable[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Load close price data from parquet cache. Must run in thread pool.
+    
+    Only the given ticker columns (all if None) are read: Parquet is
+    columnar, so unused tickers are neither read nor decoded. Tickers
+    missing from the file are skipped.
+    
+    The parsed DataFrame is kept until the file's mtime or size or the
+    requested tickers change, so repeat calls cost a stat. It is shared;
+    callers must not mutate it.
+    """
+    global _PRICE_CACHE
+    price_path = PRICE_PATH
+    version = _price_data_version()
+    if version is None:
         logger.warning("Price cache not found at %s", price_path)
         return None
+    
+    key = (version, frozenset(columns) if columns is not None else None)
+    with _PRICE_CACHE_LOCK:
+        if _PRICE_CACHE is not None and _PRICE_CACHE[0] == key:
+            return _PRICE_CACHE[1]
+        try:
+            if key[1] is None:
+                read_columns = None
+            else:
+                # The reader rejects unknown columns; project onto those in the file
+                in_file = set(pq.read_schema(price_path).names)
+                read_columns = sorted(key[1] & in_file)
+            # Column chunks decode in parallel on Arrow's pool; self_destruct frees
+            # each Arrow buffer as pandas takes it over, so peak memory stays ~1x
+            table = pq.read_table(price_path, columns=read_columns, use_threads=True, use_pandas_metadata=True)
+            prices = table.to_pandas(self_destruct=True, split_blocks=True)
+            del table
+        except FileNotFoundError:
+            logger.warning("Price cache not found at %s", price_path)
+            return None
+        except Exception as e:
+            logger.warning("Error loading price data: %s", e)
+            return None
+        _PRICE_CACHE = (key, prices)
+        return prices
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """Close prices as arrays, with daily returns precomputed for every ticker."""
+    index: pd.Index
+    columns: Dict[str, int]  # ticker -> column position
+    has_price: np.ndarray  # days x tickers: a raw (unfilled) price exists
+    returns: np.ndarray  # days x tickers: pct change of forward-filled prices, 0 where undefined
+
+
+def _price_panel(prices: pd.DataFrame) -> PricePanel:
+    """Forward-fill and difference the whole panel once, for every strategy to share."""
+    raw = prices.to_numpy(dtype=np.float64)
+    has_price = ~np.isnan(raw)
+    # Forward-fill as a gather: each cell takes the row of its column's last
+    # price (leading gaps point at row 0 and stay NaN, as with DataFrame.ffill)
+    last_row = np.where(has_price, np.arange(len(raw))[:, None], 0)
+    np.maximum.accumulate(last_row, axis=0, out=last_row)
+    filled = np.take_along_axis(raw, last_row, axis=0)
+    returns = np.empty_like(filled)
+    returns[0] = 0.0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(filled[1:], filled[:-1], out=returns[1:])
+    returns[1:] -= 1
+    # Missing ticker returns count as 0 for that day; filled once here, not per strategy
+    returns[np.isnan(returns)] = 0.0
+    return PricePanel(
+        index=prices.index,
+        columns={ticker: i for i, ticker in enumerate(prices.columns)},
+        has_price=has_price,
+        returns=returns,
+    )
+
+
+def _load_price_panel(tickers: Optional[Iterable[str]] = None) -> Optional[PricePanel]:
+    """Price panel for the given tickers, rebuilt only when the cached prices change."""
+    global _PANEL_CACHE
+    prices = _load_price_data(tickers)
+    if prices is None:
+        return None
+    with _PRICE_CACHE_LOCK:
+        if _PANEL_CACHE is None or _PANEL_CACHE[0] is not prices:
+            _PANEL_CACHE = (prices, _price_panel(prices))
+        return _PANEL_CACHE[1]
+
+
+def _price_data_version() -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) of the price cache, or None if it is missing."""
     try:
-        return pd.read_parquet(price_path)
-    except Exception as e:
-        logger.warning("Error loading price data: %s", e)
+        st = PRICE_PATH.stat()
+    except OSError:
         return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _results_hash(data: Dict[str, Any]) -> str:
+    """Fingerprint of one strategy's results, independent of key order."""
+    content = orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(content, digest_size=16).hexdigest()
 
 
 def _compute_portfolio_returns(
-    weights: Dict[str, float], prices: pd.DataFrame
+    weights: Dict[str, float], prices: PricePanel
 ) -> Optional[pd.Series]:
     """
     Compute daily portfolio returns from ticker weights and price data.
@@ -141,27 +319,26 @@ def _compute_portfolio_returns(
     available_tickers = [t for t in weights if t in prices.columns]
     if not available_tickers:
         return None
+    cols = np.fromiter((prices.columns[t] for t in available_tickers), dtype=np.intp, count=len(available_tickers))
 
-    # Subset prices to available tickers and drop rows with all NaN
-    sub_prices = prices[available_tickers].dropna(how="all")
-    if len(sub_prices) < 10:
+    # Days on which at least one available ticker has a price
+    days = np.flatnonzero(prices.has_price[:, cols].any(axis=1))
+    if len(days) < 10:
         return None
 
-    # Forward-fill gaps, then compute daily returns
-    sub_prices = sub_prices.ffill()
-    daily_returns = sub_prices.pct_change().dropna(how="all")
-
     # Re-normalise weights to available tickers only
     total_w = sum(weights[t] for t in available_tickers)
     if total_w == 0:
         return None
-    norm_weights = {t: weights[t] / total_w for t in available_tickers}
+    norm_weights = np.fromiter(
+        (weights[t] / total_w for t in available_tickers), dtype=np.float64, count=len(available_tickers)
+    )
 
-    # Weighted portfolio return
-    weight_series = pd.Series(norm_weights)
-    # Align: fill missing ticker returns with 0 for that day
-    portfolio_returns = daily_returns[available_tickers].fillna(0).dot(weight_series)
-    portfolio_returns = portfolio_returns.dropna()
+    # The first priced day has nothing to return from. Prices are forward-filled,
+    # so each later day's return is against the previous priced day, skipped days or not.
+    days = days[1:]
+    returns_arr = prices.returns[np.ix_(days, cols)]
+    portfolio_returns = pd.Series(returns_arr @ norm_weights, index=prices.index[days]).dropna()
 
     if len(portfolio_returns) < 10:
         return None
@@ -169,6 +346,13 @@ def _compute_portfolio_returns(
     return portfolio_returns
 
 
+def _format_dates(index: pd.Index) -> List[str]:
+    """Chart labels for index values: YYYY-MM-DD for dates, str() otherwise."""
+    if isinstance(index, pd.DatetimeIndex):
+        return index.strftime("%Y-%m-%d").tolist()
+    return [d.strftime("%Y-%m-%d") if hasattr(d, "strftime") else str(d) for d in index]
+
+
 def _parse_metric_string(value: Any) -> Optional[float]:
     """Parse a metric value that might be a string like '1.046' or '25.63%'."""
     if value is None:
@@ -185,25 +369,97 @@ def _parse_metric_string(value: Any) -> Optional[float]:
 def _calc_sortino(returns: pd.Series, risk_free_rate: float = 0.0) -> float:
     """Calculate annualised Sortino ratio from daily returns."""
     daily_rf = (1 + risk_free_rate) ** (1 / 252) - 1
-    excess = returns - daily_rf
+    excess = returns.to_numpy(dtype=np.float64) - daily_rf
     downside = excess[excess < 0]
-    if len(downside) == 0 or downside.std() == 0:
+    if len(downside) < 2:
+        return 0.0
+    downside_std = downside.std(ddof=1)
+    if downside_std == 0:
         return 0.0
-    return (excess.mean() / downside.std()) * np.sqrt(252)
+    return float(excess.mean() / downside_std * np.sqrt(252))
+
+
+# Regime codes, in the order regime_performance reports them
+REGIME_NAMES = np.array(["BULL", "BEAR", "HIGH_VOL", "SIDEWAYS"])
+BULL, BEAR, HIGH_VOL, SIDEWAYS = range(len(REGIME_NAMES))
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sum of each full trailing window, from one prefix sum (O(n) for any window)."""
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    return csum[window:] - csum[:-window]
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window mean, NaN until the first full window."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = _window_sums(values, window) / window
+    return out
+
+
+def _rolling_std(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing-window sample std, NaN until the first full window."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        # Shift by the overall mean first so the sum-of-squares form doesn't cancel
+        centered = values - values.mean()
+        s1 = _window_sums(centered, window)
+        s2 = _window_sums(centered * centered, window)
+        var = (s2 - s1 * s1 / window) / (window - 1)
+        out[window - 1:] = np.sqrt(np.maximum(var, 0.0))
+    return out
+
+
+def _classify_regimes(returns: np.ndarray, cumulative: np.ndarray) -> np.ndarray:
+    """
+    Regime code per day from daily returns and the equity curve.
+    
+    HIGH_VOL where 21-day annualised volatility exceeds 1.5x its average;
+    otherwise BULL above the equity curve's 50-day SMA and BEAR at or below
+    it. Days without enough history stay SIDEWAYS.
+    """
+    rolling_vol = _rolling_std(returns, 21) * np.sqrt(252)
+    sma_50 = _rolling_mean(cumulative, 50)
+    
+    is_high_vol = np.zeros(len(returns), dtype=bool)
+    if not np.isnan(rolling_vol).all():
+        avg_vol = np.nanmean(rolling_vol)
+        if avg_vol > 0:
+            is_high_vol = rolling_vol > avg_vol * 1.5
+    
+    # We classify based on Equity Curve Trend (Strategy Momentum)
+    # This shows if the strategy is "performing" (Bull) or "underwater" (Bear).
+    # Comparisons against the NaN SMA head are False, leaving those days SIDEWAYS.
+    return np.select(
+        [is_high_vol, cumulative > sma_50, cumulative <= sma_50],
+        [HIGH_VOL, BULL, BEAR],
+        default=SIDEWAYS,
+    ).astype(np.int8)
+
+
+def _log_drawdown(returns: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Log growth of 1 and its log distance below the running peak (<= 0).
+    
+    Compounding as a sum of log1p returns avoids cumprod's accumulated
+    rounding; a total loss gives -inf, i.e. a drawdown of -100%.
+    """
+    with np.errstate(divide="ignore"):
+        log_cumulative = np.cumsum(np.log1p(returns.to_numpy(dtype=np.float64)))
+    return log_cumulative, log_cumulative - np.maximum.accumulate(log_cumulative)
 
 
-def _calc_max_drawdown(returns: pd.Series) -> float:
-    """Calculate max drawdown from daily returns. Returns negative value."""
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.cummax()
-    drawdown = (cumulative - running_max) / running_max
-    return float(drawdown.min())
+def _equity_and_drawdown(returns: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+    """Cumulative growth of 1 and the drawdown from its running peak, as arrays."""
+    log_cumulative, log_drawdown = _log_drawdown(returns)
+    return np.exp(log_cumulative), np.expm1(log_drawdown)
 
 
 def _validate_single_strategy(
     name: str,
     data: Dict[str, Any],
-    prices: Optional[pd.DataFrame],
+    prices: Optional[PricePanel],
     n_trials: int,
 ) -> Optional[Dict[str, Any]]:
     """
@@ -254,7 +510,9 @@ def _validate_single_strategy(
 
         sharpe_annual = validation["sharpe_ratio_annual"]
         sortino = _calc_sortino(portfolio_returns)
-        max_dd = _calc_max_drawdown(portfolio_returns)
+        # Equity and drawdown arrays are shared by the metrics, regimes and series below
+        cumulative_arr, drawdown_arr = _equity_and_drawdown(portfolio_returns)
+        max_dd = float(drawdown_arr.min())
         volatility = portfolio_returns.std() * np.sqrt(252)
         psr = validation["probabilistic_sr"]
         dsr = validation["deflated_sr"]
@@ -276,92 +534,89 @@ def _validate_single_strategy(
         is_significant = bool(dsr > 0.90) # Lower threshold slightly for realism
         confidence = "HIGH" if dsr > 0.95 else "MEDIUM" if dsr > 0.70 else "LOW"
         
-        # Calculate returns
-        total_return = (1 + portfolio_returns).prod() - 1
-        cagr = (1 + total_return) ** (252 / len(portfolio_returns)) - 1 if len(portfolio_returns) > 0 else 0
+        # Calculate returns; the equity curve's last point is the compounded total
+        returns_arr = portfolio_returns.to_numpy(dtype=np.float64)
+        total_return = cumulative_arr[-1] - 1
+        cagr = (1 + total_return) ** (252 / len(returns_arr)) - 1
+        win_rate = np.count_nonzero(returns_arr > 0) / len(returns_arr)
+        calmar = cagr / abs(max_dd) if max_dd != 0 else 0.0
+        
+        # Round every headline figure in one call
+        (
+            cagr_r, win_rate_r, total_return_r, max_dd_r, volatility_r, sharpe_r, sortino_r, calmar_r
+        ) = np.round(
+            [cagr, win_rate, total_return, max_dd, volatility, sharpe_annual, sortino, calmar], 4
+        ).tolist()
         
         returns_dict = {
-            "cagr": round(float(cagr), 4),
-            "win_rate": round(float((portfolio_returns > 0).sum() / len(portfolio_returns)), 4),
-            "total_return": round(float(total_return), 4),
+            "cagr": cagr_r,
+            "win_rate": win_rate_r,
+            "total_return": total_return_r,
         }
         
         risk_dict = {
-            "max_drawdown": round(float(max_dd), 4),
+            "max_drawdown": max_dd_r,
             "tail_ratio": 0.0,
-            "volatility": round(float(volatility), 4),
+            "volatility": volatility_r,
         }
         
         efficiency_dict = {
-            "sharpe": round(float(sharpe_annual), 4),
-            "sortino": round(float(sortino), 4),
-            "calmar": round(float(cagr / abs(max_dd)) if max_dd != 0 else 0.0, 4),
+            "sharpe": sharpe_r,
+            "sortino": sortino_r,
+            "calmar": calmar_r,
         }
         
         # --- Regime Detection ---
-        cumulative_series = (1 + portfolio_returns).cumprod()
-        rolling_vol = portfolio_returns.rolling(window=21).std() * np.sqrt(252)
-        avg_vol = rolling_vol.mean()
-        sma_50 = cumulative_series.rolling(window=50).mean()
+        regime_codes = _classify_regimes(returns_arr, cumulative_arr)
         
-        # Define Regimes: Start with SIDEWAYS
-        regime_series = pd.Series("SIDEWAYS", index=portfolio_returns.index)
-        
-        # High Volatility Regime
-        if avg_vol > 0:
-            is_high_vol = rolling_vol > (avg_vol * 1.5)
-            regime_series[is_high_vol] = "HIGH_VOL"
-        
-        # Trending Regimes (where not High Vol)
-        # We classify based on Equity Curve Trend (Strategy Momentum)
-        # This shows if the strategy is "performing" (Bull) or "underwater" (Bear)
-        not_high_vol = regime_series != "HIGH_VOL"
-        is_bull = (cumulative_series > sma_50) & not_high_vol
-        is_bear = (cumulative_series <= sma_50) & not_high_vol
-        
-        regime_series[is_bull] = "BULL"
-        regime_series[is_bear] = "BEAR"
+        # Calculate Regime Performance Stats: every regime's count, mean, std and
+        # compounded return from grouped sums, instead of one masked pass each
+        n_regimes = len(REGIME_NAMES)
+        days = np.bincount(regime_codes, minlength=n_regimes)
+        safe_days = np.maximum(days, 1)
+        r_mean = np.bincount(regime_codes, weights=returns_arr, minlength=n_regimes) / safe_days
+        deviations = returns_arr - r_mean[regime_codes]
+        r_std = np.sqrt(
+            np.bincount(regime_codes, weights=deviations * deviations, minlength=n_regimes)
+            / np.maximum(days - 1, 1)
+        )
+        r_sharpe = np.divide(r_mean, r_std, out=np.zeros(n_regimes), where=r_std != 0)
+        r_tot = np.expm1(np.bincount(regime_codes, weights=np.log1p(returns_arr), minlength=n_regimes))
         
-        # Calculate Regime Performance Stats
-        for r_name in ["BULL", "BEAR", "HIGH_VOL", "SIDEWAYS"]:
-            # Boolean indexing
-            mask = regime_series == r_name
-            r_returns = portfolio_returns[mask]
-            
-            if len(r_returns) > 5: # Min samples
-                r_sharpe = float(estimated_sharpe_ratio(r_returns))
-                r_tot = (1 + r_returns).prod() - 1
-                
+        for r_name, r_days, r_sharpe_r, r_tot_r in zip(
+            REGIME_NAMES.tolist(), days.tolist(), np.round(r_sharpe, 2).tolist(), np.round(r_tot, 4).tolist()
+        ):
+            if r_days > 5: # Min samples
                 regime_performance.append({
                     "regime": r_name,
-                    "sharpe": round(r_sharpe, 2),
-                    "return_pct": round(float(r_tot), 4),
-                    "days": len(r_returns)
+                    "sharpe": r_sharpe_r,
+                    "return_pct": r_tot_r,
+                    "days": r_days
                 })
         
-        # Build equity curve with regime info
-        cumulative = (1 + portfolio_returns).cumprod()
-        # Downsample for big datasets to keep JSON size manageable (max 1000 points)
-        step = max(1, len(cumulative) // 1000)
-        
-        for date, value in cumulative.iloc[::step].items():
-            r_val = regime_series.get(date, "SIDEWAYS")
-            equity_curve.append({
-                "date": date.strftime("%Y-%m-%d") if hasattr(date, 'strftime') else str(date),
-                "value": round(float(value), 4),
-                "regime": str(r_val)
-            })
+        # Build equity curve with regime info and the drawdown series.
+        # Downsample on the arrays first (max 1000 / 200 points to keep JSON size
+        # manageable), so only the kept points become Python objects.
+        # Stride slices are views: nothing is copied until the kept points are rounded
+        n_days = len(cumulative_arr)
+        eq_step = slice(None, None, max(1, n_days // 1000))
+        equity_curve = [
+            {"date": date, "value": value, "regime": regime}
+            for date, value, regime in zip(
+                _format_dates(portfolio_returns.index[eq_step]),
+                np.round(cumulative_arr[eq_step], 4).tolist(),
+                REGIME_NAMES[regime_codes[eq_step]].tolist(),
+            )
+        ]
         
-        # Build drawdown series
-        running_max = cumulative.cummax()
-        drawdown = (cumulative - running_max) / running_max
-        # Downsample drawdown
-        step_dd = max(1, len(drawdown) // 200) 
-        for date, dd in drawdown.iloc[::step_dd].items():
-            drawdown_series.append({
-                "date": date.strftime("%Y-%m-%d") if hasattr(date, 'strftime') else str(date),
-                "drawdown": round(float(dd), 4),
-            })
+        dd_step = slice(None, None, max(1, n_days // 200))
+        drawdown_series = [
+            {"date": date, "drawdown": dd}
+            for date, dd in zip(
+                _format_dates(portfolio_returns.index[dd_step]),
+                np.round(drawdown_arr[dd_step], 4).tolist(),
+            )
+        ]
         
     elif reported_sharpe is not None:
         # --- Fallback: use reported metrics with synthetic DSR ---
@@ -432,51 +687,134 @@ def _validate_single_strategy(
     }
 
 
-async def _build_validation_response(
+def _validate_in_worker(
+    name: str,
+    data: Dict[str, Any],
+    tickers: FrozenSet[str],
+    n_trials: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Validate one strategy in a pool worker.
+    
+    Prices are read through the worker's own price cache rather than
+    pickled with every job, so each worker decodes the panel and computes
+    its returns once for all the strategies it validates.
+    """
+    return _validate_single_strategy(name, data, _load_price_panel(tickers), n_trials)
+
+
+def _stream_validation_response(validated_list: List[Dict[str, Any]]) -> StreamingResponse:
+    """
+    Stream a ValidationResponse body one strategy at a time.
+    
+    Validations are built in the StrategyValidation shape, so each is
+    serialized with orjson as-is rather than re-validated through Pydantic,
+    and long equity curves are never joined into one multi-MB body.
+    """
+    accepted = sum(1 for v in validated_list if v["validity"]["is_significant"])
+    rejected = len(validated_list) - accepted
+    generated_at = datetime.now().isoformat()
+
+    async def _stream():
+        yield b'{"strategies":['
+        for i, validated in enumerate(validated_list):
+            if i:
+                yield b','
+            yield orjson.dumps(validated, option=orjson.OPT_SERIALIZE_NUMPY)
+        yield b'],"total_trials_rejected":' + str(rejected).encode()
+        yield b',"total_trials_accepted":' + str(accepted).encode()
+        yield b',"generated_at":' + orjson.dumps(generated_at) + b'}'
+
+    return StreamingResponse(_stream(), media_type="application/json")
+
+
+async def _build_validation_list(
     strategy_results: Dict[str, Any],
-) -> ValidationResponse:
+) -> Tuple[List[Dict[str, Any]], bool]:
     """
-    Build a ValidationResponse from strategy results dict.
-    Loads price data and runs validation in thread pool.
+    Validate a strategy results dict, sorted by Sharpe descending.
+    Strategies not in the validation cache are validated in the process pool.
+    
+    Also returns whether every strategy was validated without error, i.e.
+    whether the list may be cached.
     """
     if not strategy_results:
-        return ValidationResponse(
-            strategies=[],
-            total_trials_accepted=0,
-            total_trials_rejected=0,
-            generated_at=datetime.now().isoformat(),
-        )
+        return [], True
 
     # Total number of strategies found = n_trials for multiple-testing adjustment
     n_trials = len(strategy_results)
 
-    def _do_all_validations():
-        prices = _load_price_data()
-
-        validated = []
-        for name, data in strategy_results.items():
-            try:
-                result = _validate_single_strategy(name, data, prices, n_trials)
-                if result is not None:
-                    validated.append(result)
-            except Exception as e:
-                logger.warning("Validation failed for %s: %s", name, e)
-        return validated
-
-    validated_list = await run_in_threadpool(_do_all_validations)
+    # Only the tickers some strategy holds are read from the price panel
+    tickers = frozenset().union(*(
+        data["weights"] for data in strategy_results.values() if isinstance(data.get("weights"), dict)
+    ))
+
+    # Keys are a stat and a hash per strategy: cheap enough for the event loop,
+    # so a fully cached response never leaves it
+    price_version = _price_data_version()
+    keys = {
+        name: (name, _results_hash(data), price_version, n_trials)
+        for name, data in strategy_results.items()
+    }
+    validated_by_name = {name: _VALIDATION_CACHE[key] for name, key in keys.items() if key in _VALIDATION_CACHE}
+
+    # Strategies are independent: validate the rest in parallel worker processes
+    misses = [name for name in strategy_results if name not in validated_by_name]
+    complete = True
+    if misses:
+        loop = asyncio.get_running_loop()
+        pool = get_validation_pool()
+        outcomes = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, _validate_in_worker, name, strategy_results[name], tickers, n_trials)
+                for name in misses
+            ),
+            return_exceptions=True,
+        )
+        for name, outcome in zip(misses, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Validation failed for %s: %s", name, outcome)
+                complete = False
+                continue
+            if len(_VALIDATION_CACHE) >= VALIDATION_CACHE_SIZE:
+                _VALIDATION_CACHE.pop(next(iter(_VALIDATION_CACHE)), None)
+            _VALIDATION_CACHE[keys[name]] = outcome
+            validated_by_name[name] = outcome
+
+    validated_list = [
+        validated_by_name[name] for name in strategy_results
+        if validated_by_name.get(name) is not None
+    ]
     
     # Sort by Sharpe Descending
     validated_list.sort(key=lambda x: x["efficiency"]["sharpe"], reverse=True)
 
-    accepted = sum(1 for v in validated_list if v["validity"]["is_significant"])
-    rejected = len(validated_list) - accepted
+    return validated_list, complete
 
-    return ValidationResponse(
-        strategies=[StrategyValidation(**v) for v in validated_list],
-        total_trials_accepted=accepted,
-        total_trials_rejected=rejected,
-        generated_at=datetime.now().isoformat(),
-    )
+
+async def _validated_strategies() -> Optional[List[Dict[str, Any]]]:
+    """
+    Validations for all strategies in reports/, or None if there are none.
+    
+    Served from the response cache while no results file or the price cache
+    has changed; otherwise the reports are reloaded and revalidated (mostly
+    from the per-strategy cache).
+    """
+    global _RESPONSE_CACHE
+    # Taken before loading, so a file written mid-load only causes a recompute
+    key = (_reports_signature(), _price_data_version())
+    if _RESPONSE_CACHE is not None and _RESPONSE_CACHE[0] == key:
+        return _RESPONSE_CACHE[1]
+
+    strategy_results = await _load_all_strategy_results()
+    if not strategy_results:
+        validated, complete = None, True
+    else:
+        validated, complete = await _build_validation_list(strategy_results)
+    # Failed validations are retried on the next request
+    if complete:
+        _RESPONSE_CACHE = (key, validated)
+    return validated
 
 
 # === Endpoints ===
@@ -491,8 +829,7 @@ async def get_validated_strategies():
     and computes Deflated Sharpe Ratio and Probabilistic Sharpe Ratio
     for each strategy.
     """
-    strategy_results = await _load_all_strategy_results()
-    return await _build_validation_response(strategy_results)
+    return _stream_validation_response(await _validated_strategies() or [])
 
 
 @router.get("/from-reports", response_model=ValidationResponse)
@@ -505,15 +842,52 @@ async def get_validation_from_reports():
     reconstructs portfolio returns from price cache, and calculates
     real PSR/DSR validation metrics.
     """
-    strategy_results = await _load_all_strategy_results()
+    validated = await _validated_strategies()
 
-    if not strategy_results:
+    if validated is None:
         raise HTTPException(
             status_code=404,
             detail="No strategy results found in reports/ directory. Run backtests first.",
         )
 
-    return await _build_validation_response(strategy_results)
+    return _stream_validation_response(validated)
+
+
+@functools.lru_cache(maxsize=1024)
+def _calculate_dsr_cached(sharpe_ratio: float, n_trials: int, n_samples: int) -> Dict[str, Any]:
+    """
+    DSR/PSR for synthetic returns scaled to a target Sharpe. Runs in thread pool.
+    
+    The returns come from a fixed seed, so the result is a pure function of
+    the inputs and is cached. The returned dict is shared; callers must not
+    mutate it.
+    """
+    # Generate synthetic returns matching the given Sharpe. A private generator
+    # gives the same draws as seeding np.random without touching global state.
+    returns = pd.Series(np.random.RandomState(42).normal(0.001, 0.02, n_samples))
+
+    # Scale to match target Sharpe
+    current_sr = estimated_sharpe_ratio(returns)
+    if current_sr != 0:
+        returns *= sharpe_ratio / current_sr
+
+    # Calculate DSR
+    sr_std = sharpe_ratio_std(returns)
+    dsr = deflated_sharpe_ratio(sharpe_ratio, n_trials, returns)
+    psr = probabilistic_sharpe_ratio(sharpe_ratio, 0.0, sr_std)
+
+    confidence = "HIGH" if dsr > 0.95 else "MEDIUM" if dsr > 0.80 else "LOW"
+
+    return {
+        "sharpe_ratio": sharpe_ratio,
+        "deflated_sharpe_ratio": round(float(dsr), 4),
+        "probabilistic_sharpe_ratio": round(float(psr), 4),
+        "n_trials": n_trials,
+        "n_samples": n_samples,
+        "is_significant": bool(dsr > 0.95),
+        "confidence_level": confidence,
+        "interpretation": f"After testing {n_trials} variations, there is a {dsr * 100:.1f}% probability this strategy's performance is genuine.",
+    }
 
 
 @router.post("/calculate-dsr")
@@ -527,33 +901,5 @@ async def calculate_dsr(
     """
     Calculate Deflated Sharpe Ratio for a strategy.
     """
-
-    def _do_calculation():
-        # Generate synthetic returns matching the given Sharpe
-        np.random.seed(42)
-        returns = pd.Series(np.random.normal(0.001, 0.02, n_samples))
-
-        # Scale to match target Sharpe
-        current_sr = estimated_sharpe_ratio(returns)
-        if current_sr != 0:
-            returns *= sharpe_ratio / current_sr
-
-        # Calculate DSR
-        sr_std = sharpe_ratio_std(returns)
-        dsr = deflated_sharpe_ratio(sharpe_ratio, n_trials, returns)
-        psr = probabilistic_sharpe_ratio(sharpe_ratio, 0.0, sr_std)
-
-        confidence = "HIGH" if dsr > 0.95 else "MEDIUM" if dsr > 0.80 else "LOW"
-
-        return {
-            "sharpe_ratio": sharpe_ratio,
-            "deflated_sharpe_ratio": round(dsr, 4),
-            "probabilistic_sharpe_ratio": round(psr, 4),
-            "n_trials": n_trials,
-            "n_samples": n_samples,
-            "is_significant": dsr > 0.95,
-            "confidence_level": confidence,
-            "interpretation": f"After testing {n_trials} variations, there is a {dsr * 100:.1f}% probability this strategy's performance is genuine.",
-        }
-
-    return await run_in_threadpool(_do_calculation)
+    # Skewness and kurtosis come from the synthetic returns, not these parameters
+    return await run_in_threadpool(_calculate_dsr_cached, sharpe_ratio, n_trials, n_samples)
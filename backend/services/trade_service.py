@@ -7,10 +7,11 @@ Refactored to support full async operations.
 """
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 import math
 import os
+import numpy as np
 
 from ..repositories.trade_repository import TradeRepository
 from ..database.models import Trade, TradeStatus
@@ -22,7 +23,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "strategy"))
 from fast_data_loader import FastDataLoader
 
 from ..database.schemas import (
-    TradeCreate, TradeUpdate, TradeResponse, TradeListResponse,
+    TradeCreate, TradeUpdate, TradeResponse,
     PortfolioMetrics, DashboardSummary
 )
 
@@ -56,7 +57,7 @@ class TradeService:
         """Get a single trade by ID."""
         return await self.repository.get_by_id(trade_id)
     
-    async def get_trades(
+    async def get_trades_raw(
         self,
         page: int = 1,
         page_size: int = 50,
@@ -67,11 +68,16 @@ class TradeService:
         end_date: Optional[datetime] = None,
         sort_by: str = "entry_date",
         sort_desc: bool = True
-    ) -> TradeListResponse:
-        """Get paginated trade list with filters."""
+    ) -> Dict[str, Any]:
+        """
+        Paginated trade list as a plain dict in TradeListResponse shape.
+        
+        Rows come straight from the database columns, so they are not
+        re-validated through TradeResponse.
+        """
         status_enum = TradeStatus(status) if status else None
         
-        trades, total = await self.repository.get_all(
+        trades, total = await self.repository.get_all_rows(
             page=page,
             page_size=page_size,
             ticker=ticker,
@@ -83,15 +89,13 @@ class TradeService:
             sort_desc=sort_desc
         )
         
-        total_pages = math.ceil(total / page_size) if total > 0 else 1
-        
-        return TradeListResponse(
-            trades=[TradeResponse.model_validate(t) for t in trades],
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+        return {
+            "trades": trades,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": math.ceil(total / page_size) if total > 0 else 1
+        }
     
     async def update_trade(self, trade_id: int, trade_data: TradeUpdate) -> Optional[Trade]:
         """Update an existing trade."""
@@ -122,8 +126,8 @@ class TradeService:
         """
         stats = await self.repository.get_statistics()
         
-        # Get open positions
-        open_positions = await self.repository.get_open_positions()
+        # Get open positions (only the columns needed for valuation)
+        open_positions = await self.repository.get_open_position_rows()
         
         # === Mark-to-Market Calculation ===
         unrealized_pnl = 0.0
@@ -148,14 +152,16 @@ class TradeService:
                 if 'close' in price_data and not price_data['close'].empty:
                     close_prices = price_data['close']
                     
-                    # Calculate unrealized P&L for each open position
-                    for trade in open_positions:
-                        if trade.ticker in close_prices.columns:
-                            current_price = close_prices[trade.ticker].iloc[-1]  # Latest close
-                            position_value = current_price * trade.quantity
-                            entry_value = trade.entry_price * trade.quantity
-                            unrealized_pnl += position_value - entry_value
-                            current_market_value += position_value
+                    # Latest close per ticker, aligned to all positions at once;
+                    # positions without a price are left out of both totals
+                    latest = close_prices.ffill().iloc[-1]
+                    current_prices = latest.reindex([t.ticker for t in open_positions]).to_numpy(dtype=np.float64)
+                    quantities = np.fromiter((t.quantity for t in open_positions), np.float64, len(open_positions))
+                    entry_prices = np.fromiter((t.entry_price for t in open_positions), np.float64, len(open_positions))
+                    
+                    position_values = current_prices * quantities
+                    unrealized_pnl = float(np.nansum(position_values - entry_prices * quantities))
+                    current_market_value = float(np.nansum(position_values))
             except Exception as e:
                 # If price fetch fails, fall back to entry price calculation
                 print(f"Warning: Failed to fetch live prices for MtM: {e}")
@@ -210,8 +216,7 @@ class TradeService:
         recent_trades = await self.repository.get_recent(limit=10)
         
         # Open positions count
-        open_positions_list = await self.repository.get_open_positions()
-        open_positions_count = len(open_positions_list)
+        open_positions_count = await self.repository.count_open_positions()
         
         # Period P&L
         now = datetime.utcnow()
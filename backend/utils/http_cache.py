@@ -0,0 +1,142 @@
+"""
+HTTP Cache Utilities
+====================
+ETag and pre-compression helpers for endpoints that dashboards poll.
+"""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+from typing import Any, FrozenSet, Optional, Tuple
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # br variants are skipped without it
+    brotli = None
+
+
+# Dashboards poll these endpoints; let browsers reuse a response briefly
+POLL_CACHE_CONTROL = "max-age=5, must-revalidate"
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values (or raw bytes) a response is derived from."""
+    data = b"\x1f".join(p if isinstance(p, bytes) else str(p).encode() for p in parts)
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str = POLL_CACHE_CONTROL
+) -> Optional[Response]:
+    """
+    Attach caching headers, returning a 304 if the client already has this ETag.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: ignore W/ prefixes on either side
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if "*" in candidates or etag.removeprefix("W/") in candidates:
+            return Response(status_code=304, headers=headers)
+    
+    response.headers.update(headers)
+    return None
+
+
+# Bodies smaller than this aren't worth a Content-Encoding
+MIN_COMPRESS_SIZE = 512
+
+
+@dataclass(frozen=True)
+class EncodedBody:
+    """A cached response body and its pre-compressed variants."""
+    identity: bytes
+    gzip: Optional[bytes] = None
+    br: Optional[bytes] = None
+
+
+def precompress(body: bytes) -> EncodedBody:
+    """
+    Compress a cacheable body once, when it is cached.
+    
+    Serving it is then a byte copy of whichever variant the client accepts,
+    rather than compressing on every response.
+    """
+    if len(body) < MIN_COMPRESS_SIZE:
+        return EncodedBody(body)
+    return EncodedBody(
+        body,
+        gzip=gzip.compress(body, compresslevel=6),
+        br=brotli.compress(body, quality=5) if brotli is not None else None
+    )
+
+
+def _accepted_encodings(header: str) -> FrozenSet[str]:
+    """Codings listed in Accept-Encoding, minus any refused with q=0."""
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        q = params.strip().removeprefix("q=").strip() if params else "1"
+        try:
+            refused = float(q) == 0
+        except ValueError:
+            refused = False
+        if coding.strip() and not refused:
+            accepted.add(coding.strip().lower())
+    if "*" in accepted:
+        accepted.update(("br", "gzip"))
+    return frozenset(accepted)
+
+
+def _select_variant(request: Request, body: EncodedBody) -> Tuple[bytes, Optional[str]]:
+    """The smallest variant of a body the client accepts, and its Content-Encoding."""
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    if body.br is not None and "br" in accepted:
+        return body.br, "br"
+    if body.gzip is not None and "gzip" in accepted:
+        return body.gzip, "gzip"
+    return body.identity, None
+
+
+def encoded_response(
+    request: Request,
+    body: EncodedBody,
+    media_type: str = "application/json"
+) -> Response:
+    """Response carrying the smallest variant of a body the client accepts."""
+    content, encoding = _select_variant(request, body)
+    
+    response = Response(content=content, media_type=media_type)
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+
+def encoded_head_response(
+    request: Request,
+    body: Optional[EncodedBody],
+    media_type: str = "application/json"
+) -> Response:
+    """
+    Bodiless response with the headers encoded_response would send for GET.
+    
+    Content-Length and Content-Encoding describe the variant GET would pick;
+    without an encoded body (None) neither is known, so both are omitted.
+    """
+    response = Response(media_type=media_type)
+    del response.headers["Content-Length"]
+    response.headers["Vary"] = "Accept-Encoding"
+    if body is not None:
+        content, encoding = _select_variant(request, body)
+        response.headers["Content-Length"] = str(len(content))
+        if encoding:
+            response.headers["Content-Encoding"] = encoding
+    return response
@@ -0,0 +1,76 @@
+"""
+Universe Cache
+==============
+Process-level TTL cache for stock universe lookups, shared by the routers
+so one invalidation reaches every endpoint.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from fastapi.concurrency import run_in_threadpool
+
+# Add parent path for strategy imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from strategy.stock_universe import get_universe_info, get_universe_tickers
+
+try:
+    from backend.config import settings
+except ImportError:
+    from config import settings
+
+
+# key -> (expires_at, value)
+_UNIVERSE_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+# Bumped on every invalidation, so caches derived from these lookups
+# (e.g. pre-encoded listings) can tell they are stale
+_generation = 0
+
+
+async def cached_universe(key: str, getter: Callable[[], Any]) -> Any:
+    """
+    Return a universe lookup, calling the (blocking) getter in the
+    threadpool only when the cached value is missing or expired.
+    Lookups that raise are not cached.
+    """
+    entry = _UNIVERSE_CACHE.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    value = await run_in_threadpool(getter)
+    _UNIVERSE_CACHE[key] = (time.monotonic() + settings.UNIVERSE_CACHE_TTL_SECONDS, value)
+    return value
+
+
+async def get_cached_universe_tickers(universe: str) -> List[str]:
+    """Tickers for a universe, loaded in the threadpool on first use."""
+    return await cached_universe(f"tickers:{universe}", lambda: get_universe_tickers(universe))
+
+
+async def get_cached_universe_info(universe: str) -> Dict[str, Any]:
+    """Universe metadata, loaded in the threadpool on first use."""
+    return await cached_universe(f"info:{universe}", lambda: get_universe_info(universe))
+
+
+def prime_universe_info(universes: Iterable[Dict[str, Any]]) -> None:
+    """Cache metadata already loaded in bulk (e.g. from list_universes)."""
+    expires_at = time.monotonic() + settings.UNIVERSE_CACHE_TTL_SECONDS
+    _UNIVERSE_CACHE.update((f"info:{u['key']}", (expires_at, u)) for u in universes)
+
+
+def universe_cache_generation() -> int:
+    """Number of invalidations so far."""
+    return _generation
+
+
+def clear_universe_cache() -> int:
+    """Drop every cached lookup. Returns the number of entries cleared."""
+    global _generation
+    cleared = len(_UNIVERSE_CACHE)
+    _UNIVERSE_CACHE.clear()
+    _generation += 1
+    return cleared
@@ -14,6 +14,7 @@ import os
 import time
 import functools
 import logging
+import threading
 from pathlib import Path
 from strategy.config import CONFIG
 
@@ -64,6 +65,17 @@ def retry_api_call(config: RetryConfig = None):
 
 _default_retry = RetryConfig(max_retries=3, base_delay=1.0, max_delay=30.0)
 
+# Serializes read-merge-write of the shared parquet cache across threads
+_CACHE_WRITE_LOCK = threading.Lock()
+
+
+def _cache_mtime_ns(path: Path) -> Optional[int]:
+    """Modification time of a cache file, or None if it does not exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 class FastDataLoader:
     """
     Fast data loader with support for Tiingo (Primary) and yfinance fallback.
@@ -124,10 +136,12 @@ class FastDataLoader:
 
         cached_close = pd.DataFrame()
         cached_open = pd.DataFrame()
+        loaded_mtime = None
 
         # 1. Load existing cache
         if use_cache and cache_file_close.exists() and cache_file_open.exists():
             try:
+                loaded_mtime = _cache_mtime_ns(cache_file_close)
                 cached_close = pd.read_parquet(cache_file_close)
                 cached_open = pd.read_parquet(cache_file_open)
                 if self.verbose:
@@ -349,8 +363,14 @@ class FastDataLoader:
                 print(f"Saving updated cache to {self.cache_dir}")
 
             try:
-                final_close.to_parquet(cache_file_close)
-                final_open.to_parquet(cache_file_open)
+                with _CACHE_WRITE_LOCK:
+                    # Another fetch may have saved since we read the cache:
+                    # keep our fresh values and fill in everything else from disk
+                    if _cache_mtime_ns(cache_file_close) not in (None, loaded_mtime) and cache_file_open.exists():
+                        final_close = final_close.combine_first(pd.read_parquet(cache_file_close))
+                        final_open = final_open.combine_first(pd.read_parquet(cache_file_open))
+                    final_close.to_parquet(cache_file_close)
+                    final_open.to_parquet(cache_file_open)
             except Exception as e:
                 print(f"Error saving cache: {e}")
 
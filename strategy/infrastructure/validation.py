@@ -72,10 +72,13 @@ def sharpe_ratio_std(returns: pd.Series) -> float:
         
     skew = ss.skew(returns)
     kurt = ss.kurtosis(returns)  # Excess kurtosis
-    
+    return _sharpe_ratio_std(n, skew, kurt)
+
+
+def _sharpe_ratio_std(n: int, skew: float, kurt: float) -> float:
+    """SR estimator std from precomputed sample size, skewness and excess kurtosis."""
     # Formula from Bailey & Lopez de Prado (2012)
-    sr_std = np.sqrt((1 + (0.5 * skew**2) - ((kurt - 3) / 4)) / (n - 1))
-    return sr_std
+    return np.sqrt((1 + (0.5 * skew**2) - ((kurt - 3) / 4)) / (n - 1))
 
 
 def probabilistic_sharpe_ratio(
@@ -167,13 +170,26 @@ def deflated_sharpe_ratio(
         return 0.0
     
     skew = ss.skew(returns)
-    kurt = ss.kurtosis(returns) + 3  # Convert to excess kurtosis
+    kurt = ss.kurtosis(returns)
+    return _deflated_sharpe_ratio(observed_sr, n_trials, n_samples, skew, kurt, var_trials)
+
+
+def _deflated_sharpe_ratio(
+    observed_sr: float,
+    n_trials: int,
+    n_samples: int,
+    skew: float,
+    excess_kurt: float,
+    var_trials: float = 1.0
+) -> float:
+    """DSR from precomputed moments of at least 10 returns."""
+    kurt = excess_kurt + 3  # Convert excess kurtosis to raw kurtosis
     
     # Expected maximum SR given number of trials
     sr_expected = expected_max_sharpe_ratio(n_trials, var_trials, skew, kurt)
     
     # Standard deviation of SR estimator
-    sr_std = sharpe_ratio_std(returns)
+    sr_std = _sharpe_ratio_std(n_samples, skew, excess_kurt)
     
     # DSR = Probability that observed SR beats expected max from luck
     if sr_std == 0 or np.isinf(sr_std):
@@ -209,18 +225,24 @@ def validate_backtest(
     else:
         excess_returns = returns
     
+    # Moments are computed once on the raw array; every metric below derives
+    # from them instead of re-reducing the Series per helper
+    arr = np.asarray(excess_returns, dtype=np.float64)
+    n = len(arr)
+    std = np.nanstd(arr, ddof=1) if n > 1 else np.nan  # NaN-skipping, like Series.std
+    # Distribution metrics are shift-invariant, so the excess returns' moments
+    # are also those of the raw returns
+    skew = ss.skew(arr)
+    kurt = ss.kurtosis(arr)
+    
     # Core metrics
-    sr = estimated_sharpe_ratio(excess_returns)
-    sr_annual = annualized_sharpe_ratio(excess_returns)
-    sr_std = sharpe_ratio_std(excess_returns)
+    sr = 0.0 if std == 0 else np.nanmean(arr) / std
+    sr_annual = sr * np.sqrt(252)
+    sr_std = _sharpe_ratio_std(n, skew, kurt) if n >= 2 else np.inf
     
     # Probabilistic metrics
     psr = probabilistic_sharpe_ratio(sr, benchmark_sr, sr_std)
-    dsr = deflated_sharpe_ratio(sr, n_trials, excess_returns)
-    
-    # Distribution metrics
-    skew = ss.skew(returns)
-    kurt = ss.kurtosis(returns)
+    dsr = _deflated_sharpe_ratio(sr, n_trials, n, skew, kurt) if n >= 10 else 0.0
     
     return {
         'sharpe_ratio': sr,
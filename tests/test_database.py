@@ -288,6 +288,38 @@ class TestDatabaseIndexes:
         # Check expected indexes exist
         assert 'ix_trades_ticker_date' in index_names or any('ticker' in str(idx) for idx in indexes)
     
+    def test_trade_filter_sort_indexes(self, test_db_session):
+        """Each get_all filter column is paired with entry_date for sorting."""
+        from backend.database.models import Trade
+        
+        columns_by_name = {
+            idx.name: [col.name for col in idx.columns]
+            for idx in Trade.__table__.indexes
+        }
+        
+        assert columns_by_name['ix_trades_status_entry_date'] == ['status', 'entry_date']
+        assert columns_by_name['ix_trades_strategy_entry_date'] == ['strategy_name', 'entry_date']
+        assert columns_by_name['ix_trades_exit_date_status'] == ['exit_date', 'status']
+    
+    def test_snapshot_brin_index_postgres_only(self, test_db_session):
+        """BRIN snapshot_date index compiles for PostgreSQL and is skipped on SQLite."""
+        from sqlalchemy import inspect
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+        from backend.database.models import PortfolioSnapshot
+        
+        brin = next(
+            idx for idx in PortfolioSnapshot.__table__.indexes
+            if idx.name == 'ix_snapshot_date_brin'
+        )
+        ddl = str(CreateIndex(brin).compile(dialect=postgresql.dialect()))
+        
+        assert 'USING brin' in ddl
+        assert 'pages_per_range = 32' in ddl
+        
+        sqlite_indexes = inspect(test_db_session.get_bind()).get_indexes('portfolio_snapshots')
+        assert 'ix_snapshot_date_brin' not in [idx['name'] for idx in sqlite_indexes]
+    
     def test_snapshot_indexes_exist(self, test_db_session):
         """PortfolioSnapshot table has expected indexes."""
         from backend.database.models import PortfolioSnapshot
@@ -140,9 +140,213 @@ class TestDataRefresh:
         data = response.json()
         assert data["status"] == "started"
     
+    def test_full_refresh_counts_cached_universe(self, data_client, monkeypatch):
+        """A full-universe refresh reports the cached universe's size."""
+        import time
+        from backend.utils import universe_cache
+        from strategy import fast_data_loader
+        
+        class StubLoader:
+            def __init__(self, **kwargs):
+                pass
+            
+            def fetch_prices_fast(self, tickers, use_cache=True):
+                return {}
+        
+        monkeypatch.setattr(fast_data_loader, "FastDataLoader", StubLoader)
+        monkeypatch.setattr(universe_cache, "_UNIVERSE_CACHE", {
+            "screener_universe": (time.monotonic() + 60, ["SPY", "QQQ", "BHP.AX"])
+        })
+        
+        response = data_client.post("/api/data/refresh", json={"tickers": None, "force": False})
+        assert response.status_code == 200
+        assert response.json()["tickers_refreshed"] == 3
+    
+    def test_full_refresh_counts_cold_universe(self, data_client, monkeypatch):
+        """With a cold cache the universe is loaded (once) to report its size."""
+        from backend.utils import universe_cache
+        from strategy import fast_data_loader, stock_universe
+        
+        class StubLoader:
+            def __init__(self, **kwargs):
+                pass
+            
+            def fetch_prices_fast(self, tickers, use_cache=True):
+                return {}
+        
+        calls = []
+        monkeypatch.setattr(fast_data_loader, "FastDataLoader", StubLoader)
+        monkeypatch.setattr(stock_universe, "get_screener_universe", lambda: calls.append(1) or ["SPY", "BHP.AX"])
+        monkeypatch.setattr(universe_cache, "_UNIVERSE_CACHE", {})
+        
+        response = data_client.post("/api/data/refresh", json={"tickers": None, "force": False})
+        assert response.json()["tickers_refreshed"] == 2
+        assert calls == [1]
+    
+    def test_refresh_logs_only_successful_sources(self, data_client, monkeypatch, caplog):
+        """Completion is logged per source that succeeded, and failure when none did."""
+        import logging
+        from strategy import fast_data_loader
+        
+        failing = set()
+        
+        class StubLoader:
+            def __init__(self, **kwargs):
+                pass
+            
+            def fetch_prices_fast(self, tickers, use_cache=True):
+                if set(tickers) & failing:
+                    raise RuntimeError("source unavailable")
+                return {}
+        
+        monkeypatch.setattr(fast_data_loader, "FastDataLoader", StubLoader)
+        request_data = {"tickers": ["SPY", "QQQ", "BHP.AX"], "force": False}
+        
+        with caplog.at_level(logging.INFO, logger="backend.routers.data"):
+            failing.add("BHP.AX")
+            data_client.post("/api/data/refresh", json=request_data)
+            assert "Data refresh complete! 2 tickers (Tiingo)" in caplog.text
+            assert "yFinance refresh failed" in caplog.text
+            
+            caplog.clear()
+            failing.add("SPY")
+            data_client.post("/api/data/refresh", json=request_data)
+            assert "Data refresh complete" not in caplog.text
+            assert "Data refresh failed: no source refreshed" in caplog.text
+    
     def test_refresh_empty_tickers_uses_universe(self, data_client):
         """Empty tickers list refreshes entire universe."""
         request_data = {"tickers": None, "force": False}
         response = data_client.post("/api/data/refresh", json=request_data)
         # May succeed or fail based on module availability
         assert response.status_code in [200, 500]
+
+
+class TestCacheStats:
+    """Tests for cache directory statistics."""
+    
+    def test_cache_stats_memoized_on_dir_mtime(self, tmp_path, monkeypatch):
+        """Stats are recomputed only when the cache directory changes."""
+        import os
+        from backend.routers import data as data_router
+        
+        monkeypatch.setattr(data_router, "CACHE_DIR", tmp_path)
+        data_router._scan_cache_dir.cache_clear()
+        
+        (tmp_path / "SPY_tiingo.parquet").write_bytes(b"x" * 1024)
+        (tmp_path / "notes.txt").write_text("ignored")
+        
+        stats = data_router._get_cache_stats_sync()
+        assert stats["total_files"] == 1
+        assert stats["files"][0]["name"] == "SPY_tiingo.parquet"
+        assert data_router._get_cache_stats_sync() is stats
+        
+        (tmp_path / "BHP.AX.parquet").write_bytes(b"x")
+        st = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        
+        stats = data_router._get_cache_stats_sync()
+        assert stats["total_files"] == 2
+        assert stats["us_count"] == 1
+        assert stats["asx_count"] == 1
+    
+    def test_cache_stats_track_in_place_rewrites(self, tmp_path, monkeypatch):
+        """Rewriting a shared price panel refreshes stats though the directory is unchanged."""
+        import os
+        from backend.routers import data as data_router
+        
+        monkeypatch.setattr(data_router, "CACHE_DIR", tmp_path)
+        data_router._scan_cache_dir.cache_clear()
+        
+        panel = tmp_path / "us_prices_close.parquet"
+        panel.write_bytes(b"x" * 1024)
+        dir_st = os.stat(tmp_path)
+        assert data_router._get_cache_stats_sync()["files"][0]["size_mb"] == 0.0
+        
+        panel.write_bytes(b"x" * 1024 * 1024)
+        os.utime(tmp_path, ns=(dir_st.st_atime_ns, dir_st.st_mtime_ns))
+        
+        assert data_router._get_cache_stats_sync()["files"][0]["size_mb"] == 1.0
+    
+    def test_cache_stats_missing_dir(self, tmp_path, monkeypatch):
+        """Missing cache directory yields empty stats."""
+        from backend.routers import data as data_router
+        
+        monkeypatch.setattr(data_router, "CACHE_DIR", tmp_path / "missing")
+        
+        stats = data_router._get_cache_stats_sync()
+        assert stats["total_files"] == 0
+        assert stats["newest_cache"] is None
+
+
+class TestDataSourceSplit:
+    """Tests for ticker routing helpers."""
+    
+    def test_split_matches_get_data_source(self):
+        """Single-pass split agrees with per-ticker classification."""
+        from backend.routers.data import get_data_source, split_by_data_source
+        
+        tickers = ["SPY", "BHP.AX", "^VIX", "GLD", "BTC-USD", "CBA.AX"]
+        tiingo, yfinance = split_by_data_source(tickers)
+        
+        assert tiingo == [t for t in tickers if get_data_source(t) == "tiingo"]
+        assert yfinance == [t for t in tickers if get_data_source(t) == "yfinance"]
+        assert yfinance == ["BHP.AX", "^VIX", "BTC-USD", "CBA.AX"]
+
+
+class TestUniverseCache:
+    """Tests for the process-level universe cache."""
+    
+    def test_universe_lookups_cached_until_invalidated(self, monkeypatch):
+        """Repeated /universe calls reuse cached lists until invalidated."""
+        from backend.main import app
+        from backend.utils import universe_cache
+        from strategy import stock_universe
+        
+        calls = []
+        
+        def fake_screener():
+            calls.append("screener")
+            return ["SPY", "BHP.AX"]
+        
+        monkeypatch.setattr(stock_universe, "get_screener_universe", fake_screener)
+        monkeypatch.setattr(universe_cache, "_UNIVERSE_CACHE", {})
+        client = TestClient(app)
+        
+        first = client.get("/api/data/universe").json()
+        second = client.get("/api/data/universe").json()
+        
+        assert first == second
+        assert first["by_source"]["yfinance"]["tickers"] == ["BHP.AX"]
+        assert calls == ["screener"]
+        
+        response = client.post("/api/data/universe/invalidate")
+        assert response.status_code == 200
+        assert response.json()["entries_cleared"] > 0
+        
+        client.get("/api/data/universe")
+        assert calls == ["screener", "screener"]
+
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation on polled endpoints."""
+    
+    @pytest.mark.parametrize("path", ["/api/data/status", "/api/data/universe"])
+    def test_matching_etag_returns_304(self, path):
+        """A matching If-None-Match short-circuits with an empty 304."""
+        from backend.main import app
+        client = TestClient(app)
+        
+        response = client.get(path)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        assert "max-age=5" in response.headers["cache-control"]
+        
+        cached = client.get(path, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+        
+        stale = client.get(path, headers={"If-None-Match": 'W/"0000000000000000"'})
+        assert stale.status_code == 200
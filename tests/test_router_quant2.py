@@ -0,0 +1,314 @@
+"""
+Tests for Quant 2.0 Router
+==========================
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def quant2_client(monkeypatch):
+    """Test client with fresh quant2 caches and no live price fetches."""
+    from backend.main import app
+    from backend.routers import quant2
+    from backend.utils import universe_cache
+    
+    monkeypatch.setattr(universe_cache, "_UNIVERSE_CACHE", {})
+    monkeypatch.setattr(quant2, "_live_cache", {})
+    monkeypatch.setattr(quant2, "_live_inflight", {})
+    monkeypatch.setattr(quant2, "_response_cache", {})
+    monkeypatch.setattr(quant2, "_calculate_live_sync", lambda tickers: None)
+    return TestClient(app)
+
+
+class TestUniverseCache:
+    """Tests for cached universe lookups."""
+    
+    def test_universe_lookups_cached_across_requests(self, quant2_client, monkeypatch):
+        """Each universe is resolved once per process, not once per request."""
+        from backend.utils import universe_cache
+        
+        calls = []
+        real_get_tickers = universe_cache.get_universe_tickers
+        
+        def counting_get_tickers(universe):
+            calls.append(universe)
+            return real_get_tickers(universe)
+        
+        monkeypatch.setattr(universe_cache, "get_universe_tickers", counting_get_tickers)
+        
+        for _ in range(3):
+            response = quant2_client.get("/api/quant2/residual-momentum?universe=US_ETFS")
+            assert response.status_code == 200
+        quant2_client.get("/api/quant2/validate-universe?universe=US_ETFS")
+        
+        assert calls == ["US_ETFS"]
+    
+    def test_universes_summary_uses_cache(self, quant2_client):
+        """Summary lists every registered universe and fills the cache."""
+        from backend.utils import universe_cache
+        from strategy.stock_universe import UNIVERSE_REGISTRY
+        
+        response = quant2_client.get("/api/quant2/universes-summary")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["total_universes"] == len(UNIVERSE_REGISTRY)
+        available = [u["key"] for u in data["universes"] if u["status"] == "available"]
+        assert {f"tickers:{key}" for key in available} <= set(universe_cache._UNIVERSE_CACHE)
+
+    
+    def test_universes_summary_isolates_failures(self, quant2_client, monkeypatch):
+        """A universe whose lookup raises is reported as an error on its own."""
+        from backend.utils import universe_cache
+        
+        real_get_tickers = universe_cache.get_universe_tickers
+        
+        def flaky_get_tickers(universe):
+            if universe == "ASX200":
+                raise RuntimeError("source unavailable")
+            return real_get_tickers(universe)
+        
+        monkeypatch.setattr(universe_cache, "get_universe_tickers", flaky_get_tickers)
+        
+        data = quant2_client.get("/api/quant2/universes-summary").json()
+        status = {u["key"]: u["status"] for u in data["universes"]}
+        
+        assert status["ASX200"] == "error"
+        assert status["US_ETFS"] == "available"
+
+
+class TestResponseCache:
+    """Tests for pre-serialized /residual-momentum bodies."""
+    
+    def test_body_reused_and_revalidated(self, quant2_client, monkeypatch):
+        """Repeat requests reuse the serialized body; a matching ETag gets a 304."""
+        from backend.routers import quant2
+        
+        url = "/api/quant2/residual-momentum?universe=US_ETFS&top_n=5"
+        first = quant2_client.get(url)
+        assert first.status_code == 200
+        assert first.headers["content-type"] == "application/json"
+        
+        def fail_build(*args):
+            raise AssertionError("body should come from the cache")
+        
+        monkeypatch.setattr(quant2, "_build_residual_momentum_body", fail_build)
+        
+        second = quant2_client.get(url)
+        assert second.content == first.content
+        assert second.headers["etag"] == first.headers["etag"]
+        
+        revalidated = quant2_client.get(url, headers={"If-None-Match": first.headers["etag"]})
+        assert revalidated.status_code == 304
+        assert first.headers["cache-control"] == "public, max-age=3600"
+    
+    def test_universes_summary_etag_ignores_timestamp(self, quant2_client):
+        """The summary ETag is stable across calls and revalidates to a 304."""
+        first = quant2_client.get("/api/quant2/universes-summary")
+        second = quant2_client.get("/api/quant2/universes-summary")
+        
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["cache-control"] == "public, max-age=3600"
+        assert quant2_client.get(
+            "/api/quant2/universes-summary", headers={"If-None-Match": first.headers["etag"]}
+        ).status_code == 304
+
+
+class TestLiveResultCache:
+    """Tests for the per-day live residual momentum cache."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, monkeypatch):
+        from backend.routers import quant2
+        
+        monkeypatch.setattr(quant2, "_live_cache", {})
+        monkeypatch.setattr(quant2, "_live_inflight", {})
+    
+    async def test_concurrent_requests_share_one_computation(self, monkeypatch):
+        """Simultaneous calls for a universe trigger exactly one computation."""
+        import asyncio
+        import time
+        from backend.routers import quant2
+        
+        calls = []
+        
+        def slow_calculation(tickers):
+            calls.append(tickers)
+            time.sleep(0.05)
+            return {"rankings": [], "top_score": 0, "avg_r_squared": 0, "stocks_ranked": 0, "source": "live"}
+        
+        monkeypatch.setattr(quant2, "_calculate_live_sync", slow_calculation)
+        
+        results = await asyncio.gather(
+            *(quant2.calculate_residual_momentum_live(["SPY"], "SPX500") for _ in range(10))
+        )
+        
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+        assert await quant2.calculate_residual_momentum_live(["SPY"], "SPX500") is results[0]
+        assert len(calls) == 1
+    
+    async def test_failed_calculation_not_cached(self, monkeypatch):
+        """A failed (None) live calculation is retried on the next call."""
+        from backend.routers import quant2
+        
+        calls = []
+        
+        def failing_calculation(tickers):
+            calls.append(tickers)
+            return None
+        
+        monkeypatch.setattr(quant2, "_calculate_live_sync", failing_calculation)
+        
+        assert await quant2.calculate_residual_momentum_live(["SPY"], "SPX500") is None
+        assert await quant2.calculate_residual_momentum_live(["SPY"], "SPX500") is None
+        assert len(calls) == 2
+
+
+class TestMockRankings:
+    """Tests for the mock residual momentum generator."""
+    
+    def test_rankings_sorted_and_complete(self):
+        """Rows carry every StockRanking field, ranked by descending score."""
+        from backend.routers.quant2 import StockRanking, _ranking_rows, generate_mock_residual_momentum
+        
+        tickers = [f"T{i}" for i in range(40)]
+        result = generate_mock_residual_momentum(tickers, "SPX500")
+        rankings = _ranking_rows(result["columns"], slice(None))
+        
+        assert [r["rank"] for r in rankings] == list(range(1, 41))
+        assert sorted(r["ticker"] for r in rankings) == sorted(tickers)
+        assert [r["score"] for r in rankings] == sorted((r["score"] for r in rankings), reverse=True)
+        assert result["top_score"] == rankings[0]["score"]
+        assert all(StockRanking.model_validate(r) for r in rankings)
+    
+    def test_seeding_is_stable_and_local(self):
+        """Output depends only on the universe key and leaves np.random alone."""
+        import numpy as np
+        from backend.routers.quant2 import generate_mock_residual_momentum
+        
+        tickers = [f"T{i}" for i in range(10)]
+        np.random.seed(123)
+        expected_draw = np.random.rand()
+        np.random.seed(123)
+        
+        first = generate_mock_residual_momentum(tickers, "SPX500")
+        
+        assert np.random.rand() == expected_draw
+        again = generate_mock_residual_momentum(tickers, "SPX500")
+        other = generate_mock_residual_momentum(tickers, "ASX200")
+        np.testing.assert_array_equal(again["columns"]["score"], first["columns"]["score"])
+        assert not np.array_equal(other["columns"]["score"], first["columns"]["score"])
+    
+    def test_endpoint_serializes_constructed_rankings(self, quant2_client):
+        """Unvalidated ranking models still serialize every field."""
+        response = quant2_client.get("/api/quant2/residual-momentum?universe=US_ETFS&top_n=5&include_bottom=true")
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert len(data["rankings"]) == 5
+        assert set(data["rankings"][0]) == {
+            "rank", "ticker", "score", "r_squared", "beta_mkt", "beta_smb", "beta_hml", "residual_vol"
+        }
+        assert data["bottom_rankings"][-1]["rank"] == data["stocks_ranked"]
+    
+    @pytest.mark.parametrize("sort_by,sort_order", [
+        ("score", "desc"), ("score", "asc"), ("r_squared", "desc"), ("ticker", "desc"), ("unknown", "asc")
+    ])
+    def test_all_filters_and_sorts(self, quant2_client, sort_by, sort_order):
+        """Score bounds and sorting on /residual-momentum/all match a plain Python filter and sort."""
+        from backend.routers.quant2 import _ranking_rows, generate_mock_residual_momentum
+        from strategy.stock_universe import get_universe_tickers
+        
+        expected = _ranking_rows(
+            generate_mock_residual_momentum(get_universe_tickers("US_ETFS"), "US_ETFS")["columns"],
+            slice(None)
+        )
+        expected = [r for r in expected if -0.5 <= r["score"] <= 0.5]
+        expected.sort(key=lambda r: r.get(sort_by, r["score"]), reverse=sort_order == "desc")
+        
+        response = quant2_client.get(
+            "/api/quant2/residual-momentum/all",
+            params={"universe": "US_ETFS", "sort_by": sort_by, "sort_order": sort_order,
+                    "min_score": -0.5, "max_score": 0.5}
+        )
+        assert response.status_code == 200
+        data = response.json()
+        
+        assert data["stocks"] == expected
+        assert data["filtered_stocks"] == len(expected)
+
+
+class TestMonthEndReturns:
+    """Tests for month-end return extraction."""
+    
+    def test_matches_monthly_last_pct_change(self):
+        """Month-end selection agrees with grouping by month and taking the last close."""
+        import numpy as np
+        import pandas as pd
+        from backend.routers.quant2 import _month_end_returns
+        
+        index = pd.bdate_range("2022-01-03", "2023-12-29")
+        rng = np.random.default_rng(7)
+        prices = pd.DataFrame(
+            100 * np.exp(np.cumsum(rng.normal(0, 0.01, (len(index), 4)), axis=0)),
+            index=index,
+            columns=["SPY", "QQQ", "GLD", "TLT"]
+        )
+        
+        expected = prices.groupby(prices.index.to_period("M")).last().pct_change().dropna()
+        returns = _month_end_returns(prices)
+        
+        np.testing.assert_allclose(returns.to_numpy(), expected.to_numpy())
+        assert list(returns.columns) == list(prices.columns)
+        assert returns.index[0] == pd.Timestamp("2022-02-28")
+        assert returns.index[-1] == pd.Timestamp("2023-12-31")
+
+
+class TestLiveRankings:
+    """Tests for assembling live calculation output."""
+    
+    def test_exposures_aligned_to_score_order(self, monkeypatch):
+        """Exposures follow the score order and fall back to defaults when missing."""
+        from types import SimpleNamespace
+        import numpy as np
+        import pandas as pd
+        from backend.routers import quant2
+        
+        index = pd.bdate_range("2022-01-03", "2022-06-30")
+        prices = pd.DataFrame(100.0, index=index, columns=["AAA", "BBB", "CCC"])
+        
+        class FakeLoader:
+            def get_prices(self, tickers, start_date, end_date):
+                return prices
+        
+        class FakeModel:
+            def __init__(self, **kwargs):
+                pass
+            
+            def calculate_scores(self, returns):
+                return SimpleNamespace(
+                    scores=pd.DataFrame([[0.5, 1.2345, np.nan]], columns=["AAA", "BBB", "CCC"]),
+                    factor_exposures={
+                        "AAA": {"r_squared": 0.61, "beta_mkt": 0.9, "beta_smb": 0.2, "beta_hml": -0.1, "residual_std": 0.2},
+                        "BBB": {"r_squared": 0.33},
+                    },
+                    metadata={}
+                )
+        
+        monkeypatch.setattr(quant2, "ResidualMomentum", FakeModel)
+        monkeypatch.setattr(quant2, "DataLoader", FakeLoader)
+        
+        result = quant2._calculate_live_sync(["AAA", "BBB", "CCC"])
+        rows = quant2._ranking_rows(result["columns"], range(result["stocks_ranked"]))
+        
+        assert rows == [
+            {"rank": 1, "ticker": "BBB", "score": 1.23, "r_squared": 0.33, "beta_mkt": 1.0,
+             "beta_smb": 0.0, "beta_hml": 0.0, "residual_vol": 15.0},
+            {"rank": 2, "ticker": "AAA", "score": 0.5, "r_squared": 0.61, "beta_mkt": 0.9,
+             "beta_smb": 0.2, "beta_hml": -0.1, "residual_vol": 20.0},
+        ]
+        assert result["top_score"] == 1.23
+        assert result["source"] == "live"
@@ -0,0 +1,149 @@
+"""
+Scanner Router Tests
+====================
+Unit tests for the scanner API endpoints.
+"""
+
+import json
+import pytest
+from fastapi.testclient import TestClient
+
+
+class TestScanResults:
+    """Tests for scan persistence and result revalidation."""
+    
+    @pytest.fixture
+    def scanner_client(self, tmp_path, monkeypatch):
+        """Test client with auth bypassed, fresh scan state and a temp working dir."""
+        from backend.main import app
+        from backend.auth import get_current_user
+        from backend.routers import scanner
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(scanner, "scan_state", scanner.ScanState())
+        monkeypatch.setattr(scanner, "_file_cache", None)
+        app.dependency_overrides[get_current_user] = lambda: {"sub": "test"}
+        yield TestClient(app)
+        app.dependency_overrides.pop(get_current_user, None)
+    
+    def test_scan_writes_file_and_results_revalidate(self, scanner_client, tmp_path):
+        """A completed scan is saved to disk and /results answers 304 for a matching ETag."""
+        response = scanner_client.post(
+            "/api/scanner/run",
+            json={"custom_tickers": ["SPY", "QQQ", "GLD"]}
+        )
+        assert response.status_code == 200
+        assert scanner_client.get("/api/scanner/status").json()["status"] == "completed"
+        
+        saved = json.loads((tmp_path / "dashboard" / "scan_results.json").read_text())
+        assert saved["tickers_scanned"] == 3
+        assert sorted(s["ticker"] for s in saved["stocks"]) == ["GLD", "QQQ", "SPY"]
+        assert [s["score"] for s in saved["stocks"]] == sorted((s["score"] for s in saved["stocks"]), reverse=True)
+        for stock in saved["stocks"]:
+            assert 5.0 <= stock["price"] <= 500.0
+            assert stock["signal"] in {"BUY", "WATCH", "HOLD"}
+            assert 100000 <= stock["volume"] <= 1000000
+        
+        first = scanner_client.get("/api/scanner/results?limit=2")
+        assert first.status_code == 200
+        assert len(first.json()["results"]) == 2
+        etag = first.headers["etag"]
+        
+        cached = scanner_client.get("/api/scanner/results?limit=2", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        
+        other_query = scanner_client.get("/api/scanner/results?limit=3", headers={"If-None-Match": etag})
+        assert other_query.status_code == 200
+
+    
+    def test_results_filter_and_sort(self, scanner_client):
+        """Signal and min_score filters apply before sorting by score and limiting."""
+        import asyncio
+        from backend.routers import scanner
+        
+        stocks = [
+            {"ticker": "AAA", "signal": "BUY", "score": 75.0},
+            {"ticker": "BBB", "signal": "watch", "score": 55.0},
+            {"ticker": "CCC", "signal": "BUY", "score": 91.5},
+            {"ticker": "DDD", "signal": "HOLD", "score": 10.0},
+            {"ticker": "EEE", "signal": "WATCH", "score": 45.0},
+        ]
+        asyncio.run(scanner.scan_state.publish({"generated_at": "now", "stocks": stocks}, 'W/"test"'))
+        
+        by_score = scanner_client.get("/api/scanner/results?limit=3").json()["results"]
+        assert [s["ticker"] for s in by_score] == ["CCC", "AAA", "BBB"]
+        
+        watch = scanner_client.get("/api/scanner/results?signal=watch&min_score=50").json()["results"]
+        assert [s["ticker"] for s in watch] == ["BBB"]
+    
+    def test_scan_file_cached_until_changed(self, scanner_client, tmp_path, monkeypatch):
+        """The results file is re-parsed only when its mtime or size changes."""
+        import os
+        import orjson
+        from types import SimpleNamespace
+        from backend.routers import scanner
+        
+        scan_file = tmp_path / "dashboard" / "scan_results.json"
+        scan_file.parent.mkdir()
+        scan_file.write_text(json.dumps({"generated_at": "t1", "stocks": [{"ticker": "SPY", "score": 80}]}))
+        
+        parses = []
+        
+        def counting_loads(content):
+            parses.append(content)
+            return orjson.loads(content)
+        
+        monkeypatch.setattr(
+            scanner, "orjson",
+            SimpleNamespace(loads=counting_loads, dumps=orjson.dumps, OPT_INDENT_2=orjson.OPT_INDENT_2)
+        )
+        
+        for _ in range(3):
+            data = scanner_client.get("/api/scanner/quallamaggie").json()
+            assert data["generated_at"] == "t1"
+        assert len(parses) == 1
+        assert "retrieved_at" not in scanner._file_cache[3]
+        
+        scan_file.write_text(json.dumps({"generated_at": "t2", "stocks": []}))
+        st = scan_file.stat()
+        os.utime(scan_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        
+        assert scanner_client.get("/api/scanner/results").json()["generated_at"] == "t2"
+        assert len(parses) == 2
+    
+    def test_failed_scan_keeps_previous_results(self, scanner_client, monkeypatch):
+        """A failing scan updates the status but leaves the last results and ETag in place."""
+        from backend.routers import scanner
+        
+        scanner_client.post("/api/scanner/run", json={"custom_tickers": ["SPY", "QQQ"]})
+        etag = scanner_client.get("/api/scanner/results").headers["etag"]
+        
+        def broken_universe():
+            raise RuntimeError("data source down")
+        
+        monkeypatch.setattr(scanner, "get_sp500_tickers", broken_universe)
+        scanner_client.post("/api/scanner/run", json={"universe": "sp500"})
+        
+        status = scanner_client.get("/api/scanner/status").json()
+        assert status["status"] == "failed: data source down"
+        assert status["has_results"] is True
+        assert scanner_client.get(
+            "/api/scanner/results", headers={"If-None-Match": etag}
+        ).status_code == 304
+    
+    def test_scan_runs_on_dedicated_pool(self, scanner_client, monkeypatch):
+        """Scan logic executes on the scanner's own executor threads."""
+        import threading
+        from backend.routers import scanner
+        
+        thread_names = []
+        
+        def recording_universe():
+            thread_names.append(threading.current_thread().name)
+            return ["SPY", "QQQ"]
+        
+        monkeypatch.setattr(scanner, "get_sp500_tickers", recording_universe)
+        
+        scanner_client.post("/api/scanner/run", json={"universe": "sp500"})
+        
+        assert thread_names and thread_names[0].startswith("scan")
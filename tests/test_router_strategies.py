@@ -8,6 +8,7 @@ import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch, MagicMock
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 
 class TestStrategyListAndDetails:
@@ -54,6 +55,23 @@ class TestStrategyListAndDetails:
         
         strategy_names = [s["name"] for s in data]
         assert "Regime_Detection" in strategy_names or "HRP" in strategy_names
+    
+    def test_list_strategies_revalidates(self, strategies_client):
+        """The static listing carries an ETag and answers a match with 304."""
+        first = strategies_client.get("/api/strategies/")
+        etag = first.headers["etag"]
+        
+        second = strategies_client.get("/api/strategies/", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+    
+    def test_list_strategies_matches_catalog(self, strategies_client):
+        """The precomputed listing mirrors the catalog in order."""
+        from backend.routers.strategies import STRATEGY_CATALOG
+        
+        response = strategies_client.get("/api/strategies/")
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [{"name": name, **info} for name, info in STRATEGY_CATALOG.items()]
 
 
 class TestBacktestExecution:
@@ -139,3 +157,341 @@ class TestStrategyComparison:
         assert "comparison" in data
         assert "generated_at" in data
         assert "strategies_compared" in data
+
+
+class TestResultsFiles:
+    """Tests for backtest results persisted under reports/."""
+    
+    @pytest.fixture
+    def strategies_client(self, tmp_path, monkeypatch):
+        """Test client running in an empty directory with no in-memory results."""
+        from backend.main import app
+        from backend.routers import strategies
+        
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(strategies, "backtest_registry", strategies.BacktestRegistry())
+        monkeypatch.setattr(strategies, "_inflight_backtests", {})
+        monkeypatch.setattr(strategies, "_results_bodies", {})
+        strategies._load_results_cached.cache_clear()
+        
+        # Run pipelines in-process so patched pipeline classes apply
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(strategies, "_pipeline_pool", pool)
+        yield TestClient(app)
+        pool.shutdown()
+    
+    def test_saved_results_served_from_disk(self, strategies_client, tmp_path):
+        """Details, results and comparison all read the saved JSON file."""
+        import json
+        
+        saved = {"strategy_name": "HRP", "final_value": 125000.0, "metrics": {"cagr": 0.12, "sharpe_ratio": 1.1}}
+        (tmp_path / "reports").mkdir()
+        (tmp_path / "reports" / "HRP_results.json").write_text(json.dumps(saved))
+        (tmp_path / "reports" / "OLMAR_results.json").write_text("{not json")
+        
+        details = strategies_client.get("/api/strategies/HRP").json()
+        assert details["has_results"] is True
+        assert details["last_results"] == saved
+        
+        assert strategies_client.get("/api/strategies/HRP/results").json() == saved
+        assert strategies_client.get("/api/strategies/OLMAR/results").status_code == 404
+        
+        comparison = strategies_client.get("/api/strategies/compare/all").json()
+        assert comparison["strategies_compared"] == 1
+        assert comparison["comparison"][0]["strategy"] == "HRP"
+        assert comparison["comparison"][0]["cagr"] == 0.12
+    
+    def test_comparison_streams_all_strategies_with_metrics(self, strategies_client):
+        """Streamed comparison is valid JSON covering in-memory results in catalog order."""
+        import numpy as np
+        from backend.routers import strategies
+        
+        registry = strategies.backtest_registry
+        registry.complete("OLMAR", {"final_value": np.float64(1.5e5), "metrics": {"sharpe_ratio": np.float32(0.75)}})
+        registry.complete("Momentum", {"final_value": 110000.0, "metrics": {"cagr": 0.08}})
+        registry.complete("HRP", {"status": "no metrics"})
+        
+        response = strategies_client.get("/api/strategies/compare/all")
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        
+        assert [c["strategy"] for c in data["comparison"]] == ["Momentum", "OLMAR"]
+        assert data["comparison"][0]["sharpe_ratio"] == "N/A"
+        assert data["comparison"][1] == {
+            "strategy": "OLMAR", "category": "Mean Reversion", "final_value": 150000.0,
+            "total_return": "N/A", "cagr": "N/A", "sharpe_ratio": 0.75
+        }
+        assert data["strategies_compared"] == 2
+        assert "generated_at" in data
+    
+    def test_completed_backtest_written_to_disk(self, strategies_client, tmp_path, monkeypatch):
+        """A finished backtest is saved as JSON and served back."""
+        import json
+        from types import SimpleNamespace
+        import numpy as np
+        from backend.routers import strategies
+        
+        class FakePipeline:
+            def __init__(self, config):
+                pass
+            
+            def run(self, strategy_name, optimization_method):
+                return SimpleNamespace(
+                    report=SimpleNamespace(metrics=SimpleNamespace(to_dict=lambda: {"cagr": np.float64(0.2)})),
+                    allocation=SimpleNamespace(weights=SimpleNamespace(to_dict=lambda: {"SPY": 1.0})),
+                    final_value=120000.0,
+                    execution_time_seconds=0.1
+                )
+        
+        monkeypatch.setattr(strategies, "TradingPipeline", FakePipeline)
+        
+        response = strategies_client.post("/api/strategies/run", json={"strategy_name": "Momentum"})
+        assert response.status_code == 200
+        
+        saved = json.loads((tmp_path / "reports" / "Momentum_results.json").read_text())
+        assert saved["metrics"] == {"cagr": 0.2}
+        assert saved["weights"] == {"SPY": 1.0}
+        assert strategies_client.get("/api/strategies/Momentum/status").json()["status"] == "completed"
+        assert strategies._inflight_backtests == {}
+    
+    def test_pipeline_holds_a_backtest_slot(self, strategies_client, monkeypatch):
+        """Pipelines only run while holding one of the limited backtest slots."""
+        import asyncio
+        from types import SimpleNamespace
+        from backend.routers import strategies
+        
+        slot_held = []
+        
+        class SlotCheckingPipeline:
+            def __init__(self, config):
+                pass
+            
+            def run(self, strategy_name, optimization_method):
+                slot_held.append(strategies._pipeline_slots.locked())
+                return SimpleNamespace(
+                    report=SimpleNamespace(metrics=SimpleNamespace(to_dict=dict)),
+                    allocation=SimpleNamespace(weights=SimpleNamespace(to_dict=dict)),
+                    final_value=100000.0,
+                    execution_time_seconds=0.0
+                )
+        
+        monkeypatch.setattr(strategies, "TradingPipeline", SlotCheckingPipeline)
+        monkeypatch.setattr(strategies, "_pipeline_slots", asyncio.Semaphore(1))
+        
+        strategies_client.post("/api/strategies/run", json={"strategy_name": "OLMAR"})
+        
+        assert slot_held == [True]
+        assert not strategies._pipeline_slots.locked()
+        assert strategies.backtest_registry.get("OLMAR").status == "completed"
+    
+    def test_running_backtest_not_duplicated(self, strategies_client, monkeypatch):
+        """A second run request while one is in flight returns the running backtest."""
+        import time
+        from backend.routers import strategies
+        
+        def fail_if_started(config):
+            raise AssertionError("pipeline should not start")
+        
+        monkeypatch.setattr(strategies, "TradingPipeline", fail_if_started)
+        strategies._inflight_backtests["HRP"] = ("HRP_20260101_000000", time.monotonic())
+        
+        response = strategies_client.post("/api/strategies/run", json={"strategy_name": "HRP"})
+        assert response.json()["backtest_id"] == "HRP_20260101_000000"
+        assert response.json()["status"] == "running"
+        
+        # A stale entry no longer blocks a fresh run
+        strategies._inflight_backtests["HRP"] = ("HRP_20260101_000000", time.monotonic() - strategies.BACKTEST_INFLIGHT_TTL_SECONDS)
+        response = strategies_client.post("/api/strategies/run", json={"strategy_name": "HRP"})
+        assert response.json()["status"] == "started"
+        assert response.json()["backtest_id"] != "HRP_20260101_000000"
+        assert strategies.backtest_registry.get("HRP").status.startswith("failed")
+        assert strategies._inflight_backtests == {}
+    
+    def test_results_file_parsed_once_until_changed(self, strategies_client, tmp_path, monkeypatch):
+        """Repeat reads reuse the parsed file; rewriting it is picked up."""
+        import json
+        import os
+        from backend.routers import strategies
+        
+        results_file = tmp_path / "reports" / "HRP_results.json"
+        results_file.parent.mkdir()
+        results_file.write_text(json.dumps({"metrics": {"cagr": 0.1}}))
+        
+        parses = []
+        real_read = strategies._read_json_sync
+        
+        def counting_read(path):
+            parses.append(path)
+            return real_read(path)
+        
+        monkeypatch.setattr(strategies, "_read_json_sync", counting_read)
+        
+        for _ in range(3):
+            assert strategies_client.get("/api/strategies/HRP/results").json() == {"metrics": {"cagr": 0.1}}
+        strategies_client.get("/api/strategies/compare/all")
+        assert len(parses) == 1
+        
+        results_file.write_text(json.dumps({"metrics": {"cagr": 0.25}}))
+        st = results_file.stat()
+        os.utime(results_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert strategies_client.get("/api/strategies/HRP/results").json() == {"metrics": {"cagr": 0.25}}
+        assert len(parses) == 2
+    
+    def test_legacy_nan_results_still_readable(self, strategies_client, tmp_path):
+        """Files written with stdlib NaN literals still load."""
+        (tmp_path / "reports").mkdir()
+        (tmp_path / "reports" / "Stat_Arb_results.json").write_text('{"metrics": {"sharpe_ratio": NaN}}')
+        
+        response = strategies_client.get("/api/strategies/Stat_Arb")
+        assert response.json()["has_results"] is True
+    
+    def test_run_unavailable_without_pipeline(self, strategies_client, monkeypatch):
+        """Without the pipeline package, runs are refused instead of failing in the background."""
+        from backend.routers import strategies
+        
+        monkeypatch.setattr(strategies, "TradingPipeline", None)
+        
+        response = strategies_client.post("/api/strategies/run", json={"strategy_name": "HRP"})
+        assert response.status_code == 503
+        assert strategies.backtest_registry.get("HRP").status == "not_started"
+    
+    def test_pipeline_job_picklable(self):
+        """The pipeline job pickles by reference for the process pool."""
+        import pickle
+        from backend.routers import strategies
+        
+        assert pickle.loads(pickle.dumps(strategies._run_pipeline_job)) is strategies._run_pipeline_job
+    
+    def test_results_revalidate_until_rewritten(self, strategies_client, tmp_path):
+        """Results ETags follow the saved file and the in-memory run."""
+        import json
+        import os
+        from backend.routers import strategies
+        
+        results_file = tmp_path / "reports" / "HRP_results.json"
+        results_file.parent.mkdir()
+        results_file.write_text(json.dumps({"metrics": {"cagr": 0.1}}))
+        
+        etag = strategies_client.get("/api/strategies/HRP/results").headers["etag"]
+        assert strategies_client.get("/api/strategies/HRP/results", headers={"If-None-Match": etag}).status_code == 304
+        
+        results_file.write_text(json.dumps({"metrics": {"cagr": 0.25}}))
+        st = results_file.stat()
+        os.utime(results_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        refreshed = strategies_client.get("/api/strategies/HRP/results", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["metrics"]["cagr"] == 0.25
+        
+        strategies.backtest_registry.complete("HRP", {"backtest_id": "HRP_1", "completed_at": "t1", "metrics": {}})
+        etag = strategies_client.get("/api/strategies/HRP/results").headers["etag"]
+        assert strategies_client.get("/api/strategies/HRP/results", headers={"If-None-Match": etag}).status_code == 304
+        
+        strategies.backtest_registry.complete("HRP", {"backtest_id": "HRP_2", "completed_at": "t2", "metrics": {}})
+        assert strategies_client.get("/api/strategies/HRP/results", headers={"If-None-Match": etag}).status_code == 200
+    
+    def test_results_served_precompressed(self, strategies_client, tmp_path, monkeypatch):
+        """Results are compressed once per ETag and sent in the encoding the client accepts."""
+        import json
+        from backend.routers import strategies
+        
+        saved = {"metrics": {"cagr": 0.1}, "weights": {f"T{i}": 0.01 for i in range(100)}}
+        (tmp_path / "reports").mkdir()
+        (tmp_path / "reports" / "HRP_results.json").write_text(json.dumps(saved))
+        
+        gzipped = strategies_client.get("/api/strategies/HRP/results", headers={"Accept-Encoding": "gzip"})
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in gzipped.headers["vary"]
+        assert gzipped.json() == saved
+        
+        def fail_encode(results):
+            raise AssertionError("body should come from the cache")
+        
+        monkeypatch.setattr(strategies, "_encode_results_sync", fail_encode)
+        plain = strategies_client.get("/api/strategies/HRP/results", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.json() == saved
+        assert plain.headers["etag"] == gzipped.headers["etag"]
+    
+    def test_head_reports_file_metadata(self, strategies_client, tmp_path):
+        """HEAD answers from a stat of the results file, matching GET's headers."""
+        import json
+        
+        results_file = tmp_path / "reports" / "HRP_results.json"
+        results_file.parent.mkdir()
+        results_file.write_text(json.dumps({"metrics": {"cagr": 0.1}, "weights": {f"T{i}": 0.01 for i in range(100)}}, indent=2))
+        
+        # Not yet encoded: the served length is unknown
+        head = strategies_client.head("/api/strategies/HRP/results")
+        assert head.status_code == 200
+        assert head.content == b""
+        assert "content-length" not in head.headers
+        assert "last-modified" in head.headers
+        
+        get = strategies_client.get("/api/strategies/HRP/results", headers={"Accept-Encoding": "gzip"})
+        head = strategies_client.head("/api/strategies/HRP/results", headers={"Accept-Encoding": "gzip"})
+        for header in ("etag", "vary", "cache-control", "content-encoding", "content-length"):
+            assert head.headers[header] == get.headers[header]
+        assert int(head.headers["content-length"]) != results_file.stat().st_size
+        
+        assert strategies_client.head("/api/strategies/HRP/results", headers={"If-None-Match": head.headers["etag"]}).status_code == 304
+        assert strategies_client.head("/api/strategies/OLMAR/results").status_code == 404
+    
+    def test_head_matches_in_memory_results(self, strategies_client):
+        """HEAD on in-memory results reports the length GET serves, not an empty body."""
+        from backend.routers.strategies import backtest_registry
+        
+        backtest_registry.complete("HRP", {"backtest_id": "bt-1", "completed_at": "2024-01-01T00:00:00", "metrics": {}})
+        get = strategies_client.get("/api/strategies/HRP/results", headers={"Accept-Encoding": "identity"})
+        head = strategies_client.head("/api/strategies/HRP/results", headers={"Accept-Encoding": "identity"})
+        
+        assert head.headers["content-length"] == str(len(get.content)) != "0"
+        assert head.headers["etag"] == get.headers["etag"]
+        assert head.headers["vary"] == get.headers["vary"]
+
+
+class TestBacktestRegistry:
+    """Tests for the copy-on-write backtest registry."""
+    
+    def test_updates_publish_new_snapshots(self):
+        """Readers holding a snapshot never see later updates."""
+        from backend.routers.strategies import BacktestRegistry
+        
+        registry = BacktestRegistry()
+        assert registry.get("HRP").status == "not_started"
+        assert registry.get("HRP").results is None
+        
+        registry.complete("HRP", {"metrics": {"cagr": 0.1}})
+        before = registry.snapshot
+        registry.set_status("HRP", "running")
+        registry.set_status("OLMAR", "failed: boom")
+        
+        assert before["HRP"].status == "completed"
+        assert "OLMAR" not in before
+        assert registry.get("HRP").status == "running"
+        assert registry.get("HRP").results == {"metrics": {"cagr": 0.1}}
+        assert registry.get("OLMAR").results is None
+        with pytest.raises(TypeError):
+            registry.snapshot["SPY"] = registry.get("SPY")
+
+
+class TestResponseTimestamps:
+    """Tests for the cached response timestamp."""
+    
+    def test_now_iso_refreshes_once_per_second(self, monkeypatch):
+        """Calls within a second share one formatted timestamp."""
+        from types import SimpleNamespace
+        from backend.routers import strategies
+        
+        clock = [1000.0]
+        monkeypatch.setattr(strategies, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+        monkeypatch.setattr(strategies, "_now_iso_cache", {"ts": "", "t": float("-inf")})
+        
+        first = strategies._now_iso()
+        assert datetime.fromisoformat(first)
+        
+        clock[0] += 0.5
+        strategies._now_iso_cache["ts"] = "sentinel"
+        assert strategies._now_iso() == "sentinel"
+        
+        clock[0] += 0.5
+        assert strategies._now_iso() != "sentinel"
@@ -68,6 +68,15 @@ class TestTradesCRUD:
         response = await async_client.get("/api/trades/?page=1&page_size=10")
         assert response.status_code == 200
 
+    async def test_stream_open_positions(self, async_client):
+        """Open positions stream as newline-delimited JSON."""
+        import json
+        response = await async_client.get("/api/trades/positions/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        for line in response.text.splitlines():
+            assert json.loads(line)["status"] == "OPEN"
+
     async def test_get_trade_not_found(self, async_client):
         """Get non-existent trade returns 404."""
         response = await async_client.get("/api/trades/99999")
@@ -84,6 +93,48 @@ class TestTradesCRUD:
         assert response.status_code == 404
 
 
+class TestRequestTransaction:
+    """Tests for the request-scoped trade transaction."""
+
+    async def test_failed_commit_returns_server_error(self, tmp_path):
+        """A commit failure reaches the client as a 5xx, not after a 201."""
+        from httpx import ASGITransport, AsyncClient
+        from sqlalchemy.exc import OperationalError
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+        from backend.main import app
+        from backend.database.connection import Base, REQUEST_TRANSACTION_KEY, get_async_db
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        async def failing_commit_db():
+            async with session_factory() as session:
+                session.info[REQUEST_TRANSACTION_KEY] = True
+                async with session.begin():
+                    yield session
+                    raise OperationalError("COMMIT", {}, Exception("database is locked"))
+
+        app.dependency_overrides[get_async_db] = failing_commit_db
+        try:
+            transport = ASGITransport(app=app, raise_app_exceptions=False)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/trades/", json={
+                    "trade_id": "COMMIT-FAIL-1",
+                    "ticker": "SPY",
+                    "direction": "BUY",
+                    "quantity": 10,
+                    "entry_price": 450.0,
+                    "entry_date": "2024-01-15T10:00:00"
+                })
+        finally:
+            app.dependency_overrides.pop(get_async_db, None)
+            await engine.dispose()
+
+        assert response.status_code >= 500
+
+
 class TestTradeMetrics:
     """Tests for trade metrics endpoints."""
 
@@ -99,6 +150,43 @@ class TestTradeMetrics:
         response = await async_client.get("/api/trades/metrics/portfolio?initial_capital=50000")
         assert response.status_code == 200
 
+    async def test_portfolio_metrics_mark_to_market(self, monkeypatch):
+        """Open positions are valued at each ticker's latest available close."""
+        import pandas as pd
+        from types import SimpleNamespace
+        from backend.services import trade_service
+        
+        class StubRepository:
+            async def get_statistics(self):
+                return {
+                    'total_trades': 3, 'closed_trades': 0, 'winning_trades': 0, 'losing_trades': 0,
+                    'win_rate': 0, 'total_pnl': 0, 'avg_pnl': 0, 'best_trade': 0, 'worst_trade': 0,
+                }
+            
+            async def get_open_position_rows(self):
+                return [
+                    SimpleNamespace(ticker="SPY", quantity=10, entry_price=400.0),
+                    SimpleNamespace(ticker="QQQ", quantity=5, entry_price=300.0),
+                    SimpleNamespace(ticker="DELISTED", quantity=1, entry_price=50.0),
+                ]
+        
+        class StubLoader:
+            def __init__(self, **kwargs):
+                pass
+            
+            def fetch_prices_fast(self, tickers, use_cache=True):
+                # QQQ has no close on the last day; its previous close applies
+                return {'close': pd.DataFrame({"SPY": [410.0, 420.0], "QQQ": [310.0, None]})}
+        
+        monkeypatch.setattr(trade_service, "FastDataLoader", StubLoader)
+        service = trade_service.TradeService(db=None)
+        service.repository = StubRepository()
+        
+        metrics = await service.get_portfolio_metrics(initial_capital=10000.0)
+        assert metrics.invested_value == 10 * 420.0 + 5 * 310.0
+        assert metrics.unrealized_pnl == 10 * 20.0 + 5 * 10.0
+        assert metrics.total_value == 10000.0 + 250.0
+
     async def test_get_dashboard_summary(self, async_client):
         """Get dashboard summary."""
         response = await async_client.get("/api/trades/metrics/dashboard")
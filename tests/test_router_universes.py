@@ -0,0 +1,115 @@
+"""
+Tests for Universes Router
+==========================
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def universes_client(monkeypatch):
+    """Test client with fresh universe caches."""
+    from backend.main import app
+    from backend.routers import universes
+    from backend.utils import universe_cache
+    
+    monkeypatch.setattr(universe_cache, "_UNIVERSE_CACHE", {})
+    monkeypatch.setattr(universes, "_universe_list_cache", None)
+    monkeypatch.setattr(universes, "_universes_by_region", {})
+    monkeypatch.setattr(universes, "_universe_list_body", None)
+    monkeypatch.setattr(universes, "_universe_list_etag", None)
+    return TestClient(app)
+
+
+class TestUniverseCache:
+    """Tests for cached universe lookups."""
+    
+    def test_lookups_cached_across_requests(self, universes_client, monkeypatch):
+        """Universe metadata and tickers are resolved once per process."""
+        from backend.routers import universes
+        from backend.utils import universe_cache
+        
+        calls = []
+        
+        def counting(name, func):
+            def wrapper(*args):
+                calls.append((name, *args))
+                return func(*args)
+            return wrapper
+        
+        monkeypatch.setattr(universes, "list_universes", counting("list", universes.list_universes))
+        monkeypatch.setattr(universe_cache, "get_universe_info", counting("info", universe_cache.get_universe_info))
+        monkeypatch.setattr(universe_cache, "get_universe_tickers", counting("tickers", universe_cache.get_universe_tickers))
+        
+        for _ in range(2):
+            assert universes_client.get("/api/universes/").status_code == 200
+            assert universes_client.get("/api/universes/regions/US").status_code == 200
+            assert universes_client.get("/api/universes/CORE_ETFS").status_code == 200
+            assert universes_client.get("/api/universes/CORE_ETFS/tickers").status_code == 200
+        
+        # The listing also primes per-universe metadata
+        assert calls == [("list",), ("tickers", "CORE_ETFS")]
+    
+    def test_unknown_universe_not_cached(self, universes_client):
+        """Lookup failures surface as 404 and leave the caches untouched."""
+        from backend.utils import universe_cache
+        
+        for _ in range(2):
+            assert universes_client.get("/api/universes/NOT_A_UNIVERSE").status_code == 404
+            assert universes_client.get("/api/universes/NOT_A_UNIVERSE/tickers").status_code == 404
+        
+        assert universe_cache._UNIVERSE_CACHE == {}
+    
+    def test_data_invalidate_clears_universe_lookups(self, universes_client, monkeypatch):
+        """The data router's invalidate endpoint also drops this router's cached lookups."""
+        from backend.routers import universes
+        from backend.utils import universe_cache
+        
+        calls = []
+        real_list = universes.list_universes
+        monkeypatch.setattr(universes, "list_universes", lambda: calls.append("list") or real_list())
+        
+        assert universes_client.get("/api/universes/CORE_ETFS/tickers").status_code == 200
+        assert universes_client.get("/api/universes/").status_code == 200
+        assert "tickers:CORE_ETFS" in universe_cache._UNIVERSE_CACHE
+        
+        assert universes_client.post("/api/data/universe/invalidate").status_code == 200
+        assert universe_cache._UNIVERSE_CACHE == {}
+        
+        assert universes_client.get("/api/universes/").status_code == 200
+        assert calls == ["list", "list"]
+    
+    def test_region_index_matches_listing(self, universes_client):
+        """Region results are the listing's entries for that region, case-insensitively."""
+        listing = universes_client.get("/api/universes/").json()["universes"]
+        
+        for region in {u["region"] for u in listing}:
+            data = universes_client.get(f"/api/universes/regions/{region.lower()}").json()
+            assert data["region"] == region
+            assert [u["key"] for u in data["universes"]] == [u["key"] for u in listing if u["region"] == region]
+            assert data["count"] == len(data["universes"])
+        
+        assert universes_client.get("/api/universes/regions/MARS").status_code == 404
+    
+    def test_listing_body_matches_schema(self, universes_client):
+        """The pre-encoded listing is the validated UniverseListResponse."""
+        from backend.routers.universes import UniverseListResponse, list_universes
+        
+        universes = list_universes()
+        expected = UniverseListResponse(universes=universes, count=len(universes)).model_dump()
+        
+        response = universes_client.get("/api/universes/")
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == expected
+    
+    def test_listing_revalidates_with_etag(self, universes_client):
+        """A matching If-None-Match gets an empty 304."""
+        first = universes_client.get("/api/universes/")
+        etag = first.headers["etag"]
+        assert first.headers["cache-control"] == "max-age=30"
+        
+        second = universes_client.get("/api/universes/", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
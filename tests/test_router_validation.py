@@ -0,0 +1,168 @@
+"""
+Validation Router Tests
+=======================
+Unit tests for the strategy validation endpoints.
+"""
+
+import json
+import os
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from fastapi.testclient import TestClient
+
+
+def _touch(path):
+    """Advance a file's mtime, in case a rewrite landed within the clock's resolution."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestValidationCache:
+    """Tests for memoized per-strategy validation."""
+    
+    @pytest.fixture
+    def validation_client(self, tmp_path, monkeypatch):
+        """Test client reading reports from a temp dir, with an empty validation cache."""
+        from backend.main import app
+        from backend.routers import validation
+        
+        (tmp_path / "reports").mkdir()
+        monkeypatch.setattr(validation, "REPORTS_DIR", tmp_path / "reports")
+        monkeypatch.setattr(validation, "PRICE_PATH", tmp_path / "cache" / "prices.parquet")
+        monkeypatch.setattr(validation, "_VALIDATION_CACHE", {})
+        monkeypatch.setattr(validation, "_RESPONSE_CACHE", None)
+        monkeypatch.setattr(validation, "_PRICE_CACHE", None)
+        monkeypatch.setattr(validation, "_PANEL_CACHE", None)
+        
+        # Validate in-process so patched functions and paths apply
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(validation, "_validation_pool", pool)
+        yield TestClient(app)
+        pool.shutdown()
+    
+    def test_unchanged_results_not_revalidated(self, validation_client, tmp_path, monkeypatch):
+        """Repeat requests reuse validations until a results file changes."""
+        from backend.routers import validation
+        
+        calls = []
+        original = validation._validate_single_strategy
+        
+        def counting(name, *args):
+            calls.append(name)
+            return original(name, *args)
+        
+        monkeypatch.setattr(validation, "_validate_single_strategy", counting)
+        
+        reports = tmp_path / "reports"
+        (reports / "HRP_results.json").write_text(json.dumps({"metrics": {"Sharpe Ratio": "1.2"}}))
+        (reports / "OLMAR_results.json").write_text(json.dumps({"metrics": {"Sharpe Ratio": "0.8"}}))
+        
+        first = validation_client.get("/api/validation/from-reports")
+        assert first.status_code == 200
+        # Sent without re-validation, but still in the documented shape
+        assert validation.ValidationResponse.model_validate(first.json()).model_dump() == first.json()
+        assert sorted(calls) == ["HRP", "OLMAR"]
+        
+        second = validation_client.get("/api/validation/strategies")
+        assert second.json()["strategies"] == first.json()["strategies"]
+        assert len(calls) == 2
+        
+        (reports / "HRP_results.json").write_text(json.dumps({"metrics": {"Sharpe Ratio": "2.5"}}))
+        _touch(reports / "HRP_results.json")
+        third = validation_client.get("/api/validation/strategies").json()
+        assert calls[2:] == ["HRP"]
+        assert third["strategies"][0]["efficiency"]["sharpe"] == 2.5
+    
+    def test_unchanged_reports_not_reloaded(self, validation_client, tmp_path, monkeypatch):
+        """Repeat requests skip reading reports until a results file is added or changed."""
+        from backend.routers import validation
+        
+        reads = []
+        original = validation._load_json_sync
+        monkeypatch.setattr(validation, "_load_json_sync", lambda path: reads.append(path.name) or original(path))
+        
+        reports = tmp_path / "reports"
+        assert validation_client.get("/api/validation/from-reports").status_code == 404
+        (reports / "HRP_results.json").write_text(json.dumps({"metrics": {"Sharpe Ratio": "1.2"}}))
+        
+        first = validation_client.get("/api/validation/from-reports").json()
+        second = validation_client.get("/api/validation/strategies").json()
+        assert second["strategies"] == first["strategies"]
+        assert reads == ["HRP_results.json"]
+        
+        (reports / "OLMAR_results.json").write_text(json.dumps({"metrics": {"Sharpe Ratio": "0.8"}}))
+        third = validation_client.get("/api/validation/strategies").json()
+        assert [s["name"] for s in third["strategies"]] == ["HRP", "OLMAR"]
+        assert len(reads) == 3
+    
+    def test_price_data_read_once_until_changed(self, validation_client, tmp_path, monkeypatch):
+        """The price parquet is parsed once and re-read only when the file changes."""
+        import pandas as pd
+        from backend.routers import validation
+        
+        assert validation._load_price_data() is None
+        
+        price_path = tmp_path / "cache" / "prices.parquet"
+        price_path.parent.mkdir()
+        pd.DataFrame({"SPY": [1.0, 2.0]}, index=pd.date_range("2024-01-01", periods=2)).to_parquet(price_path)
+        
+        reads = []
+        original = validation.pq.read_table
+        monkeypatch.setattr(validation.pq, "read_table", lambda *args, **kwargs: reads.append(args) or original(*args, **kwargs))
+        
+        first = validation._load_price_data()
+        assert validation._load_price_data() is first
+        assert len(reads) == 1
+        
+        pd.DataFrame({"SPY": [3.0]}, index=pd.date_range("2024-01-01", periods=1)).to_parquet(price_path)
+        _touch(price_path)
+        assert validation._load_price_data()["SPY"].tolist() == [3.0]
+        assert len(reads) == 2
+    
+    def test_only_held_tickers_read(self, validation_client, tmp_path, monkeypatch):
+        """Validation reads just the held tickers' columns, skipping any not in the file."""
+        import numpy as np
+        import pandas as pd
+        from backend.routers import validation
+        
+        rng = np.random.default_rng(0)
+        index = pd.bdate_range("2023-01-01", periods=120)
+        panel = pd.DataFrame(
+            100 * np.cumprod(1 + rng.normal(0.001, 0.01, (120, 4)), axis=0),
+            index=index, columns=["SPY", "QQQ", "GLD", "TLT"]
+        )
+        price_path = tmp_path / "cache" / "prices.parquet"
+        price_path.parent.mkdir()
+        panel.to_parquet(price_path)
+        
+        data = {"weights": {"SPY": 0.6, "GLD": 0.3, "DELISTED": 0.1}, "metrics": {}}
+        (tmp_path / "reports" / "HRP_results.json").write_text(json.dumps(data))
+        
+        requested = []
+        original = validation.pq.read_table
+        monkeypatch.setattr(validation.pq, "read_table", lambda *args, **kwargs: requested.append(kwargs.get("columns")) or original(*args, **kwargs))
+        
+        strategies = validation_client.get("/api/validation/strategies").json()["strategies"]
+        assert requested == [["GLD", "SPY"]]
+        assert strategies == [validation._validate_single_strategy("HRP", data, validation._price_panel(panel), 1)]
+
+
+class TestCalculateDsr:
+    """Tests for the synthetic DSR calculator."""
+    
+    def test_same_inputs_computed_once(self):
+        """Repeat calls with the same inputs are served from the cache."""
+        from backend.main import app
+        from backend.routers import validation
+        
+        validation._calculate_dsr_cached.cache_clear()
+        client = TestClient(app)
+        params = {"sharpe_ratio": 1.5, "n_trials": 10, "n_samples": 500}
+        
+        first = client.post("/api/validation/calculate-dsr", params=params)
+        assert first.status_code == 200
+        assert isinstance(first.json()["is_significant"], bool)
+        
+        second = client.post("/api/validation/calculate-dsr", params={**params, "skewness": 0.5})
+        assert second.json() == first.json()
+        assert validation._calculate_dsr_cached.cache_info().hits == 1
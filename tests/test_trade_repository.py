@@ -0,0 +1,381 @@
+"""
+Trade Repository Tests
+======================
+Tests for TradeRepository query paths against an in-memory async SQLite DB.
+"""
+
+import pytest
+import pytest_asyncio
+from datetime import datetime
+
+
+# ============== Fixtures ==============
+
+@pytest_asyncio.fixture
+async def async_session_factory(tmp_path):
+    """Create an async session factory bound to a fresh SQLite database."""
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    from backend.database.connection import Base
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db_session(async_session_factory):
+    """Create an async session for a single test."""
+    async with async_session_factory() as session:
+        yield session
+
+
+def make_trade(trade_id: str, ticker: str = "SPY", direction: str = "BUY", entry_price: float = 100.0):
+    """Build a TradeCreate payload with sensible defaults."""
+    from backend.database.schemas import TradeCreate
+
+    return TradeCreate(
+        trade_id=trade_id,
+        ticker=ticker,
+        direction=direction,
+        quantity=10,
+        entry_price=entry_price,
+        entry_date=datetime(2024, 1, 15, 10, 0, 0),
+    )
+
+
+def make_orm_trade(trade_id: str):
+    """Build an ORM Trade for direct session use."""
+    from backend.database.models import Trade, TradeDirection
+
+    return Trade(
+        trade_id=trade_id,
+        ticker="SPY",
+        direction=TradeDirection.BUY,
+        quantity=1,
+        entry_price=100.0,
+        entry_date=datetime(2024, 1, 1),
+    )
+
+
+# ============== Create Tests ==============
+
+class TestBulkCreate:
+    """Tests for TradeRepository.bulk_create."""
+
+    async def test_bulk_create_returns_persisted_rows(self, async_db_session):
+        """Bulk create returns rows with server-generated fields populated."""
+        from backend.database.models import TradeStatus
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"BULK-{i}") for i in range(5)])
+
+        assert [t.trade_id for t in trades] == [f"BULK-{i}" for i in range(5)]
+        assert all(t.id is not None for t in trades)
+        assert all(t.created_at is not None for t in trades)
+        assert all(t.status == TradeStatus.OPEN for t in trades)
+
+    async def test_bulk_create_without_returning(self, async_db_session, monkeypatch):
+        """Chunked fallback preserves input order when RETURNING is unavailable."""
+        from backend.repositories import trade_repository
+        from backend.repositories.trade_repository import TradeRepository
+
+        dialect = async_db_session.get_bind().dialect
+        monkeypatch.setattr(dialect, "insert_executemany_returning", False)
+        monkeypatch.setattr(trade_repository, "MAX_ROWS_PER_INSERT", 2)
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"CHUNK-{i}") for i in range(5)])
+
+        assert [t.trade_id for t in trades] == [f"CHUNK-{i}" for i in range(5)]
+        assert all(t.id is not None for t in trades)
+
+    async def test_bulk_create_empty(self, async_db_session):
+        """Bulk create with no rows is a no-op."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        assert await repo.bulk_create([]) == []
+
+
+# ============== Aggregation Tests ==============
+
+class TestGetStatistics:
+    """Tests for TradeRepository.get_statistics."""
+
+    async def test_statistics_empty(self, async_db_session):
+        """Empty table yields zeroed statistics."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        stats = await TradeRepository(async_db_session).get_statistics()
+
+        assert stats['total_trades'] == 0
+        assert stats['closed_trades'] == 0
+        assert stats['win_rate'] == 0
+        assert stats['total_pnl'] == 0
+
+    async def test_statistics_mixed_trades(self, async_db_session):
+        """Aggregates only count closed trades towards P&L figures."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"STAT-{i}") for i in range(4)])
+        await repo.close_trade(trades[0].id, exit_price=110.0)  # +97
+        await repo.close_trade(trades[1].id, exit_price=95.0)   # -53
+        await repo.close_trade(trades[2].id, exit_price=120.0)  # +197
+
+        stats = await repo.get_statistics()
+
+        assert stats['total_trades'] == 4
+        assert stats['closed_trades'] == 3
+        assert stats['open_trades'] == 1
+        assert stats['winning_trades'] == 2
+        assert stats['losing_trades'] == 1
+        assert stats['win_rate'] == pytest.approx(200 / 3)
+        assert stats['total_pnl'] == pytest.approx(241.0)
+        assert stats['avg_pnl'] == pytest.approx(241.0 / 3)
+        assert stats['best_trade'] == pytest.approx(197.0)
+        assert stats['worst_trade'] == pytest.approx(-53.0)
+
+
+# ============== Read Tests ==============
+
+class TestGetAll:
+    """Tests for TradeRepository.get_all pagination."""
+
+    @pytest.mark.parametrize("window_count", [False, True])
+    async def test_pagination_total(self, async_db_session, monkeypatch, window_count):
+        """Both count strategies return the same page and total."""
+        from backend.repositories import trade_repository
+        from backend.repositories.trade_repository import TradeRepository
+
+        if window_count:
+            dialect_name = async_db_session.get_bind().dialect.name
+            monkeypatch.setattr(trade_repository, "WINDOW_COUNT_DIALECTS", (dialect_name,))
+
+        repo = TradeRepository(async_db_session)
+        await repo.bulk_create([make_trade(f"PAGE-{i}", entry_price=100 + i) for i in range(5)])
+
+        trades, total = await repo.get_all(page=1, page_size=2, sort_by="entry_price", sort_desc=False)
+        assert total == 5
+        assert [t.trade_id for t in trades] == ["PAGE-0", "PAGE-1"]
+
+        trades, total = await repo.get_all(page=10, page_size=2)
+        assert trades == []
+        assert total == 5
+
+        trades, total = await repo.get_all(ticker="QQQ")
+        assert trades == []
+        assert total == 0
+
+    async def test_filtered_total(self, async_db_session):
+        """Filters apply to both the page and the total count."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        await repo.bulk_create(
+            [make_trade(f"FILT-{i}", ticker=t) for i, t in enumerate(["SPY", "QQQ", "SPY", "SPY"])]
+        )
+
+        trades, total = await repo.get_all(page=1, page_size=2, ticker="spy")
+
+        assert total == 3
+        assert len(trades) == 2
+
+    @pytest.mark.parametrize("window_count", [False, True])
+    async def test_rows_match_validated_trades(self, async_db_session, monkeypatch, window_count):
+        """Raw row dicts serialize exactly like TradeResponse models of the same page."""
+        import orjson
+        from backend.database.schemas import TradeResponse
+        from backend.repositories import trade_repository
+        from backend.repositories.trade_repository import TradeRepository
+
+        if window_count:
+            dialect_name = async_db_session.get_bind().dialect.name
+            monkeypatch.setattr(trade_repository, "WINDOW_COUNT_DIALECTS", (dialect_name,))
+
+        repo = TradeRepository(async_db_session)
+        await repo.bulk_create([make_trade(f"RAW-{i}", entry_price=100 + i) for i in range(4)])
+
+        trades, total = await repo.get_all(page=1, page_size=3, sort_by="entry_price")
+        rows, rows_total = await repo.get_all_rows(page=1, page_size=3, sort_by="entry_price")
+
+        assert rows_total == total == 4
+        assert list(rows[0]) == list(TradeResponse.model_fields)
+        assert orjson.loads(orjson.dumps(rows)) == [
+            TradeResponse.model_validate(t).model_dump(mode="json") for t in trades
+        ]
+        assert all(t.ticker == "SPY" for t in trades)
+
+
+# ============== Update Tests ==============
+
+class TestCloseTrade:
+    """Tests for TradeRepository.close_trade."""
+
+    @pytest.mark.parametrize("direction,exit_price,expected_pnl,expected_pct", [
+        ("BUY", 110.0, 97.0, 10.0),
+        ("SELL", 90.0, 97.0, 10.0),
+        ("SELL", 105.0, -53.0, -5.0),
+    ])
+    async def test_close_computes_pnl(self, async_db_session, direction, exit_price, expected_pnl, expected_pct):
+        """P&L computed in SQL matches Trade.calculate_pnl."""
+        from backend.database.models import TradeStatus
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trade = await repo.create(make_trade("CLOSE-1", direction=direction))
+
+        closed = await repo.close_trade(trade.id, exit_price=exit_price, exit_date=datetime(2024, 2, 1))
+
+        assert closed.status == TradeStatus.CLOSED
+        assert closed.exit_price == exit_price
+        assert closed.exit_date == datetime(2024, 2, 1)
+        assert closed.pnl == pytest.approx(expected_pnl)
+        assert closed.pnl_percent == pytest.approx(expected_pct)
+
+    async def test_close_only_once(self, async_db_session):
+        """Closing an already-closed or missing trade returns None."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trade = await repo.create(make_trade("CLOSE-2"))
+
+        assert await repo.close_trade(trade.id, exit_price=110.0) is not None
+        assert await repo.close_trade(trade.id, exit_price=120.0) is None
+        assert await repo.close_trade(999, exit_price=120.0) is None
+
+
+class TestLookupAndDelete:
+    """Tests for batched lookups and single-statement deletes."""
+
+    async def test_get_by_ids(self, async_db_session):
+        """get_by_ids returns existing trades keyed by ID and skips unknown IDs."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"IDS-{i}") for i in range(3)])
+        ids = [t.id for t in trades]
+
+        found = await repo.get_by_ids(ids + [999])
+
+        assert sorted(found) == sorted(ids)
+        assert found[ids[1]].trade_id == "IDS-1"
+        assert await repo.get_by_ids([]) == {}
+
+    async def test_delete_reports_affected_row(self, async_db_session):
+        """delete returns True once, then False for the missing row."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trade = await repo.create(make_trade("DEL-1"))
+
+        assert await repo.delete(trade.id) is True
+        assert await repo.delete(trade.id) is False
+        assert await repo.get_by_trade_id("DEL-1") is None
+
+
+class TestColumnProjection:
+    """Tests for read paths that load only the columns callers use."""
+
+    async def test_recent_trades_serialize_without_extra_columns(self, async_db_session):
+        """Projected list reads still validate into TradeResponse."""
+        from sqlalchemy import inspect
+        from backend.database.schemas import TradeResponse
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        await repo.bulk_create([make_trade(f"PROJ-{i}") for i in range(3)])
+        async_db_session.expunge_all()
+
+        recent = await repo.get_recent(limit=2)
+
+        assert len(recent) == 2
+        assert 'knowledge_timestamp' in inspect(recent[0]).unloaded
+        assert [TradeResponse.model_validate(t).trade_id for t in recent]
+
+    async def test_open_position_rows_and_count(self, async_db_session):
+        """Open-position helpers agree with the full ORM query."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"OPEN-{i}", ticker=t) for i, t in enumerate(["SPY", "QQQ", "GLD"])])
+        await repo.close_trade(trades[0].id, exit_price=110.0)
+
+        rows = await repo.get_open_position_rows()
+
+        assert sorted(r.ticker for r in rows) == ["GLD", "QQQ"]
+        assert all(r.quantity == 10 and r.entry_price == 100.0 for r in rows)
+        assert await repo.count_open_positions() == len(await repo.get_open_positions()) == 2
+
+
+class TestCommitDurability:
+    """Tests for relaxed commit durability on insert paths."""
+
+    async def test_sqlite_insert_uses_normal_synchronous(self, async_db_session):
+        """Inserts switch the SQLite connection to synchronous=NORMAL."""
+        from sqlalchemy import text
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        await repo.create(make_trade("DURABLE-1"))
+
+        level = await async_db_session.scalar(text("PRAGMA synchronous"))
+        assert level == 1  # NORMAL
+
+    async def test_insert_inside_open_transaction(self, async_db_session):
+        """The pragma is skipped rather than failing mid-transaction."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        async_db_session.add(make_orm_trade("PENDING-1"))
+        await async_db_session.flush()
+
+        trades = await repo.bulk_create([make_trade("DURABLE-2")])
+        assert trades[0].id is not None
+
+
+
+class TestStreamOpenPositions:
+    """Tests for server-side cursor streaming."""
+
+    async def test_stream_matches_buffered(self, async_db_session):
+        """Streaming yields the same open positions as the buffered query."""
+        from backend.repositories.trade_repository import TradeRepository
+
+        repo = TradeRepository(async_db_session)
+        trades = await repo.bulk_create([make_trade(f"STREAM-{i}") for i in range(4)])
+        await repo.close_trade(trades[0].id, exit_price=110.0)
+
+        streamed = [t.trade_id async for t in repo.stream_open_positions()]
+        buffered = [t.trade_id for t in await repo.get_open_positions()]
+
+        assert sorted(streamed) == sorted(buffered) == ["STREAM-1", "STREAM-2", "STREAM-3"]
+
+
+class TestRequestTransaction:
+    """Tests for repositories sharing a request-scoped transaction."""
+
+    async def test_writes_defer_to_request_commit(self, async_session_factory):
+        """Repository writes inside a request transaction commit once, at the end."""
+        from sqlalchemy import func, select
+        from backend.database.connection import REQUEST_TRANSACTION_KEY
+        from backend.database.models import Trade
+        from backend.repositories.trade_repository import TradeRepository
+
+        async with async_session_factory() as session:
+            session.info[REQUEST_TRANSACTION_KEY] = True
+            async with session.begin():
+                repo = TradeRepository(session)
+                trade = await repo.create(make_trade("REQ-1"))
+                await repo.close_trade(trade.id, exit_price=110.0)
+
+                async with async_session_factory() as other:
+                    assert await other.scalar(select(func.count(Trade.id))) == 0
+
+        async with async_session_factory() as other:
+            assert await other.scalar(select(func.count(Trade.id))) == 1